@@ -0,0 +1,65 @@
+"""
+Memory use of hydrated models. Part of the Contextualise (https://contextualise.dev) project.
+
+Builds topics (each with a base name, an occurrence and an attribute) the way 'TopicStore' does when it reads them from
+the database and reports the memory that is allocated per topic, as measured by 'tracemalloc'.
+
+    $ python benchmarks/model_memory.py --topics 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+
+from topicdb.models.attribute import Attribute
+from topicdb.models.basename import BaseName
+from topicdb.models.datatype import DataType
+from topicdb.models.language import Language
+from topicdb.models.occurrence import Occurrence
+from topicdb.models.topic import Topic
+
+INSTANCE_OFS = ["person", "place", "event", "organisation", "thing"]
+
+
+def build(count: int) -> list[Topic]:
+    # The strings are built from scratch (like values read from a database row) rather than being shared literals
+    result = []
+    for index in range(count):
+        identifier = f"topic-{index}"
+        topic = Topic.restore(identifier, "".join(INSTANCE_OFS[index % len(INSTANCE_OFS)]))
+        topic.add_base_name(BaseName.restore(f"Topic {index}", "".join("*"), Language.ENG, f"basename-{index}"))
+        topic.add_occurrence(
+            Occurrence.restore(f"occurrence-{index}", "".join("note"), identifier, "".join("*"), "", None, Language.ENG)
+        )
+        topic.add_attribute(
+            Attribute.restore(
+                "".join("modification-timestamp"),
+                "2026-10-17 12:00:00",
+                identifier,
+                f"attribute-{index}",
+                DataType.TIMESTAMP,
+                "".join("*"),
+                Language.ENG,
+            )
+        )
+        result.append(topic)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topics", type=int, default=100000, help="number of topics")
+    arguments = parser.parse_args()
+
+    tracemalloc.start()
+    topics = build(arguments.topics)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"topics:          {len(topics)}")
+    print(f"total:           {current / 1024 / 1024:.1f} MiB (peak {peak / 1024 / 1024:.1f} MiB)")
+    print(f"bytes per topic: {current / len(topics):.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Concurrent read/write throughput of the pragma profiles. Part of the Contextualise (https://contextualise.dev) project.
+
+Every profile gets a fresh database that is shared by a number of reader processes (repeatedly retrieving topics) and
+one writer process (repeatedly creating topics) for a fixed amount of time. Separate processes, rather than threads,
+are used as that is how a multi-worker web deployment uses the database.
+
+    $ python benchmarks/pragma_profiles.py --readers 4 --duration 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from topicdb.models.topic import Topic
+from topicdb.store.topicstore import TopicStore
+from topicdb.topicdberror import TopicDbError
+
+PROFILES = [None, "web", "bulk-import"]
+USER_IDENTIFIER = 1
+
+
+def read(database_path: str, profile: str | None, map_identifier: int, deadline: float, results) -> None:
+    operations = errors = 0
+    with TopicStore(database_path, profile=profile) as store:
+        while time.monotonic() < deadline:
+            try:
+                store.get_topic(map_identifier, "home")
+                store.get_topic_identifiers(map_identifier, "", limit=50)
+                operations += 1
+            except TopicDbError:
+                errors += 1
+    results.put(("read", operations, errors))
+
+
+def write(database_path: str, profile: str | None, map_identifier: int, deadline: float, results) -> None:
+    operations = errors = 0
+    with TopicStore(database_path, profile=profile) as store:
+        while time.monotonic() < deadline:
+            try:
+                store.create_topic(map_identifier, Topic(f"topic-{os.getpid()}-{operations}", name="Topic"))
+                operations += 1
+            except TopicDbError:
+                errors += 1
+    results.put(("write", operations, errors))
+
+
+def benchmark(profile: str | None, readers: int, duration: float) -> dict[str, tuple[int, int]]:
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = os.path.join(directory, "benchmark.db")
+        with TopicStore(database_path, profile=profile) as store:
+            store.create_database()
+            map_identifier = store.create_map(USER_IDENTIFIER, "Benchmark")
+            store.populate_map(map_identifier, USER_IDENTIFIER)
+
+        results: multiprocessing.Queue = multiprocessing.Queue()
+        deadline = time.monotonic() + duration
+        processes = [
+            multiprocessing.Process(target=read, args=(database_path, profile, map_identifier, deadline, results))
+            for _ in range(readers)
+        ]
+        processes.append(
+            multiprocessing.Process(target=write, args=(database_path, profile, map_identifier, deadline, results))
+        )
+        for process in processes:
+            process.start()
+        totals = {"read": (0, 0), "write": (0, 0)}
+        for _ in processes:
+            kind, operations, errors = results.get()
+            totals[kind] = (totals[kind][0] + operations, totals[kind][1] + errors)
+        for process in processes:
+            process.join()
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=4, help="number of reader processes")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per profile")
+    arguments = parser.parse_args()
+
+    print(f"{'profile':<12} {'reads/s':>10} {'writes/s':>10} {'errors':>8}")
+    for profile in PROFILES:
+        totals = benchmark(profile, arguments.readers, arguments.duration)
+        print(
+            f"{profile or 'default':<12} "
+            f"{totals['read'][0] / arguments.duration:>10.0f} "
+            f"{totals['write'][0] / arguments.duration:>10.0f} "
+            f"{totals['read'][1] + totals['write'][1]:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
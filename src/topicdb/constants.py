@@ -6,8 +6,46 @@ Brett Alistair Kromkamp (brettkromkamp@gmail.com)
 """
 
 NETWORK_MAX_DEPTH = 3
+IN_CLAUSE_CHUNK_SIZE = 500  # Stay well below SQLite's maximum number of bind variables
+BLOB_CHUNK_SIZE = 64 * 1024  # Bytes
+SLUGIFY_CACHE_SIZE = 65536
+STREAM_BATCH_SIZE = 500  # Rows fetched (and hydrated) at a time by the 'iter_*' methods
+EXPORT_FORMAT = "topicdb-map"
+EXPORT_VERSION = 1
 UNIVERSAL_SCOPE = "*"
 DATABASE_PATH = "topics.db"
+
+# Named pragma profiles for 'TopicStore'. The pragmas are applied, in order, to every connection the store opens
+PRAGMA_PROFILES: dict[str, dict[str, str | int]] = {
+    # Many concurrent readers and the occasional writer: readers don't block on the writer (and vice versa) in WAL mode
+    "web": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64 * 1024,  # KiB
+        "mmap_size": 256 * 1024 * 1024,  # Bytes
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # Milliseconds
+    },
+    # A single process loading a lot of data. A crash can lose the most recent transactions (but won't corrupt the
+    # database)
+    "bulk-import": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -256 * 1024,
+        "mmap_size": 1024 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+    # Reporting and exports from a database that is being written to by other processes
+    "read-only": {
+        "query_only": "ON",
+        "synchronous": "NORMAL",
+        "cache_size": -64 * 1024,
+        "mmap_size": 1024 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
 DDL = """
 CREATE TABLE IF NOT EXISTS topic (
     map_identifier INTEGER NOT NULL,
@@ -96,8 +134,100 @@ CREATE TABLE IF NOT EXISTS user_map (
     PRIMARY KEY (user_identifier, map_identifier)
 );
 CREATE INDEX IF NOT EXISTS user_map_1_index ON user_map (owner);
-CREATE VIRTUAL TABLE IF NOT EXISTS text USING fts5 (
-    occurrence_identifier,
-    resource_data
-);
-"""
\ No newline at end of file
+"""
+
+# Schema migrations, applied in order by 'TopicStore.migrate_database' and tracked with 'PRAGMA user_version'. Only ever
+# append new migrations; never change (or remove) a migration that has already been released.
+MIGRATIONS = [
+    (
+        1,
+        [
+            # Association lookups query members on 'src_topic_ref' and 'dest_topic_ref'. Both indexes are covering so
+            # that the query planner prefers them over 'member_1_index', even without statistics
+            "CREATE INDEX IF NOT EXISTS member_2_index ON member (map_identifier, src_topic_ref, association_identifier, dest_topic_ref)",
+            "CREATE INDEX IF NOT EXISTS member_3_index ON member (map_identifier, dest_topic_ref, association_identifier, src_topic_ref)",
+        ],
+    ),
+    (
+        2,
+        [
+            "CREATE INDEX IF NOT EXISTS user_map_2_index ON user_map (map_identifier)",
+        ],
+    ),
+    (
+        3,
+        [
+            # Keyset pagination: every page has to be an index seek on the page's sort key
+            "CREATE INDEX IF NOT EXISTS topic_6_index ON topic (map_identifier, instance_of, identifier)",
+            "CREATE INDEX IF NOT EXISTS basename_5_index ON basename (map_identifier, name, topic_identifier)",
+            "CREATE INDEX IF NOT EXISTS occurrence_5_index ON occurrence (map_identifier, topic_identifier, identifier)",
+        ],
+    ),
+    (
+        4,
+        [
+            # Full-text search of 'note' and 'text' occurrences. The full-text index is keyed on the (stable) integer
+            # primary key of 'text_occurrence' and is kept in sync with the 'occurrence' table by triggers
+            "DROP TABLE IF EXISTS text",
+            """CREATE TABLE IF NOT EXISTS text_occurrence (
+                identifier INTEGER PRIMARY KEY,
+                map_identifier INTEGER NOT NULL,
+                occurrence_identifier TEXT NOT NULL,
+                UNIQUE (map_identifier, occurrence_identifier)
+            )""",
+            "CREATE VIRTUAL TABLE IF NOT EXISTS text USING fts5 (resource_data, tokenize = 'porter unicode61')",
+            """CREATE TRIGGER IF NOT EXISTS occurrence_text_1 AFTER INSERT ON occurrence
+            WHEN new.instance_of IN ('note', 'text') AND new.resource_data IS NOT NULL
+            BEGIN
+                INSERT INTO text_occurrence (map_identifier, occurrence_identifier)
+                VALUES (new.map_identifier, new.identifier);
+                INSERT INTO text (rowid, resource_data)
+                SELECT identifier, CAST(new.resource_data AS TEXT) FROM text_occurrence
+                WHERE map_identifier = new.map_identifier AND occurrence_identifier = new.identifier;
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS occurrence_text_2 AFTER UPDATE OF instance_of, resource_data ON occurrence
+            BEGIN
+                DELETE FROM text WHERE rowid IN
+                    (SELECT identifier FROM text_occurrence
+                    WHERE map_identifier = old.map_identifier AND occurrence_identifier = old.identifier);
+                DELETE FROM text_occurrence
+                WHERE map_identifier = old.map_identifier AND occurrence_identifier = old.identifier;
+                INSERT INTO text_occurrence (map_identifier, occurrence_identifier)
+                SELECT new.map_identifier, new.identifier
+                WHERE new.instance_of IN ('note', 'text') AND new.resource_data IS NOT NULL;
+                INSERT INTO text (rowid, resource_data)
+                SELECT identifier, CAST(new.resource_data AS TEXT) FROM text_occurrence
+                WHERE map_identifier = new.map_identifier AND occurrence_identifier = new.identifier;
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS occurrence_text_3 AFTER DELETE ON occurrence
+            WHEN old.instance_of IN ('note', 'text')
+            BEGIN
+                DELETE FROM text WHERE rowid IN
+                    (SELECT identifier FROM text_occurrence
+                    WHERE map_identifier = old.map_identifier AND occurrence_identifier = old.identifier);
+                DELETE FROM text_occurrence
+                WHERE map_identifier = old.map_identifier AND occurrence_identifier = old.identifier;
+            END""",
+            # Index the existing occurrences
+            """INSERT INTO text_occurrence (map_identifier, occurrence_identifier)
+            SELECT map_identifier, identifier FROM occurrence
+            WHERE instance_of IN ('note', 'text') AND resource_data IS NOT NULL""",
+            """INSERT INTO text (rowid, resource_data)
+            SELECT text_occurrence.identifier, CAST(occurrence.resource_data AS TEXT)
+            FROM text_occurrence
+            JOIN occurrence ON occurrence.map_identifier = text_occurrence.map_identifier
+            AND occurrence.identifier = text_occurrence.occurrence_identifier""",
+        ],
+    ),
+    (
+        5,
+        [
+            # Per-map generation number. 'TopicStore' bumps it (in the same transaction) once for every write to a
+            # map. Being in the database, it is shared by every process that uses the database
+            """CREATE TABLE IF NOT EXISTS map_generation (
+                map_identifier INTEGER PRIMARY KEY,
+                generation INTEGER NOT NULL
+            )""",
+        ],
+    ),
+]
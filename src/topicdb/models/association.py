@@ -5,10 +5,11 @@ July 03, 2016
 Brett Alistair Kromkamp (brettkromkamp@gmail.com)
 """
 
-from slugify import slugify  # type: ignore
+import sys
 
 from topicdb.models.language import Language
 from topicdb.models.member import Member
+from topicdb.models.slug import slugify
 from topicdb.models.topic import Topic
 from topicdb.topicdberror import TopicDbError
 
@@ -16,6 +17,8 @@ from ..constants import UNIVERSAL_SCOPE
 
 
 class Association(Topic):
+    __slots__ = ("__scope", "member")
+
     def __init__(
         self,
         identifier: str = "",
@@ -37,6 +40,15 @@ class Association(Topic):
             member = Member(src_topic_ref, src_role_spec, dest_topic_ref, dest_role_spec)
             self.member = member
 
+    @classmethod
+    def restore(  # type: ignore[override]
+        cls, identifier: str, instance_of: str, scope: str, member: Member | None = None
+    ):
+        result = super().restore(identifier, instance_of)
+        result.__scope = sys.intern(scope)
+        result.member = member if member is not None else Member()
+        return result
+
     @property
     def scope(self) -> str:
         return self.__scope
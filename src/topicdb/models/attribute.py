@@ -5,18 +5,20 @@ June 12, 2016
 Brett Alistair Kromkamp (brettkromkamp@gmail.com)
 """
 
+import sys
 import uuid
 
-from slugify import slugify  # type: ignore
-
 from topicdb.models.datatype import DataType
 from topicdb.models.language import Language
+from topicdb.models.slug import slugify
 from topicdb.topicdberror import TopicDbError
 
 from ..constants import UNIVERSAL_SCOPE
 
 
 class Attribute:
+    __slots__ = ("__entity_identifier", "__identifier", "__scope", "data_type", "language", "name", "value")
+
     def __init__(
         self,
         name: str,
@@ -38,6 +40,28 @@ class Attribute:
         self.language = language
         self.value = value
 
+    @classmethod
+    def restore(
+        cls,
+        name: str,
+        value: str,
+        entity_identifier: str,
+        identifier: str,
+        data_type: DataType,
+        scope: str,
+        language: Language,
+    ) -> "Attribute":
+        # Fast path for attributes that are read from the database: the values were normalised when they were written
+        result = cls.__new__(cls)
+        result.__entity_identifier = entity_identifier
+        result.__identifier = identifier
+        result.__scope = sys.intern(scope)
+        result.name = sys.intern(name)
+        result.data_type = data_type
+        result.language = language
+        result.value = value
+        return result
+
     def __repr__(self) -> str:
         return "Attribute('{0}', '{1}', '{2}', '{3}', {4}, '{5}', {6})".format(
             self.name,
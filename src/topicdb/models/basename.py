@@ -5,17 +5,19 @@ June 12, 2016
 Brett Alistair Kromkamp (brettkromkamp@gmail.com)
 """
 
+import sys
 import uuid
 
-from slugify import slugify  # type: ignore
-
 from topicdb.models.language import Language
+from topicdb.models.slug import slugify
 from topicdb.topicdberror import TopicDbError
 
 from ..constants import UNIVERSAL_SCOPE
 
 
 class BaseName:
+    __slots__ = ("__identifier", "__scope", "language", "name")
+
     def __init__(
         self,
         name: str,
@@ -29,6 +31,16 @@ class BaseName:
         self.__scope = scope if scope == UNIVERSAL_SCOPE else slugify(str(scope))
         self.language = language
 
+    @classmethod
+    def restore(cls, name: str, scope: str, language: Language, identifier: str) -> "BaseName":
+        # Fast path for base names that are read from the database: the values were normalised when they were written
+        result = cls.__new__(cls)
+        result.__identifier = identifier
+        result.name = name
+        result.__scope = sys.intern(scope)
+        result.language = language
+        return result
+
     @property
     def identifier(self) -> str:
         return self.__identifier
@@ -5,17 +5,19 @@ June 12, 2016
 Brett Alistair Kromkamp (brettkromkamp@gmail.com)
 """
 
+import sys
 import uuid
 
-from slugify import slugify  # type: ignore
-
 from topicdb.models.attribute import Attribute
+from topicdb.models.slug import slugify
 from topicdb.topicdberror import TopicDbError
 
 from ..constants import UNIVERSAL_SCOPE
 
 
 class Entity:
+    __slots__ = ("__attributes", "__identifier", "__instance_of")
+
     def __init__(self, identifier: str = "", instance_of: str = "entity") -> None:
         if instance_of == "":
             raise TopicDbError("Empty 'instance of' parameter")
@@ -30,6 +32,17 @@ class Entity:
         self.__instance_of = slugify(str(instance_of))
         self.__attributes: list[Attribute] = []
 
+    @classmethod
+    def restore(cls, identifier: str, instance_of: str):
+        # Fast path for entities that are read from the database: the values were normalised when they were written,
+        # so neither validation nor 'slugify' are needed. Types (and scopes), of which there are few, are interned so
+        # that all of the entities share them
+        result = cls.__new__(cls)
+        result.__identifier = identifier
+        result.__instance_of = sys.intern(instance_of)
+        result.__attributes = []
+        return result
+
     @property
     def identifier(self) -> str:
         return self.__identifier
@@ -5,14 +5,16 @@ July 03, 2016
 Brett Alistair Kromkamp (brettkromkamp@gmail.com)
 """
 
+import sys
 import uuid
 
-from slugify import slugify  # type: ignore
-
+from topicdb.models.slug import slugify
 from topicdb.topicdberror import TopicDbError
 
 
 class Member:
+    __slots__ = ("__dest_role_spec", "__dest_topic_ref", "__identifier", "__src_role_spec", "__src_topic_ref")
+
     def __init__(
         self,
         src_topic_ref: str = "",
@@ -31,6 +33,19 @@ class Member:
         self.__dest_role_spec = slugify(str(dest_role_spec))
         self.__identifier = str(uuid.uuid4()) if identifier == "" else slugify(str(identifier))
 
+    @classmethod
+    def restore(
+        cls, src_topic_ref: str, src_role_spec: str, dest_topic_ref: str, dest_role_spec: str, identifier: str
+    ) -> "Member":
+        # Fast path for members that are read from the database: the values were normalised when they were written
+        result = cls.__new__(cls)
+        result.__src_topic_ref = src_topic_ref
+        result.__src_role_spec = sys.intern(src_role_spec)
+        result.__dest_topic_ref = dest_topic_ref
+        result.__dest_role_spec = sys.intern(dest_role_spec)
+        result.__identifier = identifier
+        return result
+
     @property
     def src_topic_ref(self) -> str:
         return self.__src_topic_ref
@@ -5,16 +5,19 @@ June 12, 2016
 Brett Alistair Kromkamp (brettkromkamp@gmail.com)
 """
 
-from slugify import slugify  # type: ignore
+import sys
 
 from topicdb.models.entity import Entity
 from topicdb.models.language import Language
+from topicdb.models.slug import slugify
 from topicdb.topicdberror import TopicDbError
 
 from ..constants import UNIVERSAL_SCOPE
 
 
 class Occurrence(Entity):
+    __slots__ = ("__resource_data", "__scope", "__topic_identifier", "language", "resource_ref")
+
     def __init__(
         self,
         identifier: str = "",
@@ -40,6 +43,25 @@ class Occurrence(Entity):
 
         self.language = language
 
+    @classmethod
+    def restore(  # type: ignore[override]
+        cls,
+        identifier: str,
+        instance_of: str,
+        topic_identifier: str,
+        scope: str,
+        resource_ref: str,
+        resource_data: bytes | None,
+        language: Language,
+    ):
+        result = super().restore(identifier, instance_of)
+        result.__topic_identifier = topic_identifier
+        result.__scope = sys.intern(scope)
+        result.resource_ref = resource_ref
+        result.__resource_data = resource_data or None
+        result.language = language
+        return result
+
     @property
     def scope(self) -> str:
         return self.__scope
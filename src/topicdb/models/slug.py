@@ -0,0 +1,19 @@
+"""
+slug.py. Part of the Contextualise (https://contextualise.dev) project.
+
+October 17, 2026
+Brett Alistair Kromkamp (brettkromkamp@gmail.com)
+"""
+
+from functools import lru_cache
+
+from slugify import slugify as _slugify  # type: ignore
+
+from ..constants import SLUGIFY_CACHE_SIZE
+
+
+@lru_cache(maxsize=SLUGIFY_CACHE_SIZE)
+def slugify(value: str) -> str:
+    # Identifiers, types, scopes and role specs are slugified over and over again and there are relatively few
+    # distinct ones
+    return _slugify(value)
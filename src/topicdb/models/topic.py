@@ -14,6 +14,8 @@ from ..constants import UNIVERSAL_SCOPE
 
 
 class Topic(Entity):
+    __slots__ = ("__base_names", "__occurrences", "language")
+
     def __init__(
         self,
         identifier: str = "",
@@ -32,6 +34,15 @@ class Topic(Entity):
         self.__occurrences: list[Occurrence] = []
         self.language = language
 
+    @classmethod
+    def restore(cls, identifier: str, instance_of: str, language: Language = Language.ENG):
+        # Unlike the constructor, doesn't add a default base name
+        result = super().restore(identifier, instance_of)
+        result.__base_names = []
+        result.__occurrences = []
+        result.language = language
+        return result
+
     @property
     def base_names(self) -> list[BaseName]:
         return self.__base_names
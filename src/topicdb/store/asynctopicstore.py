@@ -0,0 +1,131 @@
+"""
+AsyncTopicStore class. Part of the Contextualise (https://contextualise.dev) project.
+
+October 17, 2026
+Brett Alistair Kromkamp (brettkromkamp@gmail.com)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from topicdb.models.map import Map
+from topicdb.models.occurrence import Occurrence
+from topicdb.models.topic import Topic
+from topicdb.store.topicstore import TopicStore
+
+if TYPE_CHECKING:
+    from typing import Self  # Python 3.11+, only needed for type checking
+
+# Methods that only make sense on the thread that calls them (context managers and generators that hold a connection)
+SYNCHRONOUS_METHODS = {"close", "transaction", "memoize", "open_occurrence_data"}
+
+
+class AsyncTopicStore:
+    # Asyncio front-end for 'TopicStore'. Every public 'TopicStore' method is available as a coroutine. Queries run on
+    # a bounded pool of reader threads (each of which has its own connection) and mutations (the methods that
+    # 'TopicStore' marks as queued) run on a single writer thread. Cancelling a query interrupts the SQLite statement
+    # it is running; a mutation that has already started is allowed to finish so that it is either applied completely
+    # or not at all.
+
+    def __init__(self, *args, readers: int = 4, **kwargs) -> None:
+        self.store = TopicStore(*args, **kwargs)
+        self.__readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="topicdb-reader")
+        self.__writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="topicdb-writer")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._close)
+
+    def _close(self) -> None:
+        self.__readers.shutdown(wait=True, cancel_futures=True)
+        self.__writer.shutdown(wait=True, cancel_futures=True)
+        self.store.close()
+
+    def __getattr__(self, name: str) -> Callable:
+        if name == "store":  # Not initialised (yet)
+            raise AttributeError(name)
+        attribute = getattr(self.store, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        if name in SYNCHRONOUS_METHODS or inspect.isgeneratorfunction(inspect.unwrap(attribute)):
+            raise AttributeError(f"'{name}' has no asynchronous equivalent")
+
+        if getattr(attribute, "queued", False):
+
+            @functools.wraps(attribute)
+            async def mutation(*args, **kwargs):
+                return await self._write(functools.partial(attribute, *args, **kwargs))
+
+            return mutation
+
+        @functools.wraps(attribute)
+        async def query(*args, **kwargs):
+            return await self._read(functools.partial(attribute, *args, **kwargs))
+
+        return query
+
+    async def _read(self, function: Callable):
+        lock = threading.Lock()
+        running: list = []  # The connection of the reader thread while the function is running
+
+        def run():
+            connection = self.store._pool.reader()
+            with lock:
+                running.append(connection)
+            try:
+                return function()
+            finally:
+                with lock:
+                    running.clear()
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.__readers, run)
+        except asyncio.CancelledError:
+            with lock:
+                for connection in running:
+                    connection.interrupt()
+            raise
+
+    async def _write(self, function: Callable):
+        future = self.__writer.submit(function)
+        try:
+            return await asyncio.shield(asyncio.wrap_future(future))
+        except asyncio.CancelledError:
+            future.cancel()  # Only succeeds if the mutation hasn't started yet
+            raise
+
+    async def _iterate(self, get_page: Callable, *args, page_size: int, **kwargs) -> AsyncIterator:
+        # One keyset page at a time, so that other tasks get to run between pages
+        cursor = None
+        while True:
+            page = await self._read(functools.partial(get_page, *args, cursor=cursor, limit=page_size, **kwargs))
+            for item in page.items:
+                yield item
+            cursor = page.cursor
+            if cursor is None:
+                break
+
+    def iter_topics(self, map_identifier: int, page_size: int = 100, **kwargs) -> AsyncIterator[Topic]:
+        # Takes the keyword arguments of 'TopicStore.get_topics_page' (except for 'cursor' and 'limit')
+        return self._iterate(self.store.get_topics_page, map_identifier, page_size=page_size, **kwargs)
+
+    def iter_occurrences(self, map_identifier: int, page_size: int = 100, **kwargs) -> AsyncIterator[Occurrence]:
+        # Takes the keyword arguments of 'TopicStore.get_occurrences_page' (except for 'cursor' and 'limit')
+        return self._iterate(self.store.get_occurrences_page, map_identifier, page_size=page_size, **kwargs)
+
+    def iter_maps(self, user_identifier: int, page_size: int = 100) -> AsyncIterator[Map]:
+        return self._iterate(self.store.get_maps_page, user_identifier, page_size=page_size)
@@ -0,0 +1,174 @@
+"""
+ConnectionPool class. Part of the Contextualise (https://contextualise.dev) project.
+
+October 17, 2026
+Brett Alistair Kromkamp (brettkromkamp@gmail.com)
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from topicdb.topicdberror import TopicDbError
+
+
+class _Reader:
+    # Holds a thread's reader connection in the pool's thread-local storage. The holder is released when its thread
+    # ends, which closes the connection.
+    __slots__ = ("__weakref__", "connection")
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+
+
+class ConnectionPool:
+    # Every thread gets its own (long-lived) reader connection, created on first use and closed when the thread ends.
+    # All writes go through a single writer connection that is serialised with a re-entrant lock. The same pragmas are
+    # applied to every connection.
+
+    def __init__(self, database_path: str, pragmas: dict[str, str | int] | None = None, timeout: float = 5.0) -> None:
+        self.database_path = database_path
+        self.pragmas = dict(pragmas) if pragmas else {}
+        self.timeout = timeout
+
+        self.__local = threading.local()
+        self.__lock = threading.Lock()  # Guards the connections list
+        self.__writer_lock = threading.RLock()
+        self.__writer: sqlite3.Connection | None = None
+        self.__writer_thread: int | None = None
+        self.__writer_depth = 0
+        self.__callbacks: list[Callable[[], None]] = []
+        self.__commit_callbacks: list[Callable[[], None]] = []
+        self.__connections: list[sqlite3.Connection] = []
+        self.__closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.__closed:
+            raise TopicDbError("Connection pool is closed")
+        connection = sqlite3.connect(self.database_path, timeout=self.timeout, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        with self.__lock:
+            self.__connections.append(connection)
+        return connection
+
+    def reader(self) -> sqlite3.Connection:
+        # A thread that is inside a write transaction has to see its own (uncommitted) changes
+        if self.in_transaction():
+            return self.__writer  # type: ignore
+        reader = getattr(self.__local, "reader", None)
+        if reader is None:
+            reader = _Reader(self._connect())
+            weakref.finalize(reader, self._release, self.__lock, self.__connections, reader.connection)
+            self.__local.reader = reader
+        return reader.connection
+
+    @staticmethod
+    def _release(lock: threading.Lock, connections: list[sqlite3.Connection], connection: sqlite3.Connection) -> None:
+        # Doesn't reference the pool so that a thread that is still running doesn't keep it alive
+        with lock:
+            if connection not in connections:  # Closed by 'close' already
+                return
+            connections.remove(connection)
+        connection.close()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        # The outermost writer block owns the transaction and commits (or rolls back) once. Nested writer blocks, on
+        # the same thread, become savepoints so that a failing inner operation only undoes its own changes.
+        with self.__writer_lock:
+            if self.__writer is None:
+                self.__writer = self._connect()
+            connection = self.__writer
+            outermost = self.__writer_depth == 0
+            committed = False
+            commit_callbacks = len(self.__commit_callbacks)
+            self.__writer_depth += 1
+            self.__writer_thread = threading.get_ident()
+            try:
+                if outermost:
+                    connection.execute("BEGIN IMMEDIATE")
+                else:
+                    connection.execute("SAVEPOINT writer")
+                try:
+                    yield connection
+                except BaseException:
+                    if outermost:
+                        connection.rollback()
+                    else:
+                        connection.execute("ROLLBACK TO writer")
+                        connection.execute("RELEASE writer")
+                    raise
+                else:
+                    if outermost:
+                        connection.commit()
+                    else:
+                        connection.execute("RELEASE writer")
+                    committed = True
+            finally:
+                self.__writer_depth -= 1
+                if not committed:
+                    del self.__commit_callbacks[commit_callbacks:]
+                if outermost:
+                    self.__writer_thread = None
+                    callbacks, self.__callbacks = self.__callbacks, []
+                    callbacks.extend(self.__commit_callbacks)
+                    self.__commit_callbacks = []
+                    for callback in callbacks:
+                        callback()
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        # Runs the current thread's reads in one read transaction so that all of them see the same state of the
+        # database. Within a write transaction (or an enclosing snapshot) the reads are consistent already.
+        if self.in_transaction() or self.in_snapshot():
+            yield self.reader()
+            return
+        connection = self.reader()
+        connection.execute("BEGIN")
+        self.__local.snapshot = True
+        try:
+            yield connection
+        finally:
+            self.__local.snapshot = False
+            connection.rollback()  # Nothing to commit
+
+    def in_transaction(self) -> bool:
+        return self.__writer_thread == threading.get_ident()
+
+    def in_snapshot(self) -> bool:
+        return getattr(self.__local, "snapshot", False)
+
+    def call_after_transaction(self, callback: Callable[[], None]) -> None:
+        # Runs the callback once the current thread's transaction has ended (committed or rolled back), or straight
+        # away when the thread isn't in a transaction
+        if self.in_transaction():
+            self.__callbacks.append(callback)
+        else:
+            callback()
+
+    def call_after_commit(self, callback: Callable[[], None]) -> None:
+        # Like 'call_after_transaction' except that the callback is dropped when the transaction (or the savepoint it
+        # was registered in) is rolled back
+        if self.in_transaction():
+            self.__commit_callbacks.append(callback)
+        else:
+            callback()
+
+    def close(self) -> None:
+        with self.__writer_lock, self.__lock:
+            self.__closed = True
+            for connection in self.__connections:
+                connection.close()
+            self.__connections.clear()
+            self.__writer = None
+        self.__local = threading.local()
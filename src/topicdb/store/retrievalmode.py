@@ -17,6 +17,7 @@ class RetrievalMode(Enum):
     DONT_INLINE_RESOURCE_DATA = 6
     FILTER_BASE_TOPICS = 7
     DONT_FILTER_BASE_TOPICS = 8
+    RESOLVE_LAZILY = 9
 
     def __str__(self):
         return self.name
@@ -0,0 +1,173 @@
+"""
+TopicCache class. Part of the Contextualise (https://contextualise.dev) project.
+
+October 17, 2026
+Brett Alistair Kromkamp (brettkromkamp@gmail.com)
+"""
+
+from __future__ import annotations
+
+import pickle
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Hashable, Iterable
+
+CacheStatistics = namedtuple("CacheStatistics", ["hits", "misses", "entries", "size"])
+
+
+class TopicCache:
+    # A thread-safe LRU cache that is bounded by both the number of entries and their (pickled) size in bytes.
+    # Values are stored pickled so that callers always get their own copy and can't modify the cached value. Every
+    # entry records the map-level identifiers (of topics, associations, occurrences, base names and attributes) it
+    # depends on, which is what is used to invalidate it
+
+    def __init__(self, max_entries: int = 1024, max_size: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[Hashable, tuple[bytes, frozenset]] = OrderedDict()
+        self.__dependents: dict[tuple[int, str], set[Hashable]] = {}
+        self.__epochs: dict[int, int] = {}
+        self.__generation = 0  # Incremented by 'clear'
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self.__lock:
+            return CacheStatistics(self.__hits, self.__misses, len(self.__entries), self.__size)
+
+    def get(self, key: Hashable) -> tuple[bool, object]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__misses += 1
+                return False, None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+        return True, pickle.loads(entry[0])
+
+    def epoch(self, map_identifier: int) -> tuple[int, int]:
+        # Changes with every invalidation of the map. A value that was read before an invalidation is not cached
+        with self.__lock:
+            return self.__generation, self.__epochs.get(map_identifier, 0)
+
+    def put(
+        self,
+        key: Hashable,
+        value: object,
+        map_identifier: int,
+        dependencies: Iterable[str],
+        epoch: tuple[int, int],
+    ) -> None:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_size:
+            return
+        dependencies = frozenset((map_identifier, identifier) for identifier in dependencies)
+        with self.__lock:
+            if (self.__generation, self.__epochs.get(map_identifier, 0)) != epoch:
+                return
+            self._remove(key)
+            self.__entries[key] = (data, dependencies)
+            self.__size += len(data)
+            for dependency in dependencies:
+                self.__dependents.setdefault(dependency, set()).add(key)
+            while len(self.__entries) > self.max_entries or self.__size > self.max_size:
+                self._remove(next(iter(self.__entries)))
+
+    def invalidate(self, map_identifier: int, identifiers: Iterable[str]) -> None:
+        with self.__lock:
+            self.__epochs[map_identifier] = self.__epochs.get(map_identifier, 0) + 1
+            for identifier in identifiers:
+                for key in list(self.__dependents.get((map_identifier, identifier), ())):
+                    self._remove(key)
+
+    def invalidate_map(self, map_identifier: int) -> None:
+        with self.__lock:
+            self.__epochs[map_identifier] = self.__epochs.get(map_identifier, 0) + 1
+            keys = [
+                key
+                for key, (_, dependencies) in self.__entries.items()
+                if self._belongs_to(dependencies, map_identifier)
+            ]
+            for key in keys:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+            self.__dependents.clear()
+            self.__size = 0
+
+    @staticmethod
+    def _belongs_to(dependencies: frozenset, map_identifier: int) -> bool:
+        return any(dependency[0] == map_identifier for dependency in dependencies)
+
+    def _remove(self, key: Hashable) -> None:
+        # Callers hold the lock
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            return
+        data, dependencies = entry
+        self.__size -= len(data)
+        for dependency in dependencies:
+            dependents = self.__dependents.get(dependency)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self.__dependents[dependency]
+
+
+class ExistenceCache:
+    # A thread-safe, per-map set of the identifiers of topics that are known to exist. Only positive results are cached
+    # so that creating a topic never has to update the cache; removing (or renaming) a topic has to discard it. Every
+    # discard bumps the map's epoch so that an identifier that was looked up before the discard isn't (re-)added. Each
+    # set is tagged with the map's generation at the time of the lookups, so that writes by other connections (or
+    # processes), which this cache never sees, drop the set as well
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__identifiers: dict[int, set[str]] = {}
+        self.__generations: dict[int, int] = {}
+        self.__epochs: dict[int, int] = {}
+
+    def revalidate(self, map_identifier: int, generation: int) -> None:
+        with self.__lock:
+            if self.__generations.get(map_identifier, generation) != generation:
+                self.__identifiers.pop(map_identifier, None)
+                self.__generations.pop(map_identifier, None)
+
+    def warmed(self, map_identifier: int) -> bool:
+        with self.__lock:
+            return map_identifier in self.__identifiers
+
+    def epoch(self, map_identifier: int) -> int:
+        with self.__lock:
+            return self.__epochs.get(map_identifier, 0)
+
+    def known(self, map_identifier: int, identifiers: Iterable[str]) -> set[str]:
+        with self.__lock:
+            return self.__identifiers.get(map_identifier, set()).intersection(identifiers)
+
+    def add(self, map_identifier: int, identifiers: Iterable[str], epoch: int, generation: int) -> None:
+        with self.__lock:
+            if self.__epochs.get(map_identifier, 0) != epoch:
+                return
+            if self.__generations.get(map_identifier) != generation:
+                self.__identifiers[map_identifier] = set()
+                self.__generations[map_identifier] = generation
+            self.__identifiers[map_identifier].update(identifiers)
+
+    def discard(self, map_identifier: int, identifiers: Iterable[str]) -> None:
+        with self.__lock:
+            self.__epochs[map_identifier] = self.__epochs.get(map_identifier, 0) + 1
+            self.__identifiers.get(map_identifier, set()).difference_update(identifiers)
+
+    def discard_map(self, map_identifier: int) -> None:
+        with self.__lock:
+            self.__epochs[map_identifier] = self.__epochs.get(map_identifier, 0) + 1
+            self.__identifiers.pop(map_identifier, None)
+            self.__generations.pop(map_identifier, None)
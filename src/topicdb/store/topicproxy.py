@@ -0,0 +1,79 @@
+"""
+TopicProxy class. Part of the Contextualise (https://contextualise.dev) project.
+
+October 17, 2026
+Brett Alistair Kromkamp (brettkromkamp@gmail.com)
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable, Mapping
+
+from topicdb.models.topic import Topic
+
+# The (name-mangled) slots of a topic that a proxy can load on first access
+BASE_NAMES = "_Topic__base_names"
+ATTRIBUTES = "_Entity__attributes"
+OCCURRENCES = "_Topic__occurrences"
+
+TOPIC_SLOTS = ("_Entity__identifier", "_Entity__instance_of", ATTRIBUTES, BASE_NAMES, OCCURRENCES, "language")
+
+
+class TopicBatch:
+    # The topics that were retrieved together (a page). When a lazily loaded part of one of the topics is accessed,
+    # that part is loaded for all of the topics in the batch that don't have it yet, with a single (chunked) query
+
+    def __init__(self, load: Callable[[str, Mapping[str, Topic]], None]) -> None:
+        self.topics: dict[str, TopicProxy] = {}
+
+        self.__load = load
+        self.__lock = threading.Lock()
+
+    def load(self, name: str) -> None:
+        with self.__lock:
+            pending = {identifier: topic for identifier, topic in self.topics.items() if not topic._has(name)}
+            if not pending:
+                return
+            # Loaded into stand-ins so that readers never see a partially loaded part: the part is only set, all at
+            # once, when the load has succeeded
+            stand_ins = {
+                identifier: Topic.restore(identifier, topic.instance_of) for identifier, topic in pending.items()
+            }
+            self.__load(name, stand_ins)
+            for identifier, topic in pending.items():
+                object.__setattr__(topic, name, object.__getattribute__(stand_ins[identifier], name))
+
+
+class TopicProxy(Topic):
+    # A topic whose base names, attributes and/or occurrences are only loaded when they are first accessed. The
+    # unloaded parts are unset slots: reading an unset slot raises an 'AttributeError', which in turn invokes
+    # '__getattr__'. Hence, all of the 'Topic' methods work unchanged.
+    __slots__ = ("_batch",)
+
+    @classmethod
+    def defer(cls, identifier: str, instance_of: str, batch: TopicBatch, names: Iterable[str]) -> TopicProxy:
+        result = cls.restore(identifier, instance_of)
+        result._batch = batch
+        for name in names:
+            delattr(result, name)
+        batch.topics[identifier] = result
+        return result
+
+    def _has(self, name: str) -> bool:
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    def __getattr__(self, name: str):
+        if name not in (BASE_NAMES, ATTRIBUTES, OCCURRENCES):
+            raise AttributeError(name)
+        object.__getattribute__(self, "_batch").load(name)
+        return object.__getattribute__(self, name)
+
+    def __reduce_ex__(self, protocol):
+        # Pickled (and copied) as a plain, fully loaded topic without a reference to the store
+        state = {name: getattr(self, name) for name in TOPIC_SLOTS}
+        return object.__new__, (Topic,), (None, state)
@@ -8,10 +8,17 @@ Brett Alistair Kromkamp (brettkromkamp@gmail.com)
 # region Module and Class Imports
 from __future__ import annotations
 
+import base64
+import functools
+import itertools
+import json
 import sqlite3
-from collections import namedtuple
-from datetime import datetime
-from typing import Dict, Tuple
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import IO, TYPE_CHECKING, Dict
 
 from typedtree.tree import Tree  # type: ignore
 
@@ -22,29 +29,99 @@ from topicdb.models.collaborationmode import CollaborationMode
 from topicdb.models.collaborator import Collaborator
 from topicdb.models.datatype import DataType
 from topicdb.models.doublekeydict import DoubleKeyDict
+from topicdb.models.entity import Entity
 from topicdb.models.language import Language
 from topicdb.models.map import Map
 from topicdb.models.member import Member
 from topicdb.models.occurrence import Occurrence
 from topicdb.models.topic import Topic
+from topicdb.store.connectionpool import ConnectionPool
 from topicdb.store.ontologymode import OntologyMode
 from topicdb.store.retrievalmode import RetrievalMode
+from topicdb.store.topiccache import ExistenceCache, TopicCache
+from topicdb.store.topicproxy import ATTRIBUTES, BASE_NAMES, OCCURRENCES, TopicBatch, TopicProxy
+from topicdb.store.topicviewpart import TopicViewPart
+from topicdb.store.writequeue import WriteQueue
 from topicdb.topicdberror import TopicDbError
 
-from ..constants import DATABASE_PATH, DDL, NETWORK_MAX_DEPTH, UNIVERSAL_SCOPE
+from ..constants import (
+    BLOB_CHUNK_SIZE,
+    DATABASE_PATH,
+    DDL,
+    EXPORT_FORMAT,
+    EXPORT_VERSION,
+    IN_CLAUSE_CHUNK_SIZE,
+    MIGRATIONS,
+    NETWORK_MAX_DEPTH,
+    PRAGMA_PROFILES,
+    STREAM_BATCH_SIZE,
+    UNIVERSAL_SCOPE,
+)
+
+if TYPE_CHECKING:
+    from typing import Self  # Python 3.11+, only needed for type checking
 
 # endregion
 
 # region Setup
 TopicRefs = namedtuple("TopicRefs", ["instance_of", "role_spec", "topic_ref"])
+BatchFailure = namedtuple("BatchFailure", ["identifier", "reason"])
+NetworkEdge = namedtuple("NetworkEdge", ["instance_of", "src_topic_ref", "dest_topic_ref"])
+Page = namedtuple("Page", ["items", "cursor"])
+SearchResult = namedtuple("SearchResult", ["occurrence", "rank", "snippet"])
+TopicView = namedtuple(
+    "TopicView", ["topic", "occurrences_statistics", "associations", "association_groups", "related_topics", "tags"]
+)
+
+# Everything except for the occurrences' resource data
+DEFAULT_TOPIC_VIEW_PARTS = frozenset(TopicViewPart) - {TopicViewPart.OCCURRENCE_DATA}
+
+
+def _queued(method: Callable) -> Callable:
+    # Hands the mutation to the store's write queue, if it has one. A thread that already is in a transaction (this
+    # includes the write queue's own thread) holds the write lock and runs the mutation itself
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._write_queue is None or self._pool.in_transaction():
+            return method(self, *args, **kwargs)
+        return self._write_queue.submit(lambda: method(self, *args, **kwargs))
+
+    wrapper.queued = True  # type: ignore
+    return wrapper
+
+
 # endregion
 
 
 # region Class
 class TopicStore:
     # region Initialisation
-    def __init__(self, database_path: str = DATABASE_PATH) -> None:
+    def __init__(
+        self,
+        database_path: str = DATABASE_PATH,
+        pragmas: dict[str, str | int] | None = None,
+        timeout: float = 5.0,
+        cache: TopicCache | None = None,
+        profile: str | None = None,
+        write_queue: bool = False,
+    ) -> None:
+        # Explicitly provided pragmas take precedence over the profile's pragmas
+        if profile is not None and profile not in PRAGMA_PROFILES:
+            raise TopicDbError(f"Unknown pragma profile: {profile}")
+        profile_pragmas = PRAGMA_PROFILES[profile] if profile else {}
+
         self.database_path = database_path
+        self.profile = profile
+        self._pool = ConnectionPool(database_path, pragmas={**profile_pragmas, **(pragmas or {})}, timeout=timeout)
+        self.cache = cache
+        self._existence_cache = ExistenceCache()
+        self._write_queue: WriteQueue | None = None
+        if profile != "read-only":
+            self._upgrade_database()
+        # With a write queue, all (queued) mutations made by the store's threads are run by one writer thread with
+        # group commit, instead of each thread contending for the database's write lock
+        if write_queue:
+            self._write_queue = WriteQueue(self._pool)
 
         self.base_topics = {
             UNIVERSAL_SCOPE: "Universal",
@@ -96,6 +173,369 @@ class TopicStore:
             "process": "Process",
         }
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._write_queue is not None:
+            self._write_queue.close()
+        self._pool.close()
+
+    # endregion
+
+    # region Transaction
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # All create, update and delete calls made (by the same thread) within the scope of the transaction share one
+        # connection and are committed together when the outermost transaction exits, or rolled back on error
+        try:
+            with self._pool.writer():
+                yield
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error committing transaction: {error}")
+
+    def _write_batch(
+        self,
+        entities: list,
+        statements: Callable[[object], list[tuple[str, tuple]]],
+    ) -> list[BatchFailure]:
+        result: list[BatchFailure] = []
+
+        batch = [(entity, statements(entity)) for entity in entities]
+        with self._pool.writer() as connection:
+            try:
+                # Fast path: one 'executemany' per distinct statement for the whole batch
+                with self._pool.writer():
+                    parameters: dict[str, list[tuple]] = {}
+                    for _, entity_statements in batch:
+                        for sql, bind_variables in entity_statements:
+                            parameters.setdefault(sql, []).append(bind_variables)
+                    for sql, bind_variables_list in parameters.items():
+                        connection.executemany(sql, bind_variables_list)
+            except sqlite3.IntegrityError:
+                # Slow path: at least one entity violates a constraint. Write the entities one by one (each in its
+                # own savepoint) to find out which ones, without losing the rest of the batch
+                for entity, entity_statements in batch:
+                    try:
+                        with self._pool.writer():
+                            for sql, bind_variables in entity_statements:
+                                connection.execute(sql, bind_variables)
+                    except sqlite3.IntegrityError as error:
+                        result.append(BatchFailure(entity.identifier, str(error)))
+        return result
+
+    @staticmethod
+    def _fetch_in_chunks(
+        cursor: sqlite3.Cursor,
+        sql: str,
+        identifiers: list[str],
+        leading_bind_variables: tuple = (),
+        trailing_bind_variables: tuple = (),
+    ) -> list[sqlite3.Row]:
+        # Every '{0}' placeholder in the SQL statement is replaced with the bind variables of an 'IN' clause
+        result: list[sqlite3.Row] = []
+
+        placeholders = sql.count("{0}")
+        for index in range(0, len(identifiers), IN_CLAUSE_CHUNK_SIZE):
+            chunk = identifiers[index : index + IN_CLAUSE_CHUNK_SIZE]
+            cursor.execute(
+                sql.format(", ".join("?" * len(chunk))),
+                (*leading_bind_variables, *(chunk * placeholders), *trailing_bind_variables),
+            )
+            result.extend(cursor.fetchall())
+        return result
+
+    @staticmethod
+    def _execute_in_chunks(
+        connection: sqlite3.Connection,
+        sql: str,
+        identifiers: list[str],
+        leading_bind_variables: tuple = (),
+    ) -> None:
+        # The '{0}' placeholder in the SQL statement is replaced with the bind variables of an 'IN' clause
+        for index in range(0, len(identifiers), IN_CLAUSE_CHUNK_SIZE):
+            chunk = identifiers[index : index + IN_CLAUSE_CHUNK_SIZE]
+            connection.execute(sql.format(", ".join("?" * len(chunk))), (*leading_bind_variables, *chunk))
+
+    # endregion
+
+    # region Cache
+    def _cached(
+        self,
+        map_identifier: int,
+        key: tuple,
+        identifier: str,
+        load: Callable[[], object],
+    ) -> object:
+        # Read-through cache. A transaction can see its own uncommitted changes, so reads within a transaction bypass
+        # the cache. As do reads within a snapshot, which have to see the same state of the database
+        if self.cache is None or self._pool.in_transaction() or self._pool.in_snapshot():
+            return load()
+        found, result = self.cache.get(key)
+        if found:
+            return result
+        epoch = self.cache.epoch(map_identifier)
+        result = load()
+        self.cache.put(key, result, map_identifier, self._cache_dependencies(identifier, result), epoch)
+        return result
+
+    @staticmethod
+    def _cache_dependencies(identifier: str, value: object) -> set[str]:
+        # The identifiers of everything a cached value was built from: the requested entity itself and its base
+        # names, attributes and occurrences
+        result = {identifier}
+
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if item is None:
+                continue
+            result.add(item.identifier)
+            if isinstance(item, Entity):
+                result.update(attribute.identifier for attribute in item.attributes)
+            if isinstance(item, Topic):
+                result.update(base_name.identifier for base_name in item.base_names)
+                for occurrence in item.occurrences:
+                    result.add(occurrence.identifier)
+                    result.update(attribute.identifier for attribute in occurrence.attributes)
+        return result
+
+    def memoize(self, max_entries: int = 128) -> Callable[[Callable], Callable]:
+        # Decorator for functions whose first argument is a map identifier. A memoized result is reused for as long as
+        # the map's generation hasn't changed, which costs one primary key lookup per call. Within a transaction the
+        # generation can still be rolled back, so there the function is always called
+        def decorator(function: Callable) -> Callable:
+            entries: OrderedDict[tuple, tuple[int, object]] = OrderedDict()
+            lock = threading.Lock()
+
+            @functools.wraps(function)
+            def wrapper(map_identifier: int, *args, **kwargs):
+                if self._pool.in_transaction():
+                    return function(map_identifier, *args, **kwargs)
+                key = (map_identifier, args, tuple(sorted(kwargs.items())))
+                generation = self.get_map_generation(map_identifier)
+                with lock:
+                    entry = entries.get(key)
+                    if entry is not None and entry[0] == generation:
+                        entries.move_to_end(key)
+                        return entry[1]
+                result = function(map_identifier, *args, **kwargs)
+                with lock:
+                    entries[key] = (generation, result)
+                    entries.move_to_end(key)
+                    while len(entries) > max_entries:
+                        entries.popitem(last=False)
+                return result
+
+            wrapper.cache_clear = entries.clear  # type: ignore
+            return wrapper
+
+        return decorator
+
+    def _invalidate(self, map_identifier: int, *identifiers: str) -> None:
+        # Changes only become visible to other connections once they have been committed. Hence, cache entries are
+        # invalidated when the transaction has ended (and not straight away)
+        self._bump_generation(map_identifier)
+        cache = self.cache
+        if cache is not None:
+            self._pool.call_after_transaction(lambda: cache.invalidate(map_identifier, identifiers))
+
+    def _invalidate_map(self, map_identifier: int) -> None:
+        self._bump_generation(map_identifier)
+        cache = self.cache
+        if cache is not None:
+            self._pool.call_after_transaction(lambda: cache.invalidate_map(map_identifier))
+
+    def _bump_generation(self, map_identifier: int) -> None:
+        # Once per write, in the write's transaction, however many rows the write touches
+        with self._pool.writer() as connection:
+            connection.execute(
+                "INSERT INTO map_generation (map_identifier, generation) VALUES (?, 1) ON CONFLICT (map_identifier) DO UPDATE SET generation = generation + 1",
+                (map_identifier,),
+            )
+
+    def _forget_topics(self, map_identifier: int, *identifiers: str) -> None:
+        # Straight away, so that ontology checks within the transaction no longer see the topics, and once more when
+        # the transaction has ended in case another thread looked them up (in the committed state) in the meantime
+        self._existence_cache.discard(map_identifier, identifiers)
+        self._pool.call_after_transaction(lambda: self._existence_cache.discard(map_identifier, identifiers))
+
+    def _forget_map(self, map_identifier: int) -> None:
+        self._existence_cache.discard_map(map_identifier)
+        self._pool.call_after_transaction(lambda: self._existence_cache.discard_map(map_identifier))
+
+    # endregion
+
+    # region Pagination
+    @staticmethod
+    def _encode_cursor(*keys: str | int) -> str:
+        # A cursor is an opaque continuation token that encodes the sort key of the last item of a page
+        return base64.urlsafe_b64encode(json.dumps(keys).encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str, size: int) -> tuple:
+        try:
+            keys = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except (ValueError, UnicodeError):
+            raise TopicDbError("Invalid cursor")
+        if not isinstance(keys, list) or len(keys) != size:
+            raise TopicDbError("Invalid cursor")
+        return tuple(keys)
+
+    @staticmethod
+    def _make_page(items: list, limit: int, sort_key: Callable[[object], tuple]) -> Page:
+        # Only a full page can be followed by another page
+        cursor = TopicStore._encode_cursor(*sort_key(items[-1])) if items and len(items) == limit else None
+        return Page(items, cursor)
+
+    @staticmethod
+    def _timestamp() -> str:
+        # UTC, to the second and without an offset (the format of the existing 'creation-timestamp' attributes)
+        return datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None).isoformat()  # noqa: UP017 (Python 3.10)
+
+    # endregion
+
+    # region Streaming
+    def _stream(self, sql: str, bind_variables: tuple, batch_size: int) -> Iterator[list[sqlite3.Row]]:
+        # Yields the rows of a single query in batches, so that memory use doesn't depend on the size of the result.
+        # The query keeps a read transaction open until the generator is exhausted (or closed); writing to the
+        # database while iterating requires WAL mode unless it is done within a transaction
+        connection = self._pool.reader()
+        cursor = connection.cursor()
+        try:
+            cursor.execute(sql, bind_variables)
+            while True:
+                records = cursor.fetchmany(batch_size)
+                if not records:
+                    break
+                yield records
+        finally:
+            cursor.close()
+
+    def iter_topics(
+        self,
+        map_identifier: int,
+        instance_of: str | None = None,
+        scope: str | None = None,
+        language: Language | None = None,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        resolve_occurrences: RetrievalMode = RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+        filter_base_topics: RetrievalMode = RetrievalMode.DONT_FILTER_BASE_TOPICS,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Topic]:
+        # The 'scope' and 'language' filters apply to the topics' base names
+        sql = "SELECT identifier FROM topic WHERE map_identifier = ? AND scope IS NULL"
+        bind_variables: tuple = (map_identifier,)
+        if instance_of:
+            sql += " AND instance_of = ?"
+            bind_variables += (instance_of,)
+        elif filter_base_topics is RetrievalMode.FILTER_BASE_TOPICS:
+            sql += " AND instance_of != 'base-topic'"
+        sql += " ORDER BY identifier"
+
+        try:
+            for records in self._stream(sql, bind_variables, batch_size):
+                topics = self._hydrate_topics(
+                    map_identifier,
+                    [record["identifier"] for record in records],
+                    scope=scope,
+                    language=language,
+                    resolve_attributes=resolve_attributes,
+                    resolve_occurrences=resolve_occurrences,
+                )
+                for record in records:
+                    if record["identifier"] in topics:  # Unless deleted in the meantime
+                        yield topics[record["identifier"]]
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error retrieving topics: {error}")
+
+    def iter_associations(
+        self,
+        map_identifier: int,
+        instance_of: str | None = None,
+        scope: str | None = None,
+        language: Language | None = None,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        resolve_occurrences: RetrievalMode = RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Association]:
+        # The 'scope' filter applies to the associations and the 'language' filter to their base names
+        sql = "SELECT identifier FROM topic WHERE map_identifier = ? AND scope IS NOT NULL"
+        bind_variables: tuple = (map_identifier,)
+        if instance_of:
+            sql += " AND instance_of = ?"
+            bind_variables += (instance_of,)
+        if scope:
+            sql += " AND scope = ?"
+            bind_variables += (scope,)
+        sql += " ORDER BY identifier"
+
+        try:
+            for records in self._stream(sql, bind_variables, batch_size):
+                associations = self._hydrate_associations(
+                    map_identifier,
+                    [record["identifier"] for record in records],
+                    language=language,
+                    resolve_attributes=resolve_attributes,
+                    resolve_occurrences=resolve_occurrences,
+                )
+                for record in records:
+                    if record["identifier"] in associations:
+                        yield associations[record["identifier"]]
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error retrieving associations: {error}")
+
+    def iter_occurrences(
+        self,
+        map_identifier: int,
+        instance_of: str | None = None,
+        scope: str | None = None,
+        language: Language | None = None,
+        inline_resource_data: RetrievalMode = RetrievalMode.DONT_INLINE_RESOURCE_DATA,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Occurrence]:
+        sql = f"SELECT {self._occurrence_columns(inline_resource_data)} FROM occurrence WHERE map_identifier = ?"
+        bind_variables: tuple = (map_identifier,)
+        if instance_of:
+            sql += " AND instance_of = ?"
+            bind_variables += (instance_of,)
+        if scope:
+            sql += " AND scope = ?"
+            bind_variables += (scope,)
+        if language:
+            sql += " AND language = ?"
+            bind_variables += (language.name.lower(),)
+        sql += " ORDER BY topic_identifier, identifier"
+
+        try:
+            for records in self._stream(sql, bind_variables, batch_size):
+                occurrences = {}
+                for record in records:
+                    resource_data = None
+                    if inline_resource_data is RetrievalMode.INLINE_RESOURCE_DATA:
+                        resource_data = record["resource_data"]
+                    occurrences[record["identifier"]] = Occurrence.restore(
+                        record["identifier"],
+                        record["instance_of"],
+                        record["topic_identifier"],
+                        record["scope"],
+                        record["resource_ref"],
+                        resource_data,  # Type: bytes
+                        Language[record["language"].upper()],
+                    )
+                if resolve_attributes is RetrievalMode.RESOLVE_ATTRIBUTES:
+                    cursor = self._pool.reader().cursor()  # The streaming cursor is still in use
+                    try:
+                        self._hydrate_attributes(cursor, map_identifier, occurrences)
+                    finally:
+                        cursor.close()
+                yield from occurrences.values()
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error retrieving occurrences: {error}")
+
     # endregion
 
     # region Topic
@@ -103,6 +543,7 @@ class TopicStore:
     def _normalize_topic_name(topic_identifier):
         return " ".join([word.capitalize() for word in topic_identifier.split("-")])
 
+    @_queued
     def create_topic(
         self,
         map_identifier: int,
@@ -110,45 +551,232 @@ class TopicStore:
         ontology_mode: OntologyMode = OntologyMode.STRICT,
     ) -> None:
         if ontology_mode is OntologyMode.STRICT:
-            instance_of_exists = self.topic_exists(map_identifier, topic.instance_of)
+            instance_of_exists = self._topic_known(map_identifier, topic.instance_of)
             if not instance_of_exists:
                 raise TopicDbError("Ontology 'STRICT' mode violation: 'instance-of' topic does not exist")
 
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
-                connection.execute(
-                    "INSERT INTO topic (map_identifier, identifier, instance_of) VALUES (?, ?, ?)",
-                    (map_identifier, topic.identifier, topic.instance_of),
-                )
-                for base_name in topic.base_names:
-                    connection.execute(
-                        "INSERT INTO basename (map_identifier, identifier, name, topic_identifier, scope, language) VALUES (?, ?, ?, ?, ?, ?)",
-                        (
-                            map_identifier,
-                            base_name.identifier,
-                            base_name.name,
+            with self._pool.writer() as connection:
+                for sql, bind_variables in self._topic_statements(map_identifier, topic):
+                    connection.execute(sql, bind_variables)
+                self._invalidate(map_identifier, topic.identifier)
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error creating topic: {error}")
+
+    def _topic_statements(self, map_identifier: int, topic: Topic) -> list[tuple[str, tuple]]:
+        result = [
+            (
+                "INSERT INTO topic (map_identifier, identifier, instance_of) VALUES (?, ?, ?)",
+                (map_identifier, topic.identifier, topic.instance_of),
+            )
+        ]
+        for base_name in topic.base_names:
+            result.append(self._base_name_statement(map_identifier, topic.identifier, base_name))
+        result.extend(self._attribute_statements(map_identifier, topic, self._timestamp()))
+        return result
+
+    @_queued
+    def create_topics(
+        self,
+        map_identifier: int,
+        topics: Iterable[Topic],
+        ontology_mode: OntologyMode = OntologyMode.STRICT,
+    ) -> list[BatchFailure]:
+        result: list[BatchFailure] = []
+
+        topics = list(topics)
+        if ontology_mode is OntologyMode.STRICT:
+            # Topics that are part of the batch can be used as 'instance-of' topics by other topics in the batch
+            identifiers = {topic.identifier for topic in topics}
+            existing_identifiers = identifiers | self._topics_exist(
+                map_identifier, {topic.instance_of for topic in topics} - identifiers
+            )
+            valid_topics = []
+            for topic in topics:
+                if topic.instance_of not in existing_identifiers:
+                    result.append(
+                        BatchFailure(
                             topic.identifier,
-                            base_name.scope,
-                            base_name.language.name.lower(),
-                        ),
+                            "Ontology 'STRICT' mode violation: 'instance-of' topic does not exist",
+                        )
                     )
-            if not topic.get_attribute_by_name("creation-timestamp"):
-                timestamp = datetime.utcnow().replace(microsecond=0).isoformat()
-                timestamp_attribute = Attribute(
-                    "creation-timestamp",
-                    timestamp,
-                    topic.identifier,
-                    data_type=DataType.TIMESTAMP,
-                    scope=UNIVERSAL_SCOPE,
-                    language=Language.ENG,
+                else:
+                    valid_topics.append(topic)
+            topics = valid_topics
+
+        try:
+            with self._pool.writer():
+                result.extend(self._write_batch(topics, lambda topic: self._topic_statements(map_identifier, topic)))
+                self._invalidate(map_identifier, *(topic.identifier for topic in topics))
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error creating topics: {error}")
+        return result
+
+    def _hydrate_base_names(
+        self,
+        cursor: sqlite3.Cursor,
+        map_identifier: int,
+        topics: Mapping[str, Topic],
+        scope: str | None = None,
+        language: Language | None = None,
+    ) -> None:
+        query_filter = ""
+        bind_variables: tuple = ()
+        if scope:
+            query_filter += " AND scope = ?"
+            bind_variables += (scope,)
+        if language:
+            query_filter += " AND language = ?"
+            bind_variables += (language.name.lower(),)
+
+        records = self._fetch_in_chunks(
+            cursor,
+            "SELECT name, scope, language, identifier, topic_identifier FROM basename WHERE map_identifier = ? AND topic_identifier IN ({0})"
+            + query_filter,
+            list(topics.keys()),
+            (map_identifier,),
+            bind_variables,
+        )
+        for record in records:
+            topics[record["topic_identifier"]].add_base_name(
+                BaseName.restore(
+                    record["name"],
+                    record["scope"],
+                    Language[record["language"].upper()],
+                    record["identifier"],
+                )
+            )
+
+    def _hydrate_attributes(self, cursor: sqlite3.Cursor, map_identifier: int, entities: Mapping[str, Entity]) -> None:
+        records = self._fetch_in_chunks(
+            cursor,
+            "SELECT * FROM attribute WHERE map_identifier = ? AND entity_identifier IN ({0})",
+            list(entities.keys()),
+            (map_identifier,),
+        )
+        for record in records:
+            entities[record["entity_identifier"]].add_attribute(
+                Attribute.restore(
+                    record["name"],
+                    record["value"],
+                    record["entity_identifier"],
+                    record["identifier"],
+                    DataType[record["data_type"].upper()],
+                    record["scope"],
+                    Language[record["language"].upper()],
+                )
+            )
+
+    def _hydrate_occurrences(
+        self,
+        cursor: sqlite3.Cursor,
+        map_identifier: int,
+        topics: Mapping[str, Topic],
+        inline_resource_data: RetrievalMode = RetrievalMode.DONT_INLINE_RESOURCE_DATA,
+    ) -> None:
+        records = self._fetch_in_chunks(
+            cursor,
+            "SELECT "
+            + self._occurrence_columns(inline_resource_data)
+            + """ FROM occurrence
+            WHERE map_identifier = ? AND topic_identifier IN ({0})
+            ORDER BY topic_identifier, instance_of, scope, language""",
+            list(topics.keys()),
+            (map_identifier,),
+        )
+        for record in records:
+            resource_data = None
+            if inline_resource_data is RetrievalMode.INLINE_RESOURCE_DATA:
+                resource_data = record["resource_data"]
+            topics[record["topic_identifier"]].add_occurrence(
+                Occurrence.restore(
+                    record["identifier"],
+                    record["instance_of"],
+                    record["topic_identifier"],
+                    record["scope"],
+                    record["resource_ref"],
+                    resource_data,
+                    Language[record["language"].upper()],
                 )
-                topic.add_attribute(timestamp_attribute)
+            )
+
+    def _hydrate_topics(
+        self,
+        map_identifier: int,
+        identifiers: Iterable[str],
+        scope: str | None = None,
+        language: Language | None = None,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        resolve_occurrences: RetrievalMode = RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+    ) -> dict[str, Topic]:
+        # Loads a set of topics with one (chunked) query per table instead of one 'get_topic' call per topic. Topics
+        # that do not exist are absent from the resulting dictionary. With 'RetrievalMode.RESOLVE_LAZILY' the topics
+        # are proxies that load their base names (and attributes and/or occurrences) on first access
+        result: dict[str, Topic] = {}
+
+        identifiers = list(dict.fromkeys(identifiers))
+        if not identifiers:
+            return result
+
+        batch = None
+        lazy_names = [BASE_NAMES]
+        if resolve_attributes is RetrievalMode.RESOLVE_LAZILY:
+            lazy_names.append(ATTRIBUTES)
+        if resolve_occurrences is RetrievalMode.RESOLVE_LAZILY:
+            lazy_names.append(OCCURRENCES)
+        if len(lazy_names) > 1:
+            batch = TopicBatch(functools.partial(self._load_lazily, map_identifier, scope, language))
+
+        connection = self._pool.reader()
+        cursor = connection.cursor()
+        try:
+            records = self._fetch_in_chunks(
+                cursor,
+                "SELECT identifier, instance_of FROM topic WHERE map_identifier = ? AND identifier IN ({0})",
+                identifiers,
+                (map_identifier,),
+            )
+            for record in records:
+                if batch:
+                    topic = TopicProxy.defer(record["identifier"], record["instance_of"], batch, lazy_names)
+                else:
+                    topic = Topic.restore(record["identifier"], record["instance_of"])
+                result[record["identifier"]] = topic
+
+            if result:
+                if not batch:
+                    self._hydrate_base_names(cursor, map_identifier, result, scope=scope, language=language)
+                if resolve_attributes is RetrievalMode.RESOLVE_ATTRIBUTES:
+                    self._hydrate_attributes(cursor, map_identifier, result)
+                if resolve_occurrences is RetrievalMode.RESOLVE_OCCURRENCES:
+                    self._hydrate_occurrences(cursor, map_identifier, result)
         except sqlite3.Error as error:
-            raise TopicDbError(f"Error creating topic: {error}")
+            raise TopicDbError(f"Error retrieving topics: {error}")
         finally:
-            connection.close()
-        self.create_attributes(map_identifier, topic.attributes)
+            cursor.close()
+        return result
+
+    def _load_lazily(
+        self,
+        map_identifier: int,
+        scope: str | None,
+        language: Language | None,
+        name: str,
+        topics: Mapping[str, Topic],
+    ) -> None:
+        connection = self._pool.reader()
+        cursor = connection.cursor()
+        try:
+            if name == BASE_NAMES:
+                self._hydrate_base_names(cursor, map_identifier, topics, scope=scope, language=language)
+            elif name == ATTRIBUTES:
+                self._hydrate_attributes(cursor, map_identifier, topics)
+            elif name == OCCURRENCES:
+                self._hydrate_occurrences(cursor, map_identifier, topics)
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error retrieving topics: {error}")
+        finally:
+            cursor.close()
 
     def get_topic(
         self,
@@ -158,11 +786,33 @@ class TopicStore:
         language: Language | None = None,
         resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
         resolve_occurrences: RetrievalMode = RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+    ) -> Topic | None:
+        if RetrievalMode.RESOLVE_LAZILY in (resolve_attributes, resolve_occurrences):
+            # Proxies hold on to the store and hence are not cached
+            return self._hydrate_topics(
+                map_identifier, [identifier], scope, language, resolve_attributes, resolve_occurrences
+            ).get(identifier)
+        return self._cached(  # type: ignore
+            map_identifier,
+            ("topic", map_identifier, identifier, scope, language, resolve_attributes, resolve_occurrences),
+            identifier,
+            lambda: self._load_topic(
+                map_identifier, identifier, scope, language, resolve_attributes, resolve_occurrences
+            ),
+        )
+
+    def _load_topic(
+        self,
+        map_identifier: int,
+        identifier: str,
+        scope: str | None = None,
+        language: Language | None = None,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        resolve_occurrences: RetrievalMode = RetrievalMode.DONT_RESOLVE_OCCURRENCES,
     ) -> Topic | None:
         result = None
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -171,8 +821,7 @@ class TopicStore:
             )
             topic_record = cursor.fetchone()
             if topic_record:
-                result = Topic(topic_record["identifier"], topic_record["instance_of"])
-                result.clear_base_names()
+                result = Topic.restore(topic_record["identifier"], topic_record["instance_of"])
                 if scope:
                     if language:
                         sql = """SELECT name, scope, language, identifier
@@ -217,7 +866,7 @@ class TopicStore:
                 if base_name_records:
                     for base_name_record in base_name_records:
                         result.add_base_name(
-                            BaseName(
+                            BaseName.restore(
                                 base_name_record["name"],
                                 base_name_record["scope"],
                                 Language[base_name_record["language"].upper()],
@@ -232,9 +881,73 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving topic: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
+    def load_topic_view(
+        self,
+        map_identifier: int,
+        identifier: str,
+        include: Iterable[TopicViewPart] = DEFAULT_TOPIC_VIEW_PARTS,
+        scope: str | None = None,
+        language: Language | None = None,
+    ) -> TopicView | None:
+        # Everything that is needed to render a topic page, read in one read transaction so that all of the parts are
+        # consistent with each other. Every requested part is read once: the association groups, related topics and
+        # tags, for example, are all derived from the same associations. Parts that were not requested are 'None'
+        # (or, for the topic's base names, attributes and occurrences, empty)
+        include = frozenset(include)
+        occurrences_statistics = associations = association_groups = related_topics = tags = None
+
+        try:
+            with self._pool.snapshot() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(
+                        "SELECT identifier, instance_of FROM topic WHERE map_identifier = ? AND identifier = ?",
+                        (map_identifier, identifier),
+                    )
+                    record = cursor.fetchone()
+                    if record is None:
+                        return None
+                    topic = Topic.restore(record["identifier"], record["instance_of"])
+                    topics = {identifier: topic}
+                    if TopicViewPart.BASE_NAMES in include:
+                        self._hydrate_base_names(cursor, map_identifier, topics, scope=scope, language=language)
+                    if TopicViewPart.ATTRIBUTES in include:
+                        self._hydrate_attributes(cursor, map_identifier, topics)
+                    if TopicViewPart.OCCURRENCE_DATA in include:
+                        self._hydrate_occurrences(
+                            cursor, map_identifier, topics, inline_resource_data=RetrievalMode.INLINE_RESOURCE_DATA
+                        )
+                    elif TopicViewPart.OCCURRENCES in include:
+                        self._hydrate_occurrences(cursor, map_identifier, topics)
+                finally:
+                    cursor.close()
+
+                if TopicViewPart.OCCURRENCE_STATISTICS in include:
+                    occurrences_statistics = self.get_topic_occurrences_statistics(map_identifier, identifier)
+                if include & {
+                    TopicViewPart.ASSOCIATIONS,
+                    TopicViewPart.ASSOCIATION_GROUPS,
+                    TopicViewPart.RELATED_TOPICS,
+                    TopicViewPart.TAGS,
+                }:
+                    associations = self.get_topic_associations(map_identifier, identifier)
+                    groups = DoubleKeyDict()
+                    if associations:
+                        groups = self.get_association_groups(map_identifier, identifier, associations=associations)
+                    if TopicViewPart.ASSOCIATION_GROUPS in include:
+                        association_groups = groups
+                    if TopicViewPart.RELATED_TOPICS in include:
+                        related_topics = self._related_topics(map_identifier, identifier, groups)
+                    if TopicViewPart.TAGS in include:
+                        tags = self._tags(identifier, groups)
+                    if TopicViewPart.ASSOCIATIONS not in include:
+                        associations = None
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error retrieving topic view: {error}")
+        return TopicView(topic, occurrences_statistics, associations, association_groups, related_topics, tags)
+
     def get_related_topics(
         self,
         map_identifier: int,
@@ -247,14 +960,23 @@ class TopicStore:
         associations = self.get_topic_associations(map_identifier, identifier, instance_ofs=instance_ofs, scope=scope)
         if associations:
             groups = self.get_association_groups(map_identifier, identifier, associations=associations)
-            for instance_of in groups.dict:
-                for role in groups.dict[instance_of]:
-                    for topic_ref in groups[instance_of, role]:
-                        if topic_ref == identifier:
-                            continue
-                        topic = self.get_topic(map_identifier, topic_ref)
-                        if topic:
-                            result.append(topic)
+            result = self._related_topics(map_identifier, identifier, groups)
+        return result
+
+    def _related_topics(self, map_identifier: int, identifier: str, groups: DoubleKeyDict) -> list[Topic]:
+        result: list[Topic] = []
+
+        topic_refs = []
+        for instance_of in groups.dict:
+            for role in groups.dict[instance_of]:
+                for topic_ref in groups[instance_of, role]:
+                    if topic_ref == identifier:
+                        continue
+                    topic_refs.append(topic_ref)
+        topics = self._hydrate_topics(map_identifier, topic_refs)
+        for topic_ref in topic_refs:
+            if topic_ref in topics:
+                result.append(topics[topic_ref])
         return result
 
     def get_topic_associations(
@@ -271,8 +993,10 @@ class TopicStore:
 
         sql = """SELECT identifier FROM topic WHERE map_identifier = ? {0} AND
         identifier IN
-            (SELECT association_identifier FROM member
-             WHERE map_identifier = ? AND (src_topic_ref = ? OR dest_topic_ref = ?))"""
+            (SELECT association_identifier FROM member WHERE map_identifier = ? AND src_topic_ref = ?
+             UNION
+             SELECT association_identifier FROM member WHERE map_identifier = ? AND dest_topic_ref = ?)
+        ORDER BY identifier"""
         if instance_ofs:
             instance_of_in_condition = " AND instance_of IN ("
             for index, value in enumerate(instance_ofs):
@@ -282,12 +1006,12 @@ class TopicStore:
                     instance_of_in_condition += "?) "
             if scope:
                 query_filter = instance_of_in_condition + " AND scope = ? "
-                bind_variables = (
-                    (map_identifier,) + tuple(instance_ofs) + (scope, map_identifier, identifier, identifier)
-                )
+                bind_variables = (map_identifier,) + tuple(instance_ofs)
+                bind_variables += (scope, map_identifier, identifier, map_identifier, identifier)
             else:
                 query_filter = instance_of_in_condition
-                bind_variables = (map_identifier,) + tuple(instance_ofs) + (map_identifier, identifier, identifier)
+                bind_variables = (map_identifier,) + tuple(instance_ofs)
+                bind_variables += (map_identifier, identifier, map_identifier, identifier)
         else:
             if scope:
                 query_filter = " AND scope = ?"
@@ -296,6 +1020,7 @@ class TopicStore:
                     scope,
                     map_identifier,
                     identifier,
+                    map_identifier,
                     identifier,
                 )
             else:
@@ -304,30 +1029,29 @@ class TopicStore:
                     map_identifier,
                     map_identifier,
                     identifier,
+                    map_identifier,
                     identifier,
                 )
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(sql.format(query_filter), bind_variables)
             records = cursor.fetchall()
+            associations = self._hydrate_associations(
+                map_identifier,
+                [record["identifier"] for record in records],
+                language=language,
+                resolve_attributes=resolve_attributes,
+                resolve_occurrences=resolve_occurrences,
+            )
             for record in records:
-                association = self.get_association(
-                    map_identifier,
-                    record["identifier"],
-                    language=language,
-                    resolve_attributes=resolve_attributes,
-                    resolve_occurrences=resolve_occurrences,
-                )
-                if association:
-                    result.append(association)
+                if record["identifier"] in associations:
+                    result.append(associations[record["identifier"]])
         except sqlite3.Error as error:
             raise TopicDbError(f"Error retrieving topic associations: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_topic_associations_count(
@@ -341,8 +1065,9 @@ class TopicStore:
 
         sql = """SELECT COUNT(identifier) AS associations_count FROM topic WHERE map_identifier = ? {0} AND
         identifier IN
-            (SELECT association_identifier FROM member
-             WHERE map_identifier = ? AND (src_topic_ref = ? OR dest_topic_ref = ?))"""
+            (SELECT association_identifier FROM member WHERE map_identifier = ? AND src_topic_ref = ?
+             UNION
+             SELECT association_identifier FROM member WHERE map_identifier = ? AND dest_topic_ref = ?)"""
         if instance_ofs:
             instance_of_in_condition = " AND instance_of IN ("
             for index, value in enumerate(instance_ofs):
@@ -352,12 +1077,12 @@ class TopicStore:
                     instance_of_in_condition += "?) "
             if scope:
                 query_filter = instance_of_in_condition + " AND scope = ? "
-                bind_variables = (
-                    (map_identifier,) + tuple(instance_ofs) + (scope, map_identifier, identifier, identifier)
-                )
+                bind_variables = (map_identifier,) + tuple(instance_ofs)
+                bind_variables += (scope, map_identifier, identifier, map_identifier, identifier)
             else:
                 query_filter = instance_of_in_condition
-                bind_variables = (map_identifier,) + tuple(instance_ofs) + (map_identifier, identifier, identifier)
+                bind_variables = (map_identifier,) + tuple(instance_ofs)
+                bind_variables += (map_identifier, identifier, map_identifier, identifier)
         else:
             if scope:
                 query_filter = " AND scope = ?"
@@ -366,6 +1091,7 @@ class TopicStore:
                     scope,
                     map_identifier,
                     identifier,
+                    map_identifier,
                     identifier,
                 )
             else:
@@ -374,11 +1100,11 @@ class TopicStore:
                     map_identifier,
                     map_identifier,
                     identifier,
+                    map_identifier,
                     identifier,
                 )
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(sql.format(query_filter), bind_variables)
@@ -389,7 +1115,66 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving topic associations count: {error}")
         finally:
             cursor.close()
-            connection.close()
+        return result
+
+    def _get_network_edges(
+        self,
+        map_identifier: int,
+        identifier: str,
+        maximum_depth: int,
+        instance_ofs: list[str] | None = None,
+        scope: str | None = None,
+    ) -> dict[str, list[NetworkEdge]]:
+        # Expands the neighbourhood of the topic level by level, with one set-based query per level, and returns the
+        # associations of every expanded topic ordered by association identifier (like 'get_topic_associations')
+        result: dict[str, list[NetworkEdge]] = {}
+
+        # The source and destination topic references are queried separately so that each query can use its own
+        # (covering) member index
+        sql = """SELECT topic.identifier AS identifier, topic.instance_of AS instance_of,
+            member.src_topic_ref AS src_topic_ref, member.dest_topic_ref AS dest_topic_ref
+            FROM member
+            JOIN topic ON topic.map_identifier = member.map_identifier AND topic.identifier = member.association_identifier
+            WHERE member.map_identifier = ? AND member.{1} IN ({0})"""
+        bind_variables: tuple = ()
+        if instance_ofs:
+            sql += " AND topic.instance_of IN (" + ", ".join("?" * len(instance_ofs)) + ")"
+            bind_variables += tuple(instance_ofs)
+        if scope:
+            sql += " AND topic.scope = ?"
+            bind_variables += (scope,)
+        sqls = [sql.replace("{1}", column) for column in ("src_topic_ref", "dest_topic_ref")]
+
+        visited = {identifier}
+        frontier = [identifier]
+        connection = self._pool.reader()
+        cursor = connection.cursor()
+        try:
+            for _ in range(maximum_depth + 1):
+                if not frontier:
+                    break
+                frontier_set = set(frontier)
+                for topic_ref in frontier:
+                    result[topic_ref] = []
+                records = []
+                for sql in sqls:
+                    records.extend(self._fetch_in_chunks(cursor, sql, frontier, (map_identifier,), bind_variables))
+                associations = {record["identifier"]: record for record in records}  # Deduplicate across queries
+                next_frontier = []
+                for association_identifier in sorted(associations):
+                    record = associations[association_identifier]
+                    edge = NetworkEdge(record["instance_of"], record["src_topic_ref"], record["dest_topic_ref"])
+                    for topic_ref in dict.fromkeys((edge.src_topic_ref, edge.dest_topic_ref)):
+                        if topic_ref in frontier_set:
+                            result[topic_ref].append(edge)
+                        elif topic_ref not in visited:
+                            visited.add(topic_ref)
+                            next_frontier.append(topic_ref)
+                frontier = next_frontier
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error retrieving topics network: {error}")
+        finally:
+            cursor.close()
         return result
 
     def get_topics_network(
@@ -403,9 +1188,21 @@ class TopicStore:
         instance_ofs: list[str] | None = None,
         scope: str | None = None,
     ) -> Tree:
+        # The network's associations are retrieved up front (one query per level) and all of the topics in the
+        # network are hydrated in bulk. The tree itself is then built in memory, depth-first
+        edges = self._get_network_edges(
+            map_identifier, identifier, maximum_depth - depth, instance_ofs=instance_ofs, scope=scope
+        )
+        topic_refs = {identifier}
+        for topic_edges in edges.values():
+            for edge in topic_edges:
+                topic_refs.add(edge.src_topic_ref)
+                topic_refs.add(edge.dest_topic_ref)
+        topics = self._hydrate_topics(map_identifier, topic_refs)
+
         if tree_accumulator is None:
             tree = Tree()
-            root_topic = self.get_topic(map_identifier, identifier)
+            root_topic = topics.get(identifier)
             if root_topic:
                 tree.add_node(
                     identifier,
@@ -414,54 +1211,73 @@ class TopicStore:
                 )
         else:
             tree = tree_accumulator
+        nodes = set(nodes_accumulator) if nodes_accumulator else set()
 
-        if nodes_accumulator is None:
-            nodes: list[str] = []
-        else:
-            nodes = nodes_accumulator
+        self._build_topics_network(tree, nodes, edges, topics, identifier, depth, maximum_depth)
+        return tree
 
+    @staticmethod
+    def _build_topics_network(
+        tree: Tree,
+        nodes: set[str],
+        edges: dict[str, list[NetworkEdge]],
+        topics: dict[str, Topic],
+        identifier: str,
+        depth: int,
+        maximum_depth: int,
+    ) -> None:
         if depth <= maximum_depth:  # Exit case
-            associations = self.get_topic_associations(
-                map_identifier, identifier, instance_ofs=instance_ofs, scope=scope
-            )
-            for association in associations:
-                resolved_topic_refs = self._resolve_topic_refs(association)
-                for resolved_topic_ref in resolved_topic_refs:
-                    topic_ref = resolved_topic_ref.topic_ref
+            for edge in edges.get(identifier, []):
+                for topic_ref in (edge.src_topic_ref, edge.dest_topic_ref):
                     if (topic_ref != identifier) and (topic_ref not in nodes):
-                        topic = self.get_topic(map_identifier, topic_ref)
+                        topic = topics.get(topic_ref)
                         if topic:
                             tree.add_node(
                                 topic_ref,
                                 parent_pointer=identifier,
                                 node_type=topic.instance_of,
-                                edge_type=association.instance_of,
+                                edge_type=edge.instance_of,
                                 payload={"level": depth, "topic": topic},
                             )
-                    if topic_ref not in nodes:
-                        nodes.append(topic_ref)
+                    nodes.add(topic_ref)
             children = tree[identifier].children
 
             for child in children:
                 # Recursive call
-                self.get_topics_network(
-                    map_identifier,
-                    child.pointer,
-                    depth=depth + 1,
-                    tree_accumulator=tree,
-                    nodes_accumulator=nodes,
-                    instance_ofs=instance_ofs,
-                    scope=scope,
-                )
-        return tree
+                TopicStore._build_topics_network(tree, nodes, edges, topics, child.pointer, depth + 1, maximum_depth)
+
+    def get_topic_identifiers(
+        self,
+        map_identifier: int,
+        query: str,
+        instance_ofs: list[str] | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> list[str]:
+        return self._get_topic_identifiers(map_identifier, query, instance_ofs=instance_ofs, offset=offset, limit=limit)
 
-    def get_topic_identifiers(
+    def get_topic_identifiers_page(
+        self,
+        map_identifier: int,
+        query: str,
+        instance_ofs: list[str] | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> Page:
+        after = self._decode_cursor(cursor, 1) if cursor else None
+        identifiers = self._get_topic_identifiers(
+            map_identifier, query, instance_ofs=instance_ofs, limit=limit, after=after
+        )
+        return self._make_page(identifiers, limit, lambda identifier: (identifier,))
+
+    def _get_topic_identifiers(
         self,
         map_identifier: int,
         query: str,
         instance_ofs: list[str] | None = None,
         offset: int = 0,
         limit: int = 100,
+        after: tuple | None = None,
     ) -> list[str]:
         result: list[str] = []
 
@@ -482,13 +1298,16 @@ class TopicStore:
                 else:
                     instance_of_in_condition += "?) "
             query_filter = instance_of_in_condition
-            bind_variables = (map_identifier, query_string) + tuple(instance_ofs) + (limit, offset)
+            bind_variables = (map_identifier, query_string) + tuple(instance_ofs)
         else:
             query_filter = ""
-            bind_variables = (map_identifier, query_string, limit, offset)
+            bind_variables = (map_identifier, query_string)
+        if after:
+            query_filter += " AND identifier > ?"
+            bind_variables += after
+        bind_variables += (limit, offset)
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(sql.format(query_filter), bind_variables)
@@ -499,7 +1318,6 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving topic identifiers: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_topic_names(  # TODO: Refactor method to return a namedtuple including 'scope' and 'language' fields
@@ -507,31 +1325,57 @@ class TopicStore:
         map_identifier: int,
         offset: int = 0,
         limit: int = 100,
-    ) -> list[Tuple[str, str]]:
-        result: list[Tuple[str, str]] = []
+    ) -> list[tuple[str, str]]:
+        return [name[:2] for name in self._get_topic_names(map_identifier, offset=offset, limit=limit)]
+
+    def get_topic_names_page(
+        self,
+        map_identifier: int,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> Page:
+        # A topic can have several base names with the same name, hence the base name's identifier in the cursor
+        after = self._decode_cursor(cursor, 3) if cursor else None
+        names = self._get_topic_names(map_identifier, limit=limit, after=after)
+        page = self._make_page(names, limit, lambda name: name)
+        return Page([name[:2] for name in page.items], page.cursor)
+
+    def _get_topic_names(
+        self,
+        map_identifier: int,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple | None = None,
+    ) -> list[tuple[str, str, str]]:
+        result: list[tuple[str, str, str]] = []
 
-        sql = """SELECT basename.name AS name, topic.identifier AS identifier
+        sql = """SELECT basename.name AS name, topic.identifier AS identifier, basename.identifier AS base_name_identifier
             FROM topic
             JOIN basename ON topic.identifier = basename.topic_identifier
             WHERE basename.map_identifier = ?
             AND topic.map_identifier = ?
             AND topic.scope IS NULL
-            ORDER BY basename.name
+            {0}
+            ORDER BY basename.name, basename.topic_identifier, basename.identifier
             LIMIT ? OFFSET ?"""
+        if after:
+            query_filter = " AND (basename.name, basename.topic_identifier, basename.identifier) > (?, ?, ?)"
+            bind_variables = (map_identifier, map_identifier) + after + (limit, offset)
+        else:
+            query_filter = ""
+            bind_variables = (map_identifier, map_identifier, limit, offset)
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
-            cursor.execute(sql, (map_identifier, map_identifier, limit, offset))
+            cursor.execute(sql.format(query_filter), bind_variables)
             records = cursor.fetchall()
             for record in records:
-                result.append((record["name"], record["identifier"]))
+                result.append((record["name"], record["identifier"], record["base_name_identifier"]))
         except sqlite3.Error as error:
             raise TopicDbError(f"Error retrieving topic names: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_topic_occurrences(
@@ -543,10 +1387,38 @@ class TopicStore:
         language: Language | None = None,
         inline_resource_data: RetrievalMode = RetrievalMode.DONT_INLINE_RESOURCE_DATA,
         resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+    ) -> list[Occurrence]:
+        return self._cached(  # type: ignore
+            map_identifier,
+            (
+                "topic_occurrences",
+                map_identifier,
+                identifier,
+                instance_of,
+                scope,
+                language,
+                inline_resource_data,
+                resolve_attributes,
+            ),
+            identifier,
+            lambda: self._load_topic_occurrences(
+                map_identifier, identifier, instance_of, scope, language, inline_resource_data, resolve_attributes
+            ),
+        )
+
+    def _load_topic_occurrences(
+        self,
+        map_identifier: int,
+        identifier: str,
+        instance_of: str | None = None,
+        scope: str | None = None,
+        language: Language | None = None,
+        inline_resource_data: RetrievalMode = RetrievalMode.DONT_INLINE_RESOURCE_DATA,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
     ) -> list[Occurrence]:
         result: list[Occurrence] = []
 
-        sql = """SELECT identifier, instance_of, scope, resource_ref, topic_identifier, language
+        sql = """SELECT {1}
             FROM occurrence
             WHERE map_identifier = ? AND
             topic_identifier = ?
@@ -599,17 +1471,16 @@ class TopicStore:
                     query_filter = ""
                     bind_variables = (map_identifier, identifier)  # type: ignore
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
-            cursor.execute(sql.format(query_filter), bind_variables)
+            cursor.execute(sql.format(query_filter, self._occurrence_columns(inline_resource_data)), bind_variables)
             records = cursor.fetchall()
             for record in records:
                 resource_data = None
                 if inline_resource_data is RetrievalMode.INLINE_RESOURCE_DATA:
-                    resource_data = self.get_occurrence_data(map_identifier, record["identifier"])
-                occurrence = Occurrence(
+                    resource_data = record["resource_data"]
+                occurrence = Occurrence.restore(
                     record["identifier"],
                     record["instance_of"],
                     record["topic_identifier"],
@@ -618,14 +1489,14 @@ class TopicStore:
                     resource_data,
                     Language[record["language"].upper()],
                 )
-                if resolve_attributes is RetrievalMode.RESOLVE_ATTRIBUTES:
-                    occurrence.add_attributes(self.get_attributes(map_identifier, occurrence.identifier))
                 result.append(occurrence)
+            if resolve_attributes is RetrievalMode.RESOLVE_ATTRIBUTES:
+                occurrences = {occurrence.identifier: occurrence for occurrence in result}
+                self._hydrate_attributes(cursor, map_identifier, occurrences)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error retrieving topic occurrences: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_topics(
@@ -637,6 +1508,70 @@ class TopicStore:
         limit: int = 100,
         resolve_attributes=RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
         filter_base_topics=RetrievalMode.DONT_FILTER_BASE_TOPICS,
+        resolve_occurrences=RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+    ) -> list[Topic]:
+        return self._get_topics(
+            map_identifier,
+            instance_of=instance_of,
+            language=language,
+            offset=offset,
+            limit=limit,
+            resolve_attributes=resolve_attributes,
+            filter_base_topics=filter_base_topics,
+            resolve_occurrences=resolve_occurrences,
+        )
+
+    def get_topics_page(
+        self,
+        map_identifier: int,
+        instance_of: str | None = None,
+        language: Language | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+        resolve_attributes=RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        filter_base_topics=RetrievalMode.DONT_FILTER_BASE_TOPICS,
+        resolve_occurrences=RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+    ) -> Page:
+        after = self._decode_cursor(cursor, 1) if cursor else None
+        topics = self._get_topics(
+            map_identifier,
+            instance_of=instance_of,
+            language=language,
+            limit=limit,
+            resolve_attributes=resolve_attributes,
+            filter_base_topics=filter_base_topics,
+            resolve_occurrences=resolve_occurrences,
+            after=after,
+        )
+        return self._make_page(topics, limit, lambda topic: (topic.identifier,))
+
+    def get_topics_by_identifiers(
+        self,
+        map_identifier: int,
+        identifiers: Iterable[str],
+        scope: str | None = None,
+        language: Language | None = None,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        resolve_occurrences: RetrievalMode = RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+    ) -> dict[str, Topic]:
+        # The topics in the order of the given identifiers. Topics that do not exist are absent from the result
+        identifiers = list(dict.fromkeys(identifiers))
+        topics = self._hydrate_topics(
+            map_identifier, identifiers, scope, language, resolve_attributes, resolve_occurrences
+        )
+        return {identifier: topics[identifier] for identifier in identifiers if identifier in topics}
+
+    def _get_topics(
+        self,
+        map_identifier: int,
+        instance_of: str | None = None,
+        language: Language | None = None,
+        offset: int = 0,
+        limit: int = 100,
+        resolve_attributes=RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        filter_base_topics=RetrievalMode.DONT_FILTER_BASE_TOPICS,
+        resolve_occurrences=RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+        after: tuple | None = None,
     ) -> list[Topic]:
         result: list[Topic] = []
 
@@ -645,9 +1580,10 @@ class TopicStore:
                 WHERE map_identifier = ? AND
                 instance_of = ? AND
                 scope IS NULL
+                {0}
                 ORDER BY identifier
                 LIMIT ? OFFSET ?"""
-            bind_variables = (map_identifier, instance_of, limit, offset)
+            bind_variables = (map_identifier, instance_of)
         else:
             match filter_base_topics:
                 case RetrievalMode.FILTER_BASE_TOPICS:
@@ -655,37 +1591,45 @@ class TopicStore:
                 WHERE map_identifier = ? AND
                 instance_of != 'base-topic' AND
                 scope IS NULL
+                {0}
                 ORDER BY identifier
                 LIMIT ? OFFSET ?"""
                 case RetrievalMode.DONT_FILTER_BASE_TOPICS:
                     sql = """SELECT identifier FROM topic
                 WHERE map_identifier = ? AND
                 scope IS NULL
+                {0}
                 ORDER BY identifier
                 LIMIT ? OFFSET ?"""
 
-            bind_variables = (map_identifier, limit, offset)  # type: ignore
+            bind_variables = (map_identifier,)  # type: ignore
+        if after:
+            query_filter = " AND identifier > ?"
+            bind_variables += after
+        else:
+            query_filter = ""
+        bind_variables += (limit, offset)
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
-        cursor = connection.cursor()
         try:
-            cursor.execute(sql, bind_variables)
-            records = cursor.fetchall()
-            for record in records:
-                result.append(
-                    self.get_topic(
+            # The topics as of the same point in time as their identifiers (a topic can't be deleted in between)
+            with self._pool.snapshot() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(sql.format(query_filter), bind_variables)
+                    records = cursor.fetchall()
+                    topics = self._hydrate_topics(
                         map_identifier,
-                        record["identifier"],
+                        [record["identifier"] for record in records],
                         language=language,
                         resolve_attributes=resolve_attributes,
-                    )  # type: ignore
-                )
+                        resolve_occurrences=resolve_occurrences,
+                    )
+                    for record in records:
+                        result.append(topics[record["identifier"]])
+                finally:
+                    cursor.close()
         except sqlite3.Error as error:
             raise TopicDbError(f"Error retrieving topics: {error}")
-        finally:
-            cursor.close()
-            connection.close()
         return result
 
     def get_topic_identifiers_by_attribute_name(
@@ -767,8 +1711,7 @@ class TopicStore:
                     query_filter = ""
                     bind_variables = (map_identifier, map_identifier, name)  # type: ignore
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(sql.format(query_filter), bind_variables)
@@ -779,7 +1722,6 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving topic identifiers: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_topics_by_attribute_name(
@@ -862,50 +1804,48 @@ class TopicStore:
                     query_filter = ""
                     bind_variables = (map_identifier, map_identifier, name)  # type: ignore
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
-        cursor = connection.cursor()
         try:
-            cursor.execute(sql.format(query_filter), bind_variables)
-            records = cursor.fetchall()
-            for record in records:
-                result.append(
-                    self.get_topic(
+            # The topics as of the same point in time as their identifiers (a topic can't be deleted in between)
+            with self._pool.snapshot() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(sql.format(query_filter), bind_variables)
+                    records = cursor.fetchall()
+                    topics = self._hydrate_topics(
                         map_identifier,
-                        record["identifier"],
+                        [record["identifier"] for record in records],
                         language=language,
                         resolve_attributes=resolve_attributes,
-                    )  # type: ignore
-                )
+                    )
+                    for record in records:
+                        result.append(topics[record["identifier"]])
+                finally:
+                    cursor.close()
         except sqlite3.Error as error:
             raise TopicDbError(f"Error retrieving topics: {error}")
-        finally:
-            cursor.close()
-            connection.close()
         return result
 
+    @_queued
     def update_topic_instance_of(self, map_identifier: int, identifier: str, instance_of: str) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "UPDATE topic SET instance_of = ? WHERE map_identifier = ? AND identifier = ?",
                     (instance_of, map_identifier, identifier),
                 )
+                self._invalidate(map_identifier, identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error updating topic 'instance of': {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def update_topic_identifier(self, map_identifier: int, old_identifier: str, new_identifier: str) -> None:
         if self.topic_exists(map_identifier, new_identifier):
             raise TopicDbError("Topic identifier already exists")
         if old_identifier in self.base_topics.keys():
             raise TopicDbError("Ontology 'STRICT' mode violation: attempt to update a base topic")
 
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "UPDATE topic SET identifier = ? WHERE map_identifier = ? AND identifier = ?",
                     (new_identifier, map_identifier, old_identifier),
@@ -930,20 +1870,35 @@ class TopicStore:
                     "UPDATE member SET dest_topic_ref = ? WHERE map_identifier = ? AND dest_topic_ref = ?",
                     (new_identifier, map_identifier, old_identifier),
                 )
+                self._invalidate_map(map_identifier)  # All references to the topic change
+                self._forget_topics(map_identifier, old_identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error updating topic identifier: {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def delete_topic(
         self,
         map_identifier: int,
         identifier: str,
         ontology_mode: OntologyMode = OntologyMode.STRICT,
     ) -> None:
+        self.delete_topics(map_identifier, [identifier], ontology_mode)
+
+    @_queued
+    def delete_topics(
+        self,
+        map_identifier: int,
+        identifiers: Iterable[str],
+        ontology_mode: OntologyMode = OntologyMode.STRICT,
+    ) -> None:
+        # Deletes the topics together with their associations in one transaction: either all of the topics are deleted
+        # or none of them are
+        identifiers = list(dict.fromkeys(identifiers))
         if ontology_mode is OntologyMode.STRICT:
-            if identifier in self.base_topics.keys():
+            if any(identifier in self.base_topics.keys() for identifier in identifiers):
                 raise TopicDbError("Ontology 'STRICT' mode violation: attempt to delete a base topic")
+        if not identifiers:
+            return
 
         # Is this actually an association?
         #
@@ -952,45 +1907,61 @@ class TopicStore:
         # association just like you would do a topic, in doing so, remnants of (more complex) association data
         # structure would be left dangling. So, deleting an association has to be handled differently.
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
-        cursor = connection.cursor()
         try:
-            cursor.execute(
-                "SELECT identifier, instance_of FROM topic WHERE map_identifier = ? AND identifier = ? AND scope IS NOT NULL",
-                (map_identifier, identifier),
-            )
-            association_record = cursor.fetchone()
-            if association_record:
-                raise TopicDbError("Attempt to delete an association as if it were a topic")
-
-            sql = """SELECT identifier FROM topic WHERE map_identifier = ? AND
-            identifier IN
-                (SELECT association_identifier FROM member
-                WHERE map_identifier = ? AND (src_topic_ref = ? OR dest_topic_ref = ?))"""
-
-            cursor.execute(sql, (map_identifier, map_identifier, identifier, identifier))
-            records = cursor.fetchall()
-            for record in records:
-                self.delete_association(map_identifier, record["identifier"])
-            self.delete_occurrences(map_identifier, identifier)
-            self.delete_attributes(map_identifier, identifier)
-
-            with connection:
-                connection.execute(
-                    "DELETE FROM topic WHERE map_identifier = ? AND identifier = ?",
-                    (map_identifier, identifier),
-                )
+            with self._pool.writer() as connection:
+                cursor = connection.cursor()
+                if self._fetch_in_chunks(
+                    cursor,
+                    "SELECT identifier FROM topic WHERE map_identifier = ? AND identifier IN ({0}) AND scope IS NOT NULL",
+                    identifiers,
+                    (map_identifier,),
+                ):
+                    raise TopicDbError("Attempt to delete an association as if it were a topic")
+
+                association_identifiers: set[str] = set()
+                for column in ("src_topic_ref", "dest_topic_ref"):  # Each an index seek
+                    records = self._fetch_in_chunks(
+                        cursor,
+                        f"SELECT association_identifier FROM member WHERE map_identifier = ? AND {column} IN ({{0}})",
+                        identifiers,
+                        (map_identifier,),
+                    )
+                    association_identifiers.update(record["association_identifier"] for record in records)
+                self._delete_cascade(connection, map_identifier, identifiers + list(association_identifiers))
         except sqlite3.Error as error:
             raise TopicDbError(f"Error deleting topic: {error}")
-        finally:
-            cursor.close()
-            connection.close()
+
+    def _delete_cascade(self, connection: sqlite3.Connection, map_identifier: int, identifiers: list[str]) -> None:
+        # Deletes topics and/or associations, including everything that depends on them (base names, members,
+        # occurrences and the attributes of all of them), with a fixed number of set-based statements
+        records = self._fetch_in_chunks(
+            connection.cursor(),
+            "SELECT identifier FROM occurrence WHERE map_identifier = ? AND topic_identifier IN ({0})",
+            identifiers,
+            (map_identifier,),
+        )
+        occurrence_identifiers = [record["identifier"] for record in records]
+
+        self._execute_in_chunks(
+            connection,
+            "DELETE FROM attribute WHERE map_identifier = ? AND entity_identifier IN ({0})",
+            identifiers + occurrence_identifiers,
+            (map_identifier,),
+        )
+        for sql in (
+            "DELETE FROM occurrence WHERE map_identifier = ? AND topic_identifier IN ({0})",
+            "DELETE FROM member WHERE map_identifier = ? AND association_identifier IN ({0})",
+            "DELETE FROM basename WHERE map_identifier = ? AND topic_identifier IN ({0})",
+            "DELETE FROM topic WHERE map_identifier = ? AND identifier IN ({0})",
+        ):
+            self._execute_in_chunks(connection, sql, identifiers, (map_identifier,))
+        self._invalidate(map_identifier, *identifiers, *occurrence_identifiers)
+        self._forget_topics(map_identifier, *identifiers)
 
     def topic_exists(self, map_identifier: int, identifier: str) -> bool:
         result = False
 
-        connection = sqlite3.connect(self.database_path)
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -1004,13 +1975,63 @@ class TopicStore:
             raise TopicDbError(f"Error confirming existence of topic: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
+    def topics_exist(self, map_identifier: int, identifiers: Iterable[str]) -> set[str]:
+        # The identifiers (of the given ones) of the topics that exist, with one (chunked) query
+        result: set[str] = set()
+
+        identifiers = list(dict.fromkeys(identifiers))
+        if not identifiers:
+            return result
+
+        connection = self._pool.reader()
+        cursor = connection.cursor()
+        try:
+            records = self._fetch_in_chunks(
+                cursor,
+                "SELECT identifier FROM topic WHERE map_identifier = ? AND identifier IN ({0})",
+                identifiers,
+                (map_identifier,),
+            )
+            for record in records:
+                result.add(record["identifier"])
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error confirming existence of topics: {error}")
+        finally:
+            cursor.close()
+        return result
+
+    def _topics_exist(self, map_identifier: int, identifiers: Iterable[str]) -> set[str]:
+        # Used by the ontology 'STRICT' mode checks. Topics that are known to exist are looked up in the existence
+        # cache; only the remaining ones are queried. The first query for a map also warms the cache with the base
+        # topics, which are the ones that are nearly always referenced
+        identifiers = set(identifiers)
+        generation = self.get_map_generation(map_identifier)  # Read before the lookups that are cached with it
+        self._existence_cache.revalidate(map_identifier, generation)
+        result = self._existence_cache.known(map_identifier, identifiers)
+        unknown_identifiers = identifiers - result
+        if not unknown_identifiers:
+            return result
+        if not self._existence_cache.warmed(map_identifier):
+            unknown_identifiers.update(self.base_topics.keys())
+
+        epoch = self._existence_cache.epoch(map_identifier)
+        existing_identifiers = self.topics_exist(map_identifier, unknown_identifiers)
+
+        # Within a transaction, the topics may not have been committed yet
+        self._pool.call_after_commit(
+            lambda: self._existence_cache.add(map_identifier, existing_identifiers, epoch, generation)
+        )
+        return result | (existing_identifiers & identifiers)
+
+    def _topic_known(self, map_identifier: int, identifier: str) -> bool:
+        return identifier in self._topics_exist(map_identifier, (identifier,))
+
     def is_topic(self, map_identifier: int, identifier: str) -> bool:
         result = False
 
-        connection = sqlite3.connect(self.database_path)
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -1024,32 +2045,35 @@ class TopicStore:
             raise TopicDbError(f"Error confirming if entity is a topic: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     # endregion
 
     # region BaseName
+    @staticmethod
+    def _base_name_statement(map_identifier: int, identifier: str, base_name: BaseName) -> tuple[str, tuple]:
+        return (
+            "INSERT INTO basename (map_identifier, identifier, name, topic_identifier, scope, language) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                map_identifier,
+                base_name.identifier,
+                base_name.name,
+                identifier,
+                base_name.scope,
+                base_name.language.name.lower(),
+            ),
+        )
+
+    @_queued
     def create_base_name(self, map_identifier: int, identifier: str, base_name: BaseName) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
-                connection.execute(
-                    "INSERT INTO basename (map_identifier, identifier, name, topic_identifier, scope, language) VALUES (?, ?, ?, ?, ?, ?)",
-                    (
-                        map_identifier,
-                        base_name.identifier,
-                        base_name.name,
-                        identifier,
-                        base_name.scope,
-                        base_name.language.name.lower(),
-                    ),
-                )
+            with self._pool.writer() as connection:
+                connection.execute(*self._base_name_statement(map_identifier, identifier, base_name))
+                self._invalidate(map_identifier, identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error setting topic 'base name': {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def update_base_name(
         self,
         map_identifier: int,
@@ -1058,30 +2082,36 @@ class TopicStore:
         scope: str,
         language: Language = Language.ENG,
     ) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "UPDATE basename SET name = ?, scope = ?, language = ? WHERE map_identifier = ? AND identifier = ?",
                     (name, scope, language.name.lower(), map_identifier, identifier),
                 )
+                # Cached reads of the topic that filtered the base name out (by scope or language) don't depend on the
+                # base name's identifier, only on the topic's
+                topic_identifiers = [
+                    record["topic_identifier"]
+                    for record in connection.execute(
+                        "SELECT topic_identifier FROM basename WHERE map_identifier = ? AND identifier = ?",
+                        (map_identifier, identifier),
+                    )
+                ]
+                self._invalidate(map_identifier, identifier, *topic_identifiers)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error updating topic 'base name': {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def delete_base_name(self, map_identifier: int, identifier: str) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "DELETE FROM basename WHERE map_identifier = ? AND identifier = ?",
                     (map_identifier, identifier),
                 )
+                self._invalidate(map_identifier, identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error deleting topic 'base name': {error}")
-        finally:
-            connection.close()
 
     # endregion
 
@@ -1106,6 +2136,7 @@ class TopicStore:
         )
         return result
 
+    @_queued
     def create_association(
         self,
         map_identifier: int,
@@ -1113,66 +2144,164 @@ class TopicStore:
         ontology_mode: OntologyMode = OntologyMode.STRICT,
     ) -> None:
         if ontology_mode is OntologyMode.STRICT:
-            instance_of_exists = self.topic_exists(map_identifier, association.instance_of)
+            instance_of_exists = self._topic_known(map_identifier, association.instance_of)
             if not instance_of_exists:
                 raise TopicDbError("Ontology 'STRICT' mode violation: 'instance-of' topic does not exist")
 
-            scope_exists = self.topic_exists(map_identifier, association.scope)
+            scope_exists = self._topic_known(map_identifier, association.scope)
             if not scope_exists:
                 raise TopicDbError("Ontology 'STRICT' mode violation: 'scope' topic does not exist")
 
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
-                connection.execute(
-                    "INSERT INTO topic (map_identifier, identifier, instance_of, scope) VALUES (?, ?, ?, ?)",
-                    (
-                        map_identifier,
-                        association.identifier,
-                        association.instance_of,
-                        association.scope,
-                    ),
-                )
-                for base_name in association.base_names:
-                    connection.execute(
-                        "INSERT INTO basename (map_identifier, identifier, name, topic_identifier, scope, language) VALUES (?, ?, ?, ?, ?, ?)",
-                        (
-                            map_identifier,
-                            base_name.identifier,
-                            base_name.name,
+            with self._pool.writer() as connection:
+                for sql, bind_variables in self._association_statements(map_identifier, association):
+                    connection.execute(sql, bind_variables)
+                self._invalidate(map_identifier, association.identifier)
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error creating association: {error}")
+
+    def _association_statements(self, map_identifier: int, association: Association) -> list[tuple[str, tuple]]:
+        result = [
+            (
+                "INSERT INTO topic (map_identifier, identifier, instance_of, scope) VALUES (?, ?, ?, ?)",
+                (
+                    map_identifier,
+                    association.identifier,
+                    association.instance_of,
+                    association.scope,
+                ),
+            )
+        ]
+        for base_name in association.base_names:
+            result.append(self._base_name_statement(map_identifier, association.identifier, base_name))
+        result.append(
+            (
+                "INSERT INTO member (map_identifier, identifier, src_topic_ref, src_role_spec, dest_topic_ref, dest_role_spec, association_identifier) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    map_identifier,
+                    association.member.identifier,
+                    association.member.src_topic_ref,
+                    association.member.src_role_spec,
+                    association.member.dest_topic_ref,
+                    association.member.dest_role_spec,
+                    association.identifier,
+                ),
+            )
+        )
+        result.extend(self._attribute_statements(map_identifier, association, str(datetime.now())))
+        return result
+
+    @_queued
+    def create_associations(
+        self,
+        map_identifier: int,
+        associations: Iterable[Association],
+        ontology_mode: OntologyMode = OntologyMode.STRICT,
+    ) -> list[BatchFailure]:
+        result: list[BatchFailure] = []
+
+        associations = list(associations)
+        if ontology_mode is OntologyMode.STRICT:
+            referenced_identifiers = {association.instance_of for association in associations} | {
+                association.scope for association in associations
+            }
+            existing_identifiers = self._topics_exist(map_identifier, referenced_identifiers)
+            valid_associations = []
+            for association in associations:
+                if association.instance_of not in existing_identifiers:
+                    result.append(
+                        BatchFailure(
                             association.identifier,
-                            base_name.scope,
-                            base_name.language.name.lower(),
-                        ),
+                            "Ontology 'STRICT' mode violation: 'instance-of' topic does not exist",
+                        )
                     )
-                connection.execute(
-                    "INSERT INTO member (map_identifier, identifier, src_topic_ref, src_role_spec, dest_topic_ref, dest_role_spec, association_identifier) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        map_identifier,
-                        association.member.identifier,
-                        association.member.src_topic_ref,
-                        association.member.src_role_spec,
-                        association.member.dest_topic_ref,
-                        association.member.dest_role_spec,
-                        association.identifier,
-                    ),
-                )
-                if not association.get_attribute_by_name("creation-timestamp"):
-                    timestamp = str(datetime.now())
-                    timestamp_attribute = Attribute(
-                        "creation-timestamp",
-                        timestamp,
-                        association.identifier,
-                        data_type=DataType.TIMESTAMP,
-                        scope=UNIVERSAL_SCOPE,
-                        language=Language.ENG,
+                elif association.scope not in existing_identifiers:
+                    result.append(
+                        BatchFailure(
+                            association.identifier,
+                            "Ontology 'STRICT' mode violation: 'scope' topic does not exist",
+                        )
+                    )
+                else:
+                    valid_associations.append(association)
+            associations = valid_associations
+
+        try:
+            with self._pool.writer():
+                result.extend(
+                    self._write_batch(
+                        associations,
+                        lambda association: self._association_statements(map_identifier, association),
                     )
-                    association.add_attribute(timestamp_attribute)
+                )
+                self._invalidate(map_identifier, *(association.identifier for association in associations))
         except sqlite3.Error as error:
-            raise TopicDbError(f"Error creating association: {error}")
+            raise TopicDbError(f"Error creating associations: {error}")
+        return result
+
+    def _hydrate_associations(
+        self,
+        map_identifier: int,
+        identifiers: Iterable[str],
+        scope: str | None = None,
+        language: Language | None = None,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        resolve_occurrences: RetrievalMode = RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+    ) -> dict[str, Association]:
+        # Loads a set of associations (including their members) with one (chunked) query per table instead of one
+        # 'get_association' call per association. Associations that do not exist are absent from the result
+        result: dict[str, Association] = {}
+
+        identifiers = list(dict.fromkeys(identifiers))
+        if not identifiers:
+            return result
+
+        connection = self._pool.reader()
+        cursor = connection.cursor()
+        try:
+            records = self._fetch_in_chunks(
+                cursor,
+                """SELECT topic.identifier AS identifier, topic.instance_of AS instance_of, topic.scope AS scope,
+                member.identifier AS member_identifier,
+                member.src_topic_ref AS src_topic_ref, member.src_role_spec AS src_role_spec,
+                member.dest_topic_ref AS dest_topic_ref, member.dest_role_spec AS dest_role_spec
+                FROM topic
+                LEFT JOIN member ON member.map_identifier = topic.map_identifier AND
+                member.association_identifier = topic.identifier
+                WHERE topic.map_identifier = ? AND
+                topic.scope IS NOT NULL AND
+                topic.identifier IN ({0})""",
+                identifiers,
+                (map_identifier,),
+            )
+            for record in records:
+                if record["member_identifier"] is None:
+                    raise TopicDbError("Association member is missing")
+                association = Association.restore(
+                    identifier=record["identifier"],
+                    instance_of=record["instance_of"],
+                    scope=record["scope"],
+                )
+                association.member = Member.restore(
+                    src_topic_ref=record["src_topic_ref"],
+                    src_role_spec=record["src_role_spec"],
+                    dest_topic_ref=record["dest_topic_ref"],
+                    dest_role_spec=record["dest_role_spec"],
+                    identifier=record["member_identifier"],
+                )
+                result[record["identifier"]] = association
+
+            if result:
+                self._hydrate_base_names(cursor, map_identifier, result, scope=scope, language=language)
+                if resolve_attributes is RetrievalMode.RESOLVE_ATTRIBUTES:
+                    self._hydrate_attributes(cursor, map_identifier, result)
+                if resolve_occurrences is RetrievalMode.RESOLVE_OCCURRENCES:
+                    self._hydrate_occurrences(cursor, map_identifier, result)
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error retrieving associations: {error}")
         finally:
-            connection.close()
-        self.create_attributes(map_identifier, association.attributes)
+            cursor.close()
+        return result
 
     def get_association(
         self,
@@ -1182,11 +2311,28 @@ class TopicStore:
         language: Language | None = None,
         resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
         resolve_occurrences: RetrievalMode = RetrievalMode.DONT_RESOLVE_OCCURRENCES,
+    ) -> Association | None:
+        return self._cached(  # type: ignore
+            map_identifier,
+            ("association", map_identifier, identifier, scope, language, resolve_attributes, resolve_occurrences),
+            identifier,
+            lambda: self._load_association(
+                map_identifier, identifier, scope, language, resolve_attributes, resolve_occurrences
+            ),
+        )
+
+    def _load_association(
+        self,
+        map_identifier: int,
+        identifier: str,
+        scope: str | None = None,
+        language: Language | None = None,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        resolve_occurrences: RetrievalMode = RetrievalMode.DONT_RESOLVE_OCCURRENCES,
     ) -> Association | None:
         result = None
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -1195,12 +2341,11 @@ class TopicStore:
             )
             association_record = cursor.fetchone()
             if association_record:
-                result = Association(
+                result = Association.restore(
                     identifier=association_record["identifier"],
                     instance_of=association_record["instance_of"],
                     scope=association_record["scope"],
                 )
-                result.clear_base_names()
                 if scope:
                     if language:
                         sql = """SELECT name, scope, language, identifier
@@ -1245,7 +2390,7 @@ class TopicStore:
                 if base_name_records:
                     for base_name_record in base_name_records:
                         result.add_base_name(
-                            BaseName(
+                            BaseName.restore(
                                 base_name_record["name"],
                                 base_name_record["scope"],
                                 Language[base_name_record["language"].upper()],
@@ -1258,7 +2403,7 @@ class TopicStore:
                 )
                 member_record = cursor.fetchone()
                 if member_record:
-                    member = Member(
+                    member = Member.restore(
                         src_topic_ref=member_record["src_topic_ref"],
                         src_role_spec=member_record["src_role_spec"],
                         dest_topic_ref=member_record["dest_topic_ref"],
@@ -1277,7 +2422,6 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving association: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_association_groups(
@@ -1325,39 +2469,23 @@ class TopicStore:
         # TODO: Implementation
         return result
 
+    @_queued
     def delete_association(self, map_identifier: int, identifier: str) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            # https://docs.python.org/3/library/sqlite3.html#using-the-connection-as-a-context-manager
-            with connection:
-                # Delete association
-                connection.execute(
-                    "DELETE FROM topic WHERE map_identifier = ? AND identifier = ? AND scope IS NOT NULL",
-                    (map_identifier, identifier),
-                )
-
-                # Delete base name record(s)
-                connection.execute(
-                    "DELETE FROM basename WHERE map_identifier = ? AND topic_identifier = ?",
-                    (map_identifier, identifier),
-                )
-
-                # Delete members
-                connection.execute(
-                    "DELETE FROM member WHERE map_identifier = ? AND association_identifier = ?",
+            with self._pool.writer() as connection:
+                record = connection.execute(
+                    "SELECT identifier FROM topic WHERE map_identifier = ? AND identifier = ? AND scope IS NOT NULL",
                     (map_identifier, identifier),
-                )
+                ).fetchone()
+                if record:
+                    self._delete_cascade(connection, map_identifier, [identifier])
         except sqlite3.Error as error:
             raise TopicDbError(f"Error deleting association: {error}")
-        finally:
-            connection.close()
-
-        self.delete_occurrences(map_identifier, identifier)
-        self.delete_attributes(map_identifier, identifier)
 
     # endregion
 
     # region Occurrence
+    @_queued
     def create_occurrence(
         self,
         map_identifier: int,
@@ -1368,53 +2496,111 @@ class TopicStore:
             raise TopicDbError("Occurrence has an empty 'topic identifier' property")
 
         if ontology_mode is OntologyMode.STRICT:
-            instance_of_exists = self.topic_exists(map_identifier, occurrence.instance_of)
+            instance_of_exists = self._topic_known(map_identifier, occurrence.instance_of)
             if not instance_of_exists:
                 raise TopicDbError("Ontology 'STRICT' mode violation: 'instance-of' topic does not exist")
 
-            scope_exists = self.topic_exists(map_identifier, occurrence.scope)
+            scope_exists = self._topic_known(map_identifier, occurrence.scope)
             if not scope_exists:
                 raise TopicDbError("Ontology 'STRICT' mode violation: 'scope' topic does not exist")
 
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
-                resource_data = None
-                if occurrence.resource_data is not None:
-                    resource_data = (
-                        occurrence.resource_data
-                        if isinstance(occurrence.resource_data, bytes)
-                        else bytes(occurrence.resource_data, encoding="utf-8")
+            with self._pool.writer() as connection:
+                for sql, bind_variables in self._occurrence_statements(map_identifier, occurrence):
+                    connection.execute(sql, bind_variables)
+                self._invalidate(map_identifier, occurrence.identifier, occurrence.topic_identifier)
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error creating occurrence: {error}")
+
+    def _occurrence_statements(self, map_identifier: int, occurrence: Occurrence) -> list[tuple[str, tuple]]:
+        resource_data = None
+        if occurrence.resource_data is not None:
+            resource_data = (
+                occurrence.resource_data
+                if isinstance(occurrence.resource_data, bytes)
+                else bytes(occurrence.resource_data, encoding="utf-8")
+            )
+        result = [
+            (
+                "INSERT INTO occurrence (map_identifier, identifier, instance_of, scope, resource_ref, resource_data, topic_identifier, language) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    map_identifier,
+                    occurrence.identifier,
+                    occurrence.instance_of,
+                    occurrence.scope,
+                    occurrence.resource_ref,
+                    resource_data,  # Type: bytes
+                    occurrence.topic_identifier,
+                    occurrence.language.name.lower(),
+                ),
+            )
+        ]
+        result.extend(self._attribute_statements(map_identifier, occurrence, str(datetime.now())))
+        return result
+
+    @_queued
+    def create_occurrences(
+        self,
+        map_identifier: int,
+        occurrences: Iterable[Occurrence],
+        ontology_mode: OntologyMode = OntologyMode.STRICT,
+    ) -> list[BatchFailure]:
+        result: list[BatchFailure] = []
+
+        occurrences = list(occurrences)
+        existing_identifiers: set[str] = set()
+        if ontology_mode is OntologyMode.STRICT:
+            referenced_identifiers = {occurrence.instance_of for occurrence in occurrences} | {
+                occurrence.scope for occurrence in occurrences
+            }
+            existing_identifiers = self._topics_exist(map_identifier, referenced_identifiers)
+        valid_occurrences = []
+        for occurrence in occurrences:
+            if occurrence.topic_identifier == "":
+                result.append(
+                    BatchFailure(occurrence.identifier, "Occurrence has an empty 'topic identifier' property")
+                )
+            elif ontology_mode is OntologyMode.STRICT and occurrence.instance_of not in existing_identifiers:
+                result.append(
+                    BatchFailure(
+                        occurrence.identifier,
+                        "Ontology 'STRICT' mode violation: 'instance-of' topic does not exist",
+                    )
+                )
+            elif ontology_mode is OntologyMode.STRICT and occurrence.scope not in existing_identifiers:
+                result.append(
+                    BatchFailure(
+                        occurrence.identifier,
+                        "Ontology 'STRICT' mode violation: 'scope' topic does not exist",
+                    )
+                )
+            else:
+                valid_occurrences.append(occurrence)
+
+        try:
+            with self._pool.writer():
+                result.extend(
+                    self._write_batch(
+                        valid_occurrences,
+                        lambda occurrence: self._occurrence_statements(map_identifier, occurrence),
                     )
-                connection.execute(
-                    "INSERT INTO occurrence (map_identifier, identifier, instance_of, scope, resource_ref, resource_data, topic_identifier, language) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        map_identifier,
-                        occurrence.identifier,
-                        occurrence.instance_of,
-                        occurrence.scope,
-                        occurrence.resource_ref,
-                        resource_data,  # Type: bytes
-                        occurrence.topic_identifier,
-                        occurrence.language.name.lower(),
-                    ),
                 )
-            if not occurrence.get_attribute_by_name("creation-timestamp"):
-                timestamp = str(datetime.now())
-                timestamp_attribute = Attribute(
-                    "creation-timestamp",
-                    timestamp,
-                    occurrence.identifier,
-                    data_type=DataType.TIMESTAMP,
-                    scope=UNIVERSAL_SCOPE,
-                    language=Language.ENG,
+                self._invalidate(
+                    map_identifier,
+                    *(occurrence.identifier for occurrence in valid_occurrences),
+                    *(occurrence.topic_identifier for occurrence in valid_occurrences),
                 )
-                occurrence.add_attribute(timestamp_attribute)
         except sqlite3.Error as error:
-            raise TopicDbError(f"Error creating occurrence: {error}")
-        finally:
-            connection.close()
-        self.create_attributes(map_identifier, occurrence.attributes)
+            raise TopicDbError(f"Error creating occurrences: {error}")
+        return result
+
+    @staticmethod
+    def _occurrence_columns(inline_resource_data: RetrievalMode) -> str:
+        # Only read the (potentially very large) resource data when the caller asked for it
+        result = "identifier, instance_of, scope, resource_ref, topic_identifier, language"
+        if inline_resource_data is RetrievalMode.INLINE_RESOURCE_DATA:
+            result += ", resource_data"
+        return result
 
     def get_occurrence(
         self,
@@ -1425,20 +2611,19 @@ class TopicStore:
     ) -> Occurrence | None:
         result = None
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
-                "SELECT identifier, instance_of, scope, resource_ref, topic_identifier, language FROM occurrence WHERE map_identifier = ? AND identifier = ?",
+                f"SELECT {self._occurrence_columns(inline_resource_data)} FROM occurrence WHERE map_identifier = ? AND identifier = ?",
                 (map_identifier, identifier),
             )
             record = cursor.fetchone()
             if record:
                 resource_data = None
                 if inline_resource_data is RetrievalMode.INLINE_RESOURCE_DATA:
-                    resource_data = self.get_occurrence_data(map_identifier, identifier=identifier)
-                result = Occurrence(
+                    resource_data = record["resource_data"]
+                result = Occurrence.restore(
                     record["identifier"],
                     record["instance_of"],
                     record["topic_identifier"],
@@ -1453,14 +2638,12 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving occurrence: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_occurrence_data(self, map_identifier: int, identifier: str) -> bytes | None:
         result = None
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -1475,9 +2658,106 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving occurrence data: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
+    def get_occurrence_data_size(self, map_identifier: int, identifier: str) -> int | None:
+        result = None
+
+        connection = self._pool.reader()
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT length(resource_data) AS size FROM occurrence WHERE map_identifier = ? AND identifier = ?",
+                (map_identifier, identifier),
+            )
+            record = cursor.fetchone()
+            if record:
+                result = record["size"]
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error retrieving occurrence data size: {error}")
+        finally:
+            cursor.close()
+        return result
+
+    @contextmanager
+    def open_occurrence_data(
+        self, map_identifier: int, identifier: str, mode: str = "r", size: int | None = None
+    ) -> Iterator[sqlite3.Blob]:
+        # File-like access to an occurrence's resource data without loading it into memory as a whole. In read mode
+        # ('r') the blob supports 'read', 'seek' and 'tell' (for ranged reads). In write mode ('w') the resource data
+        # is replaced with 'size' zero bytes that are then overwritten, chunk by chunk, within the 'with' block
+        if not hasattr(sqlite3.Connection, "blobopen"):
+            raise TopicDbError("Streaming occurrence data requires Python 3.11 or later")
+        if mode not in ("r", "w"):
+            raise TopicDbError(f"Invalid occurrence data mode: {mode}")
+        if mode == "w" and size is None:
+            raise TopicDbError("Writing occurrence data requires its size")
+
+        try:
+            if mode == "r":
+                connection = self._pool.reader()
+                record = connection.execute(
+                    "SELECT rowid FROM occurrence WHERE map_identifier = ? AND identifier = ? AND resource_data IS NOT NULL",
+                    (map_identifier, identifier),
+                ).fetchone()
+                if record is None:
+                    raise TopicDbError("Occurrence data does not exist")
+                with connection.blobopen("occurrence", "resource_data", record["rowid"], readonly=True) as blob:
+                    yield blob
+            else:
+                with self._pool.writer() as connection:
+                    record = connection.execute(
+                        "SELECT rowid, instance_of FROM occurrence WHERE map_identifier = ? AND identifier = ?",
+                        (map_identifier, identifier),
+                    ).fetchone()
+                    if record is None:
+                        raise TopicDbError("Occurrence does not exist")
+                    connection.execute(
+                        "UPDATE occurrence SET resource_data = zeroblob(?) WHERE rowid = ?", (size, record["rowid"])
+                    )
+                    with connection.blobopen("occurrence", "resource_data", record["rowid"], readonly=False) as blob:
+                        yield blob
+                    if record["instance_of"] in ("note", "text"):
+                        # Writing to the blob bypasses the triggers that maintain the full-text index
+                        connection.execute(
+                            "UPDATE occurrence SET resource_data = resource_data WHERE rowid = ?", (record["rowid"],)
+                        )
+                    self._invalidate(map_identifier, identifier)
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error accessing occurrence data: {error}")
+
+    def iter_occurrence_data(
+        self,
+        map_identifier: int,
+        identifier: str,
+        offset: int = 0,
+        length: int | None = None,
+        chunk_size: int = BLOB_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        # Streams (a range of) the occurrence's resource data, for example, to answer an HTTP range request
+        with self.open_occurrence_data(map_identifier, identifier) as blob:
+            end = len(blob) if length is None else min(offset + length, len(blob))
+            blob.seek(offset)
+            while blob.tell() < end:
+                yield blob.read(min(chunk_size, end - blob.tell()))
+
+    @_queued
+    def write_occurrence_data(
+        self,
+        map_identifier: int,
+        identifier: str,
+        chunks: Iterable[bytes],
+        size: int,
+    ) -> None:
+        # Replaces the occurrence's resource data with the given chunks, for example, from a file upload
+        with self.open_occurrence_data(map_identifier, identifier, mode="w", size=size) as blob:
+            for chunk in chunks:
+                if blob.tell() + len(chunk) > size:
+                    raise TopicDbError("Occurrence data exceeds its size")
+                blob.write(chunk)
+            if blob.tell() != size:
+                raise TopicDbError("Occurrence data is shorter than its size")
+
     def get_occurrences(
         self,
         map_identifier: int,
@@ -1488,10 +2768,59 @@ class TopicStore:
         limit: int = 100,
         inline_resource_data: RetrievalMode = RetrievalMode.DONT_INLINE_RESOURCE_DATA,
         resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+    ) -> list[Occurrence]:
+        return self._get_occurrences(
+            map_identifier,
+            instance_of=instance_of,
+            scope=scope,
+            language=language,
+            offset=offset,
+            limit=limit,
+            inline_resource_data=inline_resource_data,
+            resolve_attributes=resolve_attributes,
+        )
+
+    def get_occurrences_page(
+        self,
+        map_identifier: int,
+        instance_of: str | None = None,
+        scope: str | None = None,
+        language: Language | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+        inline_resource_data: RetrievalMode = RetrievalMode.DONT_INLINE_RESOURCE_DATA,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+    ) -> Page:
+        after = self._decode_cursor(cursor, 2) if cursor else None
+        occurrences = self._get_occurrences(
+            map_identifier,
+            instance_of=instance_of,
+            scope=scope,
+            language=language,
+            limit=limit,
+            inline_resource_data=inline_resource_data,
+            resolve_attributes=resolve_attributes,
+            after=after,
+        )
+        return self._make_page(
+            occurrences, limit, lambda occurrence: (occurrence.topic_identifier, occurrence.identifier)
+        )
+
+    def _get_occurrences(
+        self,
+        map_identifier: int,
+        instance_of: str | None = None,
+        scope: str | None = None,
+        language: Language | None = None,
+        offset: int = 0,
+        limit: int = 100,
+        inline_resource_data: RetrievalMode = RetrievalMode.DONT_INLINE_RESOURCE_DATA,
+        resolve_attributes: RetrievalMode = RetrievalMode.DONT_RESOLVE_ATTRIBUTES,
+        after: tuple | None = None,
     ) -> list[Occurrence]:
         result: list[Occurrence] = []
 
-        sql = """SELECT * FROM occurrence
+        sql = """SELECT {1} FROM occurrence
             WHERE map_identifier = ?
             {0}
             ORDER BY topic_identifier, identifier
@@ -1505,12 +2834,10 @@ class TopicStore:
                         instance_of,
                         scope,
                         language.name.lower(),
-                        limit,
-                        offset,
                     )
                 else:
                     query_filter = " AND instance_of = ? AND scope = ?"
-                    bind_variables = (map_identifier, instance_of, scope, limit, offset)  # type: ignore
+                    bind_variables = (map_identifier, instance_of, scope)  # type: ignore
             else:
                 if language:
                     query_filter = " AND instance_of = ? AND language = ?"
@@ -1518,12 +2845,10 @@ class TopicStore:
                         map_identifier,
                         instance_of,
                         language.name.lower(),
-                        limit,
-                        offset,
                     )  # type: ignore
                 else:
                     query_filter = " AND instance_of = ?"
-                    bind_variables = (map_identifier, instance_of, limit, offset)  # type: ignore
+                    bind_variables = (map_identifier, instance_of)  # type: ignore
         else:
             if scope:
                 if language:
@@ -1532,36 +2857,35 @@ class TopicStore:
                         map_identifier,
                         scope,
                         language.name.lower(),
-                        limit,
-                        offset,
                     )  # type: ignore
                 else:
                     query_filter = " AND scope = ?"
-                    bind_variables = (map_identifier, scope, limit, offset)  # type: ignore
+                    bind_variables = (map_identifier, scope)  # type: ignore
             else:
                 if language:
                     query_filter = " AND language = ?"
                     bind_variables = (
                         map_identifier,
                         language.name.lower(),
-                        limit,
-                        offset,
                     )  # type: ignore
                 else:
                     query_filter = ""
-                    bind_variables = (map_identifier, limit, offset)  # type: ignore
+                    bind_variables = (map_identifier,)  # type: ignore
+        if after:
+            query_filter += " AND (topic_identifier, identifier) > (?, ?)"
+            bind_variables += after
+        bind_variables += (limit, offset)
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
-            cursor.execute(sql.format(query_filter), bind_variables)
+            cursor.execute(sql.format(query_filter, self._occurrence_columns(inline_resource_data)), bind_variables)
             records = cursor.fetchall()
             for record in records:
                 resource_data = None
                 if inline_resource_data is RetrievalMode.INLINE_RESOURCE_DATA:
-                    resource_data = self.get_occurrence_data(map_identifier, identifier=record["identifier"])
-                occurrence = Occurrence(
+                    resource_data = record["resource_data"]
+                occurrence = Occurrence.restore(
                     record["identifier"],
                     record["instance_of"],
                     record["topic_identifier"],
@@ -1570,93 +2894,157 @@ class TopicStore:
                     resource_data,  # Type: bytes
                     Language[record["language"].upper()],
                 )
-                if resolve_attributes is RetrievalMode.RESOLVE_ATTRIBUTES:
-                    occurrence.add_attributes(self.get_attributes(map_identifier, occurrence.identifier))
                 result.append(occurrence)
+            if resolve_attributes is RetrievalMode.RESOLVE_ATTRIBUTES:
+                occurrences = {occurrence.identifier: occurrence for occurrence in result}
+                self._hydrate_attributes(cursor, map_identifier, occurrences)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error retrieving occurrences: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
+    def search_occurrences(
+        self,
+        map_identifier: int,
+        query: str,
+        instance_ofs: list[str] | None = None,
+        scope: str | None = None,
+        language: Language | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        snippet_start: str = "<mark>",
+        snippet_end: str = "</mark>",
+        snippet_tokens: int = 16,
+    ) -> list[SearchResult]:
+        # Full-text search of the map's 'note' and 'text' occurrences using the FTS5 query syntax. Results are ordered
+        # by relevance (BM25, the lower the rank the better the match)
+        result: list[SearchResult] = []
+
+        sql = """SELECT occurrence.identifier AS identifier, occurrence.instance_of AS instance_of,
+            occurrence.scope AS scope, occurrence.resource_ref AS resource_ref,
+            occurrence.topic_identifier AS topic_identifier, occurrence.language AS language,
+            bm25(text) AS rank, snippet(text, 0, ?, ?, '...', ?) AS snippet
+            FROM text
+            JOIN text_occurrence ON text_occurrence.identifier = text.rowid
+            JOIN occurrence ON occurrence.map_identifier = text_occurrence.map_identifier
+            AND occurrence.identifier = text_occurrence.occurrence_identifier
+            WHERE text MATCH ? AND text_occurrence.map_identifier = ?
+            {0}
+            ORDER BY rank
+            LIMIT ? OFFSET ?"""
+        query_filter = ""
+        bind_variables: tuple = (snippet_start, snippet_end, snippet_tokens, query, map_identifier)
+        if instance_ofs:
+            query_filter += " AND occurrence.instance_of IN (" + ", ".join("?" * len(instance_ofs)) + ")"
+            bind_variables += tuple(instance_ofs)
+        if scope:
+            query_filter += " AND occurrence.scope = ?"
+            bind_variables += (scope,)
+        if language:
+            query_filter += " AND occurrence.language = ?"
+            bind_variables += (language.name.lower(),)
+        bind_variables += (limit, offset)
+
+        connection = self._pool.reader()
+        cursor = connection.cursor()
+        try:
+            cursor.execute(sql.format(query_filter), bind_variables)
+            records = cursor.fetchall()
+            for record in records:
+                occurrence = Occurrence.restore(
+                    record["identifier"],
+                    record["instance_of"],
+                    record["topic_identifier"],
+                    record["scope"],
+                    record["resource_ref"],
+                    None,
+                    Language[record["language"].upper()],
+                )
+                result.append(SearchResult(occurrence, record["rank"], record["snippet"]))
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error searching occurrences: {error}")
+        finally:
+            cursor.close()
+        return result
+
+    @_queued
     def update_occurrence_data(self, map_identifier: int, identifier: str, resource_data: str | bytes) -> None:
         resource_data = resource_data if isinstance(resource_data, bytes) else bytes(resource_data, encoding="utf-8")
 
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "UPDATE occurrence SET resource_data = ? WHERE map_identifier = ? AND identifier = ?",
                     (resource_data, map_identifier, identifier),
                 )
+                self._invalidate(map_identifier, identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error updating occurrence data: {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def update_occurrence_scope(self, map_identifier: int, identifier: str, scope: str) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "UPDATE occurrence SET scope = ? WHERE map_identifier = ? AND identifier = ?",
                     (scope, map_identifier, identifier),
                 )
+                # Cached reads of the topic's occurrences that filtered the occurrence out (by scope) don't depend on
+                # the occurrence's identifier, only on the topic's
+                topic_identifiers = [
+                    record["topic_identifier"]
+                    for record in connection.execute(
+                        "SELECT topic_identifier FROM occurrence WHERE map_identifier = ? AND identifier = ?",
+                        (map_identifier, identifier),
+                    )
+                ]
+                self._invalidate(map_identifier, identifier, *topic_identifiers)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error updating occurrence scope: {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def update_occurrence_topic_identifier(self, map_identifier: int, identifier: str, topic_identifier: str) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "UPDATE occurrence SET topic_identifier = ? WHERE map_identifier = ? AND identifier = ?",
                     (topic_identifier, map_identifier, identifier),
                 )
+                self._invalidate(map_identifier, identifier, topic_identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error updating occurrence topic identifier: {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def delete_occurrence(self, map_identifier: int, identifier: str) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "DELETE FROM occurrence WHERE map_identifier = ? AND identifier = ?",
                     (map_identifier, identifier),
                 )
+                self.delete_attributes(map_identifier, identifier)
+                self._invalidate(map_identifier, identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error deleting occurrence: {error}")
-        finally:
-            connection.close()
-        self.delete_attributes(map_identifier, identifier)
 
+    @_queued
     def delete_occurrences(self, map_identifier: int, topic_identifier: str) -> None:
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
-        cursor = connection.cursor()
         try:
-            cursor.execute(
-                "SELECT identifier FROM occurrence WHERE map_identifier = ? AND topic_identifier = ?",
-                (map_identifier, topic_identifier),
-            )
-            records = cursor.fetchall()
+            with self._pool.writer() as connection:
+                records = connection.execute(
+                    "SELECT identifier FROM occurrence WHERE map_identifier = ? AND topic_identifier = ?",
+                    (map_identifier, topic_identifier),
+                ).fetchall()
+                for record in records:
+                    self.delete_occurrence(map_identifier, record["identifier"])
         except sqlite3.Error as error:
             raise TopicDbError(f"Error deleting occurrences: {error}")
-        finally:
-            cursor.close()
-            connection.close()
-        for record in records:
-            self.delete_occurrence(map_identifier, record["identifier"])
 
     def occurrence_exists(self, map_identifier: int, identifier: str) -> bool:
         result = False
 
-        connection = sqlite3.connect(self.database_path)
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -1670,12 +3058,12 @@ class TopicStore:
             raise TopicDbError(f"Error confirming existence of occurrence: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     # endregion
 
     # region Attribute
+    @_queued
     def create_attribute(
         self,
         map_identifier: int,
@@ -1686,40 +3074,71 @@ class TopicStore:
             raise TopicDbError("Attribute has an empty 'entity identifier' property")
 
         if ontology_mode is OntologyMode.STRICT:
-            scope_exists = self.topic_exists(map_identifier, attribute.scope)
+            scope_exists = self._topic_known(map_identifier, attribute.scope)
             if not scope_exists:
                 raise TopicDbError("Ontology 'STRICT' mode violation: 'scope' topic does not exist")
 
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
-                connection.execute(
-                    "INSERT INTO attribute (map_identifier, identifier, entity_identifier, name, value, data_type, scope, language) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        map_identifier,
-                        attribute.identifier,
-                        attribute.entity_identifier,
-                        attribute.name,
-                        attribute.value,
-                        attribute.data_type.name.lower(),
-                        attribute.scope,
-                        attribute.language.name.lower(),
-                    ),
-                )
+            with self._pool.writer() as connection:
+                connection.execute(*self._attribute_statement(map_identifier, attribute))
+                self._invalidate(map_identifier, attribute.entity_identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error creating attribute: {error}")
-        finally:
-            connection.close()
 
-    def create_attributes(self, map_identifier: int, attributes: list[Attribute]) -> None:
+    @staticmethod
+    def _attribute_statement(map_identifier: int, attribute: Attribute) -> tuple[str, tuple]:
+        return (
+            "INSERT INTO attribute (map_identifier, identifier, entity_identifier, name, value, data_type, scope, language) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                map_identifier,
+                attribute.identifier,
+                attribute.entity_identifier,
+                attribute.name,
+                attribute.value,
+                attribute.data_type.name.lower(),
+                attribute.scope,
+                attribute.language.name.lower(),
+            ),
+        )
+
+    def _attribute_statements(self, map_identifier: int, entity: Entity, timestamp: str) -> list[tuple[str, tuple]]:
+        # The statements for a new entity's attributes, including a 'creation-timestamp' attribute unless the entity
+        # already has one
+        if not entity.get_attribute_by_name("creation-timestamp"):
+            timestamp_attribute = Attribute(
+                "creation-timestamp",
+                timestamp,
+                entity.identifier,
+                data_type=DataType.TIMESTAMP,
+                scope=UNIVERSAL_SCOPE,
+                language=Language.ENG,
+            )
+            entity.add_attribute(timestamp_attribute)
+        return [self._attribute_statement(map_identifier, attribute) for attribute in entity.attributes]
+
+    @_queued
+    def create_attributes(self, map_identifier: int, attributes: Iterable[Attribute]) -> None:
+        statements = []
+        entity_identifiers = set()
         for attribute in attributes:
-            self.create_attribute(map_identifier, attribute)    
+            if attribute.entity_identifier == "":
+                raise TopicDbError("Attribute has an empty 'entity identifier' property")
+            statements.append(self._attribute_statement(map_identifier, attribute))
+            entity_identifiers.add(attribute.entity_identifier)
+        if not statements:
+            return
+
+        try:
+            with self._pool.writer() as connection:
+                connection.executemany(statements[0][0], [bind_variables for _, bind_variables in statements])
+                self._invalidate(map_identifier, *entity_identifiers)
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error creating attributes: {error}")
 
     def get_attribute(self, map_identifier: int, identifier: str) -> Attribute | None:
         result = None
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -1728,7 +3147,7 @@ class TopicStore:
             )
             record = cursor.fetchone()
             if record:
-                result = Attribute(
+                result = Attribute.restore(
                     record["name"],
                     record["value"],
                     record["entity_identifier"],
@@ -1741,7 +3160,6 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving attribute: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_attributes(
@@ -1750,6 +3168,20 @@ class TopicStore:
         entity_identifier: str,
         scope: str | None = None,
         language: Language | None = None,
+    ) -> list[Attribute]:
+        return self._cached(  # type: ignore
+            map_identifier,
+            ("attributes", map_identifier, entity_identifier, scope, language),
+            entity_identifier,
+            lambda: self._load_attributes(map_identifier, entity_identifier, scope, language),
+        )
+
+    def _load_attributes(
+        self,
+        map_identifier: int,
+        entity_identifier: str,
+        scope: str | None = None,
+        language: Language | None = None,
     ) -> list[Attribute]:
         result: list[Attribute] = []
 
@@ -1789,14 +3221,13 @@ class TopicStore:
                     entity_identifier = ?"""
                 bind_variables = (map_identifier, entity_identifier)  # type: ignore
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(sql, bind_variables)
             records = cursor.fetchall()
             for record in records:
-                attribute = Attribute(
+                attribute = Attribute.restore(
                     record["name"],
                     record["value"],
                     record["entity_identifier"],
@@ -1810,52 +3241,48 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving attributes: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
+    @_queued
     def update_attribute_value(self, map_identifier: int, identifier: str, value: str) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "UPDATE attribute SET value = ? WHERE map_identifier = ? AND identifier = ?",
                     (value, map_identifier, identifier),
                 )
+                self._invalidate(map_identifier, identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error updating attribute value: {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def delete_attribute(self, map_identifier: int, identifier: str) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "DELETE FROM attribute WHERE map_identifier = ? AND identifier = ?",
                     (map_identifier, identifier),
                 )
+                self._invalidate(map_identifier, identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error deleting attribute: {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def delete_attributes(self, map_identifier: int, entity_identifier: str) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "DELETE FROM attribute WHERE map_identifier = ? AND entity_identifier = ?",
                     (map_identifier, entity_identifier),
                 )
+                self._invalidate(map_identifier, entity_identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error deleting attributes: {error}")
-        finally:
-            connection.close()
 
     def attribute_exists(self, map_identifier: int, entity_identifier: str, name: str) -> bool:
         result = False
 
-        connection = sqlite3.connect(self.database_path)
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -1869,29 +3296,41 @@ class TopicStore:
             raise TopicDbError(f"Error confirming existence of attribute: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     # endregion
 
     # region Tag
+    @_queued
     def create_tag(self, map_identifier: int, identifier: str, tag: str) -> None:
-        if not self.topic_exists(map_identifier, identifier):
-            identifier_topic = Topic(
-                identifier=identifier,
-                name=self._normalize_topic_name(identifier),
-                instance_of="topic",
-            )
-            self.create_topic(map_identifier, identifier_topic)
+        self.create_tags(map_identifier, identifier, [tag])
 
-        if not self.topic_exists(map_identifier, tag):
-            tag_topic = Topic(
-                identifier=tag,
-                name=self._normalize_topic_name(tag),
-                instance_of="tag",
-            )
-            self.create_topic(map_identifier, tag_topic)
+    @_queued
+    def create_tags(self, map_identifier: int, identifier: str, tags: list[str]) -> None:
+        with self.transaction():
+            # Whether the topic and the tags exist is checked with one query rather than one query per tag
+            existing_identifiers = self.topics_exist(map_identifier, [identifier, *tags])
+            if identifier not in existing_identifiers:
+                identifier_topic = Topic(
+                    identifier=identifier,
+                    name=self._normalize_topic_name(identifier),
+                    instance_of="topic",
+                )
+                self.create_topic(map_identifier, identifier_topic)
+                existing_identifiers.add(identifier)
+
+            for tag in tags:
+                if tag not in existing_identifiers:
+                    tag_topic = Topic(
+                        identifier=tag,
+                        name=self._normalize_topic_name(tag),
+                        instance_of="tag",
+                    )
+                    self.create_topic(map_identifier, tag_topic)
+                    existing_identifiers.add(tag)
+                self._create_tag_associations(map_identifier, identifier, tag)
 
+    def _create_tag_associations(self, map_identifier: int, identifier: str, tag: str) -> None:
         tag_association1 = Association(
             instance_of="categorization",
             src_topic_ref=identifier,
@@ -1909,43 +3348,85 @@ class TopicStore:
         self.create_association(map_identifier, tag_association1)
         self.create_association(map_identifier, tag_association2)
 
-    def create_tags(self, map_identifier: int, identifier: str, tags: list[str]) -> None:
-        for tag in tags:
-            self.create_tag(map_identifier, identifier, tag)
-
     def get_tags(self, map_identifier: int, identifier: str) -> list[str]:
         result: list[str] = []
 
         associations = self.get_topic_associations(map_identifier, identifier)
         if associations:
             groups = self.get_association_groups(map_identifier, identifier, associations=associations)
-            for instance_of in groups.dict:
-                for role in groups.dict[instance_of]:
-                    for topic_ref in groups[instance_of, role]:
-                        if topic_ref == identifier:
-                            continue
-                        if instance_of == "categorization":
-                            result.append(topic_ref)
+            result = self._tags(identifier, groups)
+        return result
+
+    @staticmethod
+    def _tags(identifier: str, groups: DoubleKeyDict) -> list[str]:
+        result: list[str] = []
+
+        for instance_of in groups.dict:
+            for role in groups.dict[instance_of]:
+                for topic_ref in groups[instance_of, role]:
+                    if topic_ref == identifier:
+                        continue
+                    if instance_of == "categorization":
+                        result.append(topic_ref)
         return result
 
     # endregion
 
     # region Database
+    @_queued
     def create_database(self):
         statements = DDL.split(";")
 
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 for statement in statements:
                     connection.execute(statement)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error creating database: {error}")
-        finally:
-            connection.close()
+        self.migrate_database()
+
+    def get_database_version(self) -> int:
+        connection = self._pool.reader()
+        try:
+            return connection.execute("PRAGMA user_version").fetchone()[0]
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error getting database version: {error}")
+
+    def _upgrade_database(self) -> None:
+        # A database that was created by an earlier version of the package is migrated when it is opened, as the write
+        # paths depend on the later migrations (the 'map_generation' table, for example). A database without a schema
+        # is left to 'create_database'
+        connection = self._pool.reader()
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            created = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'topic'"
+            ).fetchone()
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error getting database version: {error}")
+        if created and version < MIGRATIONS[-1][0]:
+            self.migrate_database()
+
+    @_queued
+    def migrate_database(self) -> int:
+        # Every migration runs in its own transaction, together with the version bump, so that an interrupted upgrade
+        # can simply be resumed. The version is re-read once the write lock is held in case another process got there
+        # first
+        for version, statements in MIGRATIONS:
+            try:
+                with self._pool.writer() as connection:
+                    if connection.execute("PRAGMA user_version").fetchone()[0] >= version:
+                        continue
+                    for statement in statements:
+                        connection.execute(statement)
+                    connection.execute(f"PRAGMA user_version = {version}")
+            except sqlite3.Error as error:
+                raise TopicDbError(f"Error migrating database to version {version}: {error}")
+        return self.get_database_version()
 
     # endregion
     # region Topic Map
+    @_queued
     def create_map(
         self,
         user_identifier: int,
@@ -1958,10 +3439,8 @@ class TopicStore:
     ) -> int:
         result = -1
 
-        connection = sqlite3.connect(self.database_path)
-        cursor = connection.cursor()
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "INSERT INTO map (name, description, image_path, initialised, published, promoted) VALUES (?, ?, ?, ?, ?, ?)",
                     (
@@ -1973,36 +3452,45 @@ class TopicStore:
                         promoted,
                     ),
                 )
-                cursor.execute("SELECT seq from sqlite_sequence WHERE name = 'map'")
-                result = cursor.fetchone()[0]
+                result = connection.execute("SELECT seq from sqlite_sequence WHERE name = 'map'").fetchone()[0]
                 connection.execute(
                     "INSERT INTO user_map (user_identifier, map_identifier, owner, collaboration_mode) VALUES (?, ?, ?, ?)",
                     (user_identifier, result, 1, CollaborationMode.EDIT.name.lower()),
                 )  # 1 = True
+                self._bump_generation(result)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error creating map: {error}")
-        finally:
-            cursor.close()
-            connection.close()
         return result
 
+    @_queued
     def populate_map(self, map_identifier: int, user_identifier: int) -> None:
         map = self.get_map(map_identifier, user_identifier)
 
         if map and not self.topic_exists(map_identifier, "home"):
-            for k, v in self.base_topics.items():
-                topic = Topic(
-                    identifier=k,
-                    instance_of="base-topic",
-                    name=v,
-                )
-                self.create_topic(map_identifier, topic, OntologyMode.LENIENT)
+            with self.transaction():
+                for k, v in self.base_topics.items():
+                    topic = Topic(
+                        identifier=k,
+                        instance_of="base-topic",
+                        name=v,
+                    )
+                    self.create_topic(map_identifier, topic, OntologyMode.LENIENT)
+
+    def get_map_generation(self, map_identifier: int) -> int:
+        # Monotonically increasing; changes with every committed write to the map. Suitable as an HTTP 'ETag'
+        connection = self._pool.reader()
+        try:
+            record = connection.execute(
+                "SELECT generation FROM map_generation WHERE map_identifier = ?", (map_identifier,)
+            ).fetchone()
+        except sqlite3.Error as error:
+            raise TopicDbError(f"Error retrieving map generation: {error}")
+        return record["generation"] if record else 0
 
     def get_map(self, map_identifier: int, user_identifier: int | None = None) -> Map | None:
         result = None
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         if user_identifier:
             sql = """SELECT
@@ -2040,7 +3528,6 @@ class TopicStore:
                 raise TopicDbError(f"Error retrieving map: {error}")
             finally:
                 cursor.close()
-                connection.close()
         else:
             try:
                 cursor.execute("SELECT * FROM map WHERE identifier = ?", (map_identifier,))
@@ -2062,7 +3549,6 @@ class TopicStore:
                 raise TopicDbError(f"Error retrieving map: {error}")
             finally:
                 cursor.close()
-                connection.close()
         return result
 
     def get_maps(
@@ -2070,11 +3556,29 @@ class TopicStore:
         user_identifier: int,
         offset: int = 0,
         limit: int = 100,
+    ) -> list[Map]:
+        return self._get_maps(user_identifier, offset=offset, limit=limit)
+
+    def get_maps_page(
+        self,
+        user_identifier: int,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> Page:
+        after = self._decode_cursor(cursor, 1) if cursor else None
+        maps = self._get_maps(user_identifier, limit=limit, after=after)
+        return self._make_page(maps, limit, lambda map: (map.identifier,))
+
+    def _get_maps(
+        self,
+        user_identifier: int,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple | None = None,
     ) -> list[Map]:
         result: list[Map] = []
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         sql = """SELECT
             map.identifier AS map_identifier,
@@ -2090,10 +3594,17 @@ class TopicStore:
             FROM map
             INNER JOIN user_map ON map.identifier = user_map.map_identifier
             WHERE user_map.user_identifier = ?
-            ORDER BY map_identifier
+            {0}
+            ORDER BY user_map.map_identifier
             LIMIT ? OFFSET ?"""
+        if after:
+            query_filter = " AND user_map.map_identifier > ?"
+            bind_variables = (user_identifier,) + after + (limit, offset)
+        else:
+            query_filter = ""
+            bind_variables = (user_identifier, limit, offset)
         try:
-            cursor.execute(sql, (user_identifier, limit, offset))
+            cursor.execute(sql.format(query_filter), bind_variables)
             records = cursor.fetchall()
             for record in records:
                 map = Map(
@@ -2113,14 +3624,12 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving maps: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_published_maps(self) -> list[Map]:
         result: list[Map] = []
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute("SELECT * FROM map WHERE published = 1 ORDER BY identifier")  # 1 = True
@@ -2143,14 +3652,12 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving published maps: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_promoted_maps(self) -> list[Map]:
         result: list[Map] = []
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute("SELECT * FROM map WHERE promoted = 1 ORDER BY identifier")  # 1 = True
@@ -2173,9 +3680,9 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving promoted maps: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
+    @_queued
     def update_map(
         self,
         map_identifier: int,
@@ -2186,9 +3693,8 @@ class TopicStore:
         published: bool = False,
         promoted: bool = False,
     ) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "UPDATE map SET name = ?, description = ?, image_path = ?, initialised = ?, published = ?, promoted = ? WHERE identifier = ?",
                     (
@@ -2201,21 +3707,18 @@ class TopicStore:
                         map_identifier,
                     ),
                 )
+                self._bump_generation(map_identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error updating map: {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def delete_map(self, map_identifier: int, user_identifier: int) -> None:
-        connection = sqlite3.connect(self.database_path)
-        cursor = connection.cursor()
         try:
-            with connection:
-                cursor.execute(
+            with self._pool.writer() as connection:
+                record = connection.execute(
                     "SELECT * FROM user_map WHERE user_identifier = ? AND map_identifier = ? AND owner = 1",  # 1 = True
                     (user_identifier, map_identifier),
-                )
-                record = cursor.fetchone()
+                ).fetchone()
                 if record:
                     connection.execute(
                         "DELETE FROM user_map WHERE map_identifier = ?",
@@ -2236,16 +3739,16 @@ class TopicStore:
                         (map_identifier,),
                     )
                     connection.execute("DELETE FROM topic WHERE map_identifier = ?", (map_identifier,))
+                    self._invalidate_map(map_identifier)
+                    connection.execute("DELETE FROM map_generation WHERE map_identifier = ?", (map_identifier,))
+                    self._forget_map(map_identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error deleting map: {error}")
-        finally:
-            cursor.close()
-            connection.close()
 
     def is_map_owner(self, map_identifier: int, user_identifier: int) -> bool:
         result = False
 
-        connection = sqlite3.connect(self.database_path)
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -2259,20 +3762,339 @@ class TopicStore:
             raise TopicDbError(f"Error confirming owner of map: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     # endregion
+    # region Export and Import
+    def export_map(
+        self,
+        map_identifier: int,
+        fp: IO[str],
+        include_resource_data: bool = True,
+        chunk_size: int = BLOB_CHUNK_SIZE,
+    ) -> None:
+        # Writes the map as newline-delimited JSON: a header line with the map's properties followed by one line per
+        # topic, base name, association (including its member), occurrence and attribute. Occurrence resource data
+        # follows its occurrence as base64-encoded chunks. Every table is streamed so memory use stays constant, and
+        # all of them are read in one read transaction so that the export is consistent
+        with self._pool.snapshot():  # All of the tables as of the same point in time
+            map = self.get_map(map_identifier)
+            if map is None:
+                raise TopicDbError("Map does not exist")
+
+            def write(record: dict) -> None:
+                fp.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+            write(
+                {
+                    "format": EXPORT_FORMAT,
+                    "version": EXPORT_VERSION,
+                    "map": {
+                        "name": map.name,
+                        "description": map.description,
+                        "image_path": map.image_path,
+                        "initialised": map.initialised,
+                        "published": map.published,
+                        "promoted": map.promoted,
+                    },
+                }
+            )
+            try:
+                for records in self._stream(
+                    "SELECT identifier, instance_of FROM topic WHERE map_identifier = ? AND scope IS NULL",
+                    (map_identifier,),
+                    STREAM_BATCH_SIZE,
+                ):
+                    for record in records:
+                        write(
+                            {"type": "topic", "identifier": record["identifier"], "instance_of": record["instance_of"]}
+                        )
+                for records in self._stream(
+                    """SELECT topic.identifier AS identifier, topic.instance_of AS instance_of, topic.scope AS scope,
+                    member.identifier AS member_identifier,
+                    member.src_topic_ref AS src_topic_ref, member.src_role_spec AS src_role_spec,
+                    member.dest_topic_ref AS dest_topic_ref, member.dest_role_spec AS dest_role_spec
+                    FROM topic
+                    JOIN member ON member.map_identifier = topic.map_identifier AND
+                    member.association_identifier = topic.identifier
+                    WHERE topic.map_identifier = ? AND topic.scope IS NOT NULL""",
+                    (map_identifier,),
+                    STREAM_BATCH_SIZE,
+                ):
+                    for record in records:
+                        write(
+                            {
+                                "type": "association",
+                                "identifier": record["identifier"],
+                                "instance_of": record["instance_of"],
+                                "scope": record["scope"],
+                                "member": {
+                                    "identifier": record["member_identifier"],
+                                    "src_topic_ref": record["src_topic_ref"],
+                                    "src_role_spec": record["src_role_spec"],
+                                    "dest_topic_ref": record["dest_topic_ref"],
+                                    "dest_role_spec": record["dest_role_spec"],
+                                },
+                            }
+                        )
+                for records in self._stream(
+                    "SELECT identifier, name, topic_identifier, scope, language FROM basename WHERE map_identifier = ?",
+                    (map_identifier,),
+                    STREAM_BATCH_SIZE,
+                ):
+                    for record in records:
+                        write({"type": "base_name", **dict(record)})
+                for records in self._stream(
+                    """SELECT rowid, identifier, instance_of, scope, resource_ref, topic_identifier, language,
+                    length(resource_data) AS resource_data_size
+                    FROM occurrence WHERE map_identifier = ?""",
+                    (map_identifier,),
+                    STREAM_BATCH_SIZE,
+                ):
+                    for record in records:
+                        occurrence = dict(record)
+                        rowid = occurrence.pop("rowid")
+                        if not include_resource_data:
+                            occurrence["resource_data_size"] = None
+                        write({"type": "occurrence", **occurrence})
+                        if occurrence["resource_data_size"]:
+                            for chunk in self._read_resource_data(rowid, occurrence["resource_data_size"], chunk_size):
+                                write({"type": "resource_data", "data": base64.b64encode(chunk).decode("ascii")})
+                for records in self._stream(
+                    """SELECT identifier, entity_identifier, name, value, data_type, scope, language
+                    FROM attribute WHERE map_identifier = ?""",
+                    (map_identifier,),
+                    STREAM_BATCH_SIZE,
+                ):
+                    for record in records:
+                        write({"type": "attribute", **dict(record)})
+            except sqlite3.Error as error:
+                raise TopicDbError(f"Error exporting map: {error}")
+
+    def _read_resource_data(self, rowid: int, size: int, chunk_size: int) -> Iterator[bytes]:
+        connection = self._pool.reader()
+        if hasattr(sqlite3.Connection, "blobopen"):
+            with connection.blobopen("occurrence", "resource_data", rowid, readonly=True) as blob:
+                while blob.tell() < size:
+                    yield blob.read(chunk_size)
+        else:
+            for offset in range(0, size, chunk_size):
+                yield connection.execute(
+                    "SELECT substr(resource_data, ?, ?) FROM occurrence WHERE rowid = ?",
+                    (offset + 1, chunk_size, rowid),
+                ).fetchone()[0]
+
+    @_queued
+    def import_map(
+        self,
+        fp: IO[str],
+        user_identifier: int,
+        map_identifier: int | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> int:
+        # Reads a map written by 'export_map'. The entities keep their identifiers but are remapped to a new map that
+        # is owned by the user (or, alternatively, to an existing map). Records are written with 'executemany' in
+        # batches of 'batch_size' records, so memory use stays constant. A new map is committed batch by batch (and
+        # deleted again if the import fails) whereas an import into an existing map is done in a single transaction
+        # so that a failure leaves the map as it was. Returns the map's identifier
+        try:
+            header = json.loads(fp.readline())
+        except ValueError:
+            raise TopicDbError("Invalid map export")
+        if not isinstance(header, dict) or header.get("format") != EXPORT_FORMAT:
+            raise TopicDbError("Invalid map export")
+        if header.get("version") != EXPORT_VERSION:
+            raise TopicDbError(f"Unsupported map export version: {header.get('version')}")
+        created = map_identifier is None
+        if map_identifier is None:
+            map = header.get("map")
+            if not isinstance(map, dict):
+                raise TopicDbError("Invalid map export")
+            map_identifier = self.create_map(
+                user_identifier,
+                str(map.get("name", "")),
+                description=map.get("description") or "",
+                image_path=map.get("image_path") or "",
+                initialised=bool(map.get("initialised")),
+                published=bool(map.get("published")),
+                promoted=bool(map.get("promoted")),
+            )
+
+        records = (json.loads(line) for line in fp if line.strip())
+        resource_data: dict = {}  # The occurrence whose resource data is being imported
+        try:
+            with nullcontext() if created else self._pool.writer():
+                while True:
+                    with self._pool.writer() as connection:
+                        statements: dict[str, list[tuple]] = {}
+                        count = 0
+                        for record in itertools.islice(records, batch_size):
+                            count += 1
+                            if record["type"] == "resource_data":
+                                self._flush_statements(connection, statements)
+                                self._import_resource_data(connection, map_identifier, resource_data, record)
+                            else:
+                                self._check_resource_data(resource_data)
+                                for sql, bind_variables in self._import_statements(map_identifier, record):
+                                    statements.setdefault(sql, []).append(bind_variables)
+                                if record["type"] == "occurrence":
+                                    resource_data = {
+                                        "identifier": record["identifier"],
+                                        "instance_of": record["instance_of"],
+                                        "size": record["resource_data_size"],
+                                        "offset": 0,
+                                        "rowid": None,
+                                    }
+                        if count < batch_size:  # End of the file
+                            self._check_resource_data(resource_data)
+                        self._flush_statements(connection, statements)
+                        self._invalidate_map(map_identifier)
+                    if count < batch_size:
+                        break
+        except (ValueError, KeyError, TypeError, sqlite3.Error) as error:
+            # Don't leave a partially imported map behind
+            if created:
+                self.delete_map(map_identifier, user_identifier)
+            if isinstance(error, sqlite3.Error):
+                raise TopicDbError(f"Error importing map: {error}")
+            raise TopicDbError(f"Invalid map export: {error}")
+        return map_identifier
+
+    @staticmethod
+    def _flush_statements(connection: sqlite3.Connection, statements: dict[str, list[tuple]]) -> None:
+        for sql, bind_variables_list in statements.items():
+            connection.executemany(sql, bind_variables_list)
+        statements.clear()
+
+    @staticmethod
+    def _import_statements(map_identifier: int, record: dict) -> list[tuple[str, tuple]]:
+        match record["type"]:
+            case "topic":
+                return [
+                    (
+                        "INSERT INTO topic (map_identifier, identifier, instance_of) VALUES (?, ?, ?)",
+                        (map_identifier, record["identifier"], record["instance_of"]),
+                    )
+                ]
+            case "association":
+                member = record["member"]
+                return [
+                    (
+                        "INSERT INTO topic (map_identifier, identifier, instance_of, scope) VALUES (?, ?, ?, ?)",
+                        (map_identifier, record["identifier"], record["instance_of"], record["scope"]),
+                    ),
+                    (
+                        "INSERT INTO member (map_identifier, identifier, association_identifier, src_topic_ref, src_role_spec, dest_topic_ref, dest_role_spec) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            map_identifier,
+                            member["identifier"],
+                            record["identifier"],
+                            member["src_topic_ref"],
+                            member["src_role_spec"],
+                            member["dest_topic_ref"],
+                            member["dest_role_spec"],
+                        ),
+                    ),
+                ]
+            case "base_name":
+                return [
+                    (
+                        "INSERT INTO basename (map_identifier, identifier, name, topic_identifier, scope, language) VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            map_identifier,
+                            record["identifier"],
+                            record["name"],
+                            record["topic_identifier"],
+                            record["scope"],
+                            record["language"],
+                        ),
+                    )
+                ]
+            case "occurrence":
+                # The resource data (if any) is written, chunk by chunk, over a zero-filled blob of the right size
+                return [
+                    (
+                        "INSERT INTO occurrence (map_identifier, identifier, instance_of, scope, resource_ref, resource_data, topic_identifier, language) VALUES (?, ?, ?, ?, ?, CASE WHEN ? IS NULL THEN NULL ELSE zeroblob(?) END, ?, ?)",
+                        (
+                            map_identifier,
+                            record["identifier"],
+                            record["instance_of"],
+                            record["scope"],
+                            record["resource_ref"],
+                            record["resource_data_size"],
+                            record["resource_data_size"],
+                            record["topic_identifier"],
+                            record["language"],
+                        ),
+                    )
+                ]
+            case "attribute":
+                return [
+                    (
+                        "INSERT INTO attribute (map_identifier, identifier, entity_identifier, name, value, data_type, scope, language) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            map_identifier,
+                            record["identifier"],
+                            record["entity_identifier"],
+                            record["name"],
+                            record["value"],
+                            record["data_type"],
+                            record["scope"],
+                            record["language"],
+                        ),
+                    )
+                ]
+        raise ValueError(f"unknown record type '{record['type']}'")
+
+    @staticmethod
+    def _check_resource_data(resource_data: dict) -> None:
+        # All of the previous occurrence's resource data has to have been imported
+        if resource_data and resource_data["size"] and resource_data["offset"] != resource_data["size"]:
+            raise ValueError("resource data is incomplete")
+
+    @staticmethod
+    def _import_resource_data(
+        connection: sqlite3.Connection, map_identifier: int, resource_data: dict, record: dict
+    ) -> None:
+        if not resource_data or not resource_data["size"]:
+            raise ValueError("resource data without an occurrence")
+        if resource_data["rowid"] is None:
+            resource_data["rowid"] = connection.execute(
+                "SELECT rowid FROM occurrence WHERE map_identifier = ? AND identifier = ?",
+                (map_identifier, resource_data["identifier"]),
+            ).fetchone()[0]
+        chunk = base64.b64decode(record["data"])
+        offset = resource_data["offset"]
+        if offset + len(chunk) > resource_data["size"]:
+            raise ValueError("resource data exceeds its size")
+        if hasattr(sqlite3.Connection, "blobopen"):
+            with connection.blobopen("occurrence", "resource_data", resource_data["rowid"], readonly=False) as blob:
+                blob.seek(offset)
+                blob.write(chunk)
+        else:
+            connection.execute(
+                "UPDATE occurrence SET resource_data = CAST(substr(resource_data, 1, ?) || ? || substr(resource_data, ?) AS BLOB) WHERE rowid = ?",
+                (offset, chunk, offset + len(chunk) + 1, resource_data["rowid"]),
+            )
+        resource_data["offset"] = offset + len(chunk)
+        if resource_data["offset"] == resource_data["size"] and resource_data["instance_of"] in ("note", "text"):
+            # Writing to the blob bypasses the triggers that maintain the full-text index
+            connection.execute(
+                "UPDATE occurrence SET resource_data = resource_data WHERE rowid = ?", (resource_data["rowid"],)
+            )
+
+    # endregion
+
     # region Collaboration
+    @_queued
     def collaborate(
         self,
         map_identifier: int,
         user_identifier: int,
         collaboration_mode: CollaborationMode = CollaborationMode.VIEW,
     ) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "INSERT INTO user_map (user_identifier, map_identifier, owner, collaboration_mode) VALUES (?, ?, 0, ?)",  # 0 = False
                     (
@@ -2281,15 +4103,14 @@ class TopicStore:
                         collaboration_mode.name.lower(),
                     ),
                 )
+                self._bump_generation(map_identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error enabling collaboration': {error}")
-        finally:
-            connection.close()
 
+    @_queued
     def stop_collaboration(self, map_identifier: int, user_identifier: int) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "DELETE FROM user_map WHERE user_identifier = ? AND map_identifier = ? AND owner = 0",  # 0 = False
                     (
@@ -2297,16 +4118,14 @@ class TopicStore:
                         map_identifier,
                     ),
                 )
+                self._bump_generation(map_identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error stopping collaboration': {error}")
-        finally:
-            connection.close()
 
     def get_collaborators(self, map_identifier: int) -> list[Collaborator]:
         result: list[Collaborator] = []
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         sql = """SELECT user_map.user_identifier, user_map.map_identifier, user_map.collaboration_mode, user.email AS user_name
             FROM user_map
@@ -2330,14 +4149,12 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving collaborators: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_collaborator(self, map_identifier: int, user_identifier: int) -> Collaborator | None:
         result = None
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         sql = """SELECT user_map.user_identifier, user_map.map_identifier, user_map.collaboration_mode, user.email AS user_name
             FROM user_map
@@ -2361,14 +4178,12 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving collaborator: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_collaboration_mode(self, map_identifier: int, user_identifier: int) -> CollaborationMode | None:
         result = None
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -2382,26 +4197,24 @@ class TopicStore:
             raise TopicDbError(f"Error retrieving collaboration mode: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
+    @_queued
     def update_collaboration_mode(
         self,
         map_identifier: int,
         user_identifier: int,
         collaboration_mode: CollaborationMode,
     ) -> None:
-        connection = sqlite3.connect(self.database_path)
         try:
-            with connection:
+            with self._pool.writer() as connection:
                 connection.execute(
                     "UPDATE user_map SET collaboration_mode = ? WHERE user_identifier = ? AND map_identifier = ?",
                     (collaboration_mode.name.lower(), user_identifier, map_identifier),
                 )
+                self._bump_generation(map_identifier)
         except sqlite3.Error as error:
             raise TopicDbError(f"Error updating collaboration mode': {error}")
-        finally:
-            connection.close()
 
     # endregion
     # region Statistics
@@ -2417,8 +4230,7 @@ class TopicStore:
             "text": 0,
         }
 
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             if scope:
@@ -2439,7 +4251,6 @@ class TopicStore:
             raise TopicDbError(f"Error compiling statistics: {error}")
         finally:
             cursor.close()
-            connection.close()
         return result
 
     def get_topics_count(
@@ -2448,8 +4259,7 @@ class TopicStore:
         filter_base_topics=RetrievalMode.DONT_FILTER_BASE_TOPICS,
     ) -> int:
         result = 0
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         match filter_base_topics:
             case RetrievalMode.FILTER_BASE_TOPICS:
@@ -2468,14 +4278,12 @@ class TopicStore:
             raise TopicDbError(f"Error fetching topics count: {error}")
         finally:
             cursor.close()
-            connection.close()
 
         return result
 
     def get_associations_count(self, map_identifier: int) -> int:
         result = 0
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -2489,7 +4297,6 @@ class TopicStore:
             raise TopicDbError(f"Error fetching associations count: {error}")
         finally:
             cursor.close()
-            connection.close()
 
         return result
 
@@ -2499,8 +4306,7 @@ class TopicStore:
         instance_of: str | None = None,
     ) -> int:
         result = 0
-        connection = sqlite3.connect(self.database_path)
-        connection.row_factory = sqlite3.Row
+        connection = self._pool.reader()
         cursor = connection.cursor()
         try:
             if instance_of:
@@ -2520,7 +4326,6 @@ class TopicStore:
             raise TopicDbError(f"Error fetching occurrences count: {error}")
         finally:
             cursor.close()
-            connection.close()
 
         return result
 
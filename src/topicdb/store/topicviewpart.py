@@ -0,0 +1,23 @@
+"""
+TopicViewPart enumeration. Part of the Contextualise (https://contextualise.dev) project.
+
+October 17, 2026
+Brett Alistair Kromkamp (brettkromkamp@gmail.com)
+"""
+
+from enum import Enum
+
+
+class TopicViewPart(Enum):
+    BASE_NAMES = 1
+    ATTRIBUTES = 2
+    OCCURRENCES = 3
+    OCCURRENCE_DATA = 4  # Occurrences including their resource data
+    OCCURRENCE_STATISTICS = 5
+    ASSOCIATIONS = 6
+    ASSOCIATION_GROUPS = 7
+    RELATED_TOPICS = 8
+    TAGS = 9
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,117 @@
+"""
+WriteQueue class. Part of the Contextualise (https://contextualise.dev) project.
+
+October 17, 2026
+Brett Alistair Kromkamp (brettkromkamp@gmail.com)
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from topicdb.store.connectionpool import ConnectionPool
+from topicdb.topicdberror import TopicDbError
+
+
+class WriteQueue:
+    # A single writer thread runs all submitted operations. Operations that are submitted within the same commit window
+    # are run in one transaction (group commit), each in its own savepoint so that a failing operation only undoes its
+    # own changes. The submitting threads block until the transaction has been committed (or rolled back).
+
+    def __init__(self, pool: ConnectionPool, commit_window: float = 0.005, max_batch_size: int = 256) -> None:
+        self.commit_window = commit_window
+        self.max_batch_size = max_batch_size
+
+        self.__pool = pool
+        self.__queue: queue.SimpleQueue[tuple[Callable[[], object], Future] | None] = queue.SimpleQueue()
+        self.__lock = threading.Lock()  # Guards 'closed' so that nothing is queued after the writer thread has stopped
+        self.__closed = False
+        self.__thread = threading.Thread(target=self._run, name="topicdb-write-queue", daemon=True)
+        self.__thread.start()
+
+    def submit(self, operation: Callable[[], object]) -> object:
+        future: Future = Future()
+        with self.__lock:
+            if self.__closed:
+                raise TopicDbError("Write queue is closed")
+            self.__queue.put((operation, future))
+        return future.result()
+
+    def close(self) -> None:
+        # Operations that have already been submitted are still run
+        with self.__lock:
+            if not self.__closed:
+                self.__closed = True
+                self.__queue.put(None)
+        self.__thread.join()
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        while True:
+            try:
+                item = self.__queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].set_exception(TopicDbError("Write queue is closed"))
+
+    def _next_batch(self) -> tuple[list[tuple[Callable[[], object], Future]], bool]:
+        item = self.__queue.get()
+        if item is None:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.commit_window
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self.__queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        try:
+            stopping = False
+            while not stopping:
+                batch, stopping = self._next_batch()
+                if batch:
+                    self._write(batch)
+        finally:
+            # Should the thread stop unexpectedly, the submitters that are still waiting get an error (rather than
+            # waiting forever) and later submissions are refused
+            with self.__lock:
+                self.__closed = True
+            self._fail_pending()
+
+    def _write(self, batch: list[tuple[Callable[[], object], Future]]) -> None:
+        outcomes: list[tuple[Future, object, BaseException | None]] = []
+        try:
+            with self.__pool.writer():
+                for operation, future in batch:
+                    try:
+                        with self.__pool.writer():
+                            outcomes.append((future, operation(), None))
+                    # Whatever an operation raises is re-raised in the thread that submitted it
+                    except Exception as error:  # noqa: BLE001
+                        outcomes.append((future, None, error))
+        except (sqlite3.Error, TopicDbError) as error:  # Failing to begin or commit the transaction
+            commit_error = TopicDbError(f"Error committing write batch: {error}")
+            for _, future in batch:
+                future.set_exception(commit_error)
+            return
+
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
@@ -0,0 +1,73 @@
+import asyncio
+import io
+import os
+import tempfile
+import threading
+import unittest
+
+from topicdb.models.occurrence import Occurrence
+from topicdb.models.topic import Topic
+from topicdb.store.asynctopicstore import AsyncTopicStore
+from topicdb.topicdberror import TopicDbError
+
+
+class TestAsyncTopicStore(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = AsyncTopicStore(os.path.join(self.directory.name, "test.db"), readers=2)
+        await self.store.create_database()
+        self.map_identifier = await self.store.create_map(1, "Test Map")
+        await self.store.populate_map(self.map_identifier, 1)
+
+    async def asyncTearDown(self):
+        await self.store.close()
+        self.directory.cleanup()
+
+    async def test_create_and_get_topic(self):
+        await self.store.create_topic(self.map_identifier, Topic("test-topic", name="Test Topic"))
+        topic = await self.store.get_topic(self.map_identifier, "test-topic")
+        self.assertEqual(topic.first_base_name.name, "Test Topic")
+        with self.assertRaises(TopicDbError):
+            await self.store.create_topic(self.map_identifier, Topic("test-topic"))
+
+    async def test_concurrent_queries(self):
+        results = await asyncio.gather(*(self.store.topic_exists(self.map_identifier, "home") for _ in range(10)))
+        self.assertTrue(all(results))
+
+    async def test_iter_topics(self):
+        topics = await self.store.get_topics(self.map_identifier, limit=1000)
+        identifiers = [topic.identifier async for topic in self.store.iter_topics(self.map_identifier, page_size=7)]
+        self.assertEqual(identifiers, [topic.identifier for topic in topics])
+        maps = [map async for map in self.store.iter_maps(1)]
+        self.assertEqual([map.identifier for map in maps], [self.map_identifier])
+
+    async def test_mutations_run_on_the_writer_thread(self):
+        threads = []
+        writer = self.store.store._pool.writer
+
+        def recording_writer():
+            threads.append(threading.current_thread().name)
+            return writer()
+
+        self.store.store._pool.writer = recording_writer
+        try:
+            await self.store.create_occurrence(self.map_identifier, Occurrence("occurrence-1", "image", "home"))
+            await self.store.write_occurrence_data(self.map_identifier, "occurrence-1", [b"data"], 4)
+            await self.store.migrate_database()
+            fp = io.StringIO()
+            await self.store.export_map(self.map_identifier, fp)
+            fp.seek(0)
+            await self.store.import_map(fp, 2)
+        finally:
+            del self.store.store._pool.writer
+        self.assertTrue(threads)
+        self.assertEqual(set(threads), {"topicdb-writer_0"})
+        self.assertEqual(await self.store.get_occurrence_data(self.map_identifier, "occurrence-1"), b"data")
+
+    async def test_synchronous_methods_are_not_available(self):
+        with self.assertRaises(AttributeError):
+            self.store.transaction()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -28,6 +28,14 @@ class TestAttribute(unittest.TestCase):
         self.assertEqual(self.attribute.scope, UNIVERSAL_SCOPE)
         self.assertEqual(self.attribute.language, Language.ENG)
 
+    def test_restore(self):
+        attribute = Attribute.restore(
+            "test_name", "test_value", "test-entity", "test-identifier", DataType.STRING, UNIVERSAL_SCOPE, Language.ENG
+        )
+        self.assertEqual(attribute.entity_identifier, "test-entity")
+        self.assertEqual(attribute.identifier, "test-identifier")
+        self.assertEqual(repr(attribute), repr(self.attribute))
+
     def test_entity_identifier_setter(self):
         self.attribute.entity_identifier = "new-entity"
         self.assertEqual(self.attribute.entity_identifier, "new-entity")
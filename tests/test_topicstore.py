@@ -0,0 +1,839 @@
+import gc
+import io
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from topicdb.constants import DDL, MIGRATIONS
+from topicdb.models.association import Association
+from topicdb.models.basename import BaseName
+from topicdb.models.language import Language
+from topicdb.models.occurrence import Occurrence
+from topicdb.models.topic import Topic
+from topicdb.store.ontologymode import OntologyMode
+from topicdb.store.retrievalmode import RetrievalMode
+from topicdb.store.topiccache import TopicCache
+from topicdb.store.topicproxy import BASE_NAMES
+from topicdb.store.topicstore import TopicStore
+from topicdb.store.topicviewpart import TopicViewPart
+from topicdb.store.writequeue import WriteQueue
+from topicdb.topicdberror import TopicDbError
+
+
+class TestTopicStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.directory.name, "test.db")
+        self.store = TopicStore(self.database_path)
+        self.store.create_database()
+        self.map_identifier = self.store.create_map(1, "Test Map")
+        self.store.populate_map(self.map_identifier, 1)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_create_and_get_topic(self):
+        self.store.create_topic(self.map_identifier, Topic("test-topic", name="Test Topic"))
+        topic = self.store.get_topic(self.map_identifier, "test-topic")
+        self.assertIsNotNone(topic)
+        self.assertEqual(topic.first_base_name.name, "Test Topic")
+
+    def test_transaction_commits_once(self):
+        with self.store.transaction():
+            self.store.create_topic(self.map_identifier, Topic("topic-1"))
+            self.store.create_topic(self.map_identifier, Topic("topic-2"))
+            self.assertTrue(self.store.topic_exists(self.map_identifier, "topic-1"))  # Sees its own writes
+
+            # Other connections don't see the uncommitted topics
+            with TopicStore(self.database_path) as store:
+                self.assertFalse(store.topic_exists(self.map_identifier, "topic-1"))
+        self.assertTrue(self.store.topic_exists(self.map_identifier, "topic-2"))
+
+    def test_transaction_rolls_back_on_error(self):
+        with self.assertRaises(TopicDbError), self.store.transaction():
+            self.store.create_topic(self.map_identifier, Topic("topic-1"))
+            self.store.create_topic(self.map_identifier, Topic("topic-1"))  # Duplicate identifier
+        self.assertFalse(self.store.topic_exists(self.map_identifier, "topic-1"))
+
+    def test_failed_nested_operation_is_undone(self):
+        with self.store.transaction():
+            self.store.create_topic(self.map_identifier, Topic("topic-1"))
+            topic = Topic("topic-2")
+            topic.add_base_name(BaseName("Name", identifier="duplicate"))
+            topic.add_base_name(BaseName("Name", identifier="duplicate"))
+            with self.assertRaises(TopicDbError):
+                self.store.create_topic(self.map_identifier, topic)  # Fails after inserting the topic row
+        self.assertTrue(self.store.topic_exists(self.map_identifier, "topic-1"))
+        self.assertFalse(self.store.topic_exists(self.map_identifier, "topic-2"))
+        self.assertEqual(len(self.store.get_attributes(self.map_identifier, "topic-1")), 1)
+
+    def test_create_topics(self):
+        topics = [
+            Topic("character", instance_of="topic"),
+            Topic("alice", instance_of="character"),  # 'instance-of' topic is part of the batch
+            Topic("bob", instance_of="missing"),
+            Topic("home"),  # Already exists
+        ]
+        failures = self.store.create_topics(self.map_identifier, topics)
+        self.assertEqual({failure.identifier for failure in failures}, {"bob", "home"})
+        self.assertTrue(self.store.topic_exists(self.map_identifier, "character"))
+        self.assertTrue(self.store.topic_exists(self.map_identifier, "alice"))
+        self.assertFalse(self.store.topic_exists(self.map_identifier, "bob"))
+        self.assertEqual(len(self.store.get_attributes(self.map_identifier, "alice")), 1)
+
+    def test_create_associations_and_occurrences(self):
+        self.store.create_topics(self.map_identifier, [Topic("alice"), Topic("bob")])
+        associations = [
+            Association(instance_of="related", src_topic_ref="alice", dest_topic_ref="bob"),
+            Association(instance_of="related", scope="missing", src_topic_ref="alice", dest_topic_ref="bob"),
+        ]
+        failures = self.store.create_associations(self.map_identifier, associations)
+        self.assertEqual([failure.identifier for failure in failures], [associations[1].identifier])
+        self.assertEqual(self.store.get_topic_associations_count(self.map_identifier, "alice"), 1)
+
+        occurrences = [
+            Occurrence(instance_of="note", topic_identifier="alice", resource_data="Hello"),
+            Occurrence(instance_of="note", resource_data="No topic"),
+        ]
+        failures = self.store.create_occurrences(self.map_identifier, occurrences)
+        self.assertEqual([failure.identifier for failure in failures], [occurrences[1].identifier])
+        self.assertEqual(self.store.get_occurrence_data(self.map_identifier, occurrences[0].identifier), b"Hello")
+
+    def test_get_topics_matches_get_topic(self):
+        topic = Topic("alice", name="Alice")
+        topic.add_base_name(BaseName("Alicia", language=Language.SPA))
+        self.store.create_topic(self.map_identifier, topic)
+
+        topics = self.store.get_topics(
+            self.map_identifier, language=Language.ENG, resolve_attributes=RetrievalMode.RESOLVE_ATTRIBUTES
+        )
+        self.assertEqual(len(topics), self.store.get_topics_count(self.map_identifier))
+        for topic in topics:
+            expected_topic = self.store.get_topic(
+                self.map_identifier,
+                topic.identifier,
+                language=Language.ENG,
+                resolve_attributes=RetrievalMode.RESOLVE_ATTRIBUTES,
+            )
+            self.assertEqual(topic.instance_of, expected_topic.instance_of)
+            self.assertEqual(
+                [base_name.name for base_name in topic.base_names],
+                [base_name.name for base_name in expected_topic.base_names],
+            )
+            self.assertEqual(
+                [attribute.identifier for attribute in topic.attributes],
+                [attribute.identifier for attribute in expected_topic.attributes],
+            )
+
+    def test_lazy_topics_load_once_per_page(self):
+        for index in range(3):
+            topic = Topic(f"lazy-{index}", name=f"Lazy {index}")
+            topic.add_occurrence(Occurrence(f"lazy-occurrence-{index}", "note", resource_ref="note.txt"))
+            self.store.create_topic(self.map_identifier, topic)
+            self.store.create_occurrences(self.map_identifier, topic.occurrences)
+
+        topics = self.store.get_topics(
+            self.map_identifier,
+            instance_of="topic",
+            resolve_attributes=RetrievalMode.RESOLVE_LAZILY,
+            resolve_occurrences=RetrievalMode.RESOLVE_LAZILY,
+        )
+        statements = []
+        self.store._pool.reader().set_trace_callback(statements.append)
+        try:
+            self.assertEqual([topic.first_base_name.name for topic in topics], ["Lazy 0", "Lazy 1", "Lazy 2"])
+            self.assertEqual([len(topic.occurrences) for topic in topics], [1, 1, 1])
+            self.assertEqual(topics[2].get_occurrence("lazy-occurrence-2").resource_ref, "note.txt")
+            self.assertTrue(all(topic.get_attribute_by_name("creation-timestamp") for topic in topics))
+        finally:
+            self.store._pool.reader().set_trace_callback(None)
+        self.assertEqual(len(statements), 3)  # Base names, occurrences and attributes: one query each for the page
+
+        topic = self.store.get_topic(self.map_identifier, "lazy-0", resolve_attributes=RetrievalMode.RESOLVE_LAZILY)
+        topic.add_base_name(BaseName("Perezoso", language=Language.SPA))
+        self.assertEqual([base_name.name for base_name in topic.base_names], ["Lazy 0", "Perezoso"])
+        self.assertEqual(topic.occurrences, [])  # Not resolved
+        copied_topic = pickle.loads(pickle.dumps(topic))
+        self.assertIs(type(copied_topic), Topic)
+        self.assertEqual(len(copied_topic.base_names), 2)
+
+    def test_lazy_topic_parts_are_only_set_once_loaded(self):
+        self.store.create_topic(self.map_identifier, Topic("lazy", name="Lazy"))
+        topic = self.store.get_topic(self.map_identifier, "lazy", resolve_attributes=RetrievalMode.RESOLVE_LAZILY)
+        hydrate_base_names = self.store._hydrate_base_names
+        loaded = []
+
+        def fail(cursor, map_identifier, topics, **kwargs):
+            hydrate_base_names(cursor, map_identifier, topics, **kwargs)
+            loaded.append(topic._has(BASE_NAMES))
+            raise sqlite3.OperationalError("disk I/O error")
+
+        self.store._hydrate_base_names = fail
+        with self.assertRaises(TopicDbError):
+            self.assertEqual(topic.base_names, [])
+        self.assertEqual(loaded, [False])  # Not even while the base names were being loaded
+        del self.store._hydrate_base_names
+        self.assertEqual([base_name.name for base_name in topic.base_names], ["Lazy"])
+
+    def test_load_topic_view(self):
+        topic = Topic("alice", name="Alice")
+        topic.add_occurrence(Occurrence("alice-note", "note", resource_data="Note"))
+        self.store.create_topic(self.map_identifier, topic)
+        self.store.create_occurrences(self.map_identifier, topic.occurrences)
+        self.store.create_topic(self.map_identifier, Topic("bob", name="Bob"))
+        self.store.create_association(
+            self.map_identifier, Association(identifier="alice-bob", src_topic_ref="alice", dest_topic_ref="bob")
+        )
+        self.store.create_tag(self.map_identifier, "alice", "friend")
+
+        view = self.store.load_topic_view(self.map_identifier, "alice")
+        self.assertEqual(view.topic.first_base_name.name, "Alice")
+        self.assertTrue(view.topic.get_attribute_by_name("creation-timestamp"))
+        self.assertEqual([occurrence.identifier for occurrence in view.topic.occurrences], ["alice-note"])
+        self.assertIsNone(view.topic.occurrences[0].resource_data)
+        self.assertEqual(
+            view.occurrences_statistics, self.store.get_topic_occurrences_statistics(self.map_identifier, "alice")
+        )
+        self.assertEqual(
+            [association.identifier for association in view.associations],
+            [association.identifier for association in self.store.get_topic_associations(self.map_identifier, "alice")],
+        )
+        self.assertEqual(
+            view.association_groups.dict, self.store.get_association_groups(self.map_identifier, "alice").dict
+        )
+        self.assertEqual(
+            [topic.identifier for topic in view.related_topics],
+            [topic.identifier for topic in self.store.get_related_topics(self.map_identifier, "alice")],
+        )
+        self.assertEqual(view.tags, ["friend"])
+
+        view = self.store.load_topic_view(
+            self.map_identifier, "alice", include=[TopicViewPart.OCCURRENCE_DATA, TopicViewPart.TAGS]
+        )
+        self.assertEqual(view.topic.base_names, [])
+        self.assertEqual(view.topic.occurrences[0].resource_data, b"Note")
+        self.assertIsNone(view.associations)
+        self.assertIsNone(view.related_topics)
+        self.assertEqual(view.tags, ["friend"])
+        self.assertIsNone(self.store.load_topic_view(self.map_identifier, "nobody"))
+
+    def test_batch_lookups(self):
+        self.store.create_topics(self.map_identifier, [Topic(f"topic-{index}") for index in range(1200)])
+        identifiers = [f"topic-{index}" for index in range(0, 1500, 3)]
+
+        self.assertEqual(
+            self.store.topics_exist(self.map_identifier, identifiers),
+            {identifier for identifier in identifiers if int(identifier.split("-")[1]) < 1200},
+        )
+        self.assertEqual(self.store.topics_exist(self.map_identifier, []), set())
+
+        topics = self.store.get_topics_by_identifiers(
+            self.map_identifier,
+            ["topic-7", "missing", "home", "topic-7"],
+            resolve_attributes=RetrievalMode.RESOLVE_ATTRIBUTES,
+        )
+        self.assertEqual(list(topics), ["topic-7", "home"])
+        self.assertEqual(topics["home"].first_base_name.name, "Home")
+        self.assertTrue(topics["topic-7"].get_attribute_by_name("creation-timestamp"))
+
+        self.store.create_tags(self.map_identifier, "topic-7", ["red", "green"])
+        self.store.create_tag(self.map_identifier, "new-topic", "red")
+        self.assertEqual(sorted(self.store.get_tags(self.map_identifier, "topic-7")), ["green", "red"])
+        self.assertEqual(self.store.get_tags(self.map_identifier, "new-topic"), ["red"])
+        self.assertEqual(self.store.get_topic(self.map_identifier, "red").instance_of, "tag")
+
+    def test_get_topic_associations_matches_get_association(self):
+        self.store.create_topics(self.map_identifier, [Topic("alice"), Topic("bob"), Topic("carol")])
+        self.store.create_association(
+            self.map_identifier, Association(instance_of="related", src_topic_ref="alice", dest_topic_ref="bob")
+        )
+        self.store.create_association(
+            self.map_identifier,
+            Association(instance_of="parent", src_topic_ref="carol", dest_topic_ref="alice", name="Parent"),
+        )
+
+        associations = self.store.get_topic_associations(
+            self.map_identifier, "alice", resolve_attributes=RetrievalMode.RESOLVE_ATTRIBUTES
+        )
+        self.assertEqual(len(associations), 2)
+        for association in associations:
+            expected_association = self.store.get_association(
+                self.map_identifier, association.identifier, resolve_attributes=RetrievalMode.RESOLVE_ATTRIBUTES
+            )
+            self.assertEqual(association.instance_of, expected_association.instance_of)
+            self.assertEqual(association.scope, expected_association.scope)
+            self.assertEqual(association.member.identifier, expected_association.member.identifier)
+            self.assertEqual(association.member.src_topic_ref, expected_association.member.src_topic_ref)
+            self.assertEqual(association.member.dest_topic_ref, expected_association.member.dest_topic_ref)
+            self.assertEqual(association.first_base_name.name, expected_association.first_base_name.name)
+            self.assertEqual(len(association.attributes), len(expected_association.attributes))
+
+        related_topics = self.store.get_related_topics(self.map_identifier, "alice")
+        self.assertEqual(sorted(topic.identifier for topic in related_topics), ["bob", "carol"])
+
+    def test_get_topics_network(self):
+        topics = [Topic(f"topic-{index}") for index in range(6)]
+        self.store.create_topics(self.map_identifier, topics)
+        self.store.create_associations(
+            self.map_identifier,
+            [
+                Association(identifier="a1", src_topic_ref="topic-0", dest_topic_ref="topic-1"),
+                Association(identifier="a2", src_topic_ref="topic-0", dest_topic_ref="topic-2"),
+                Association(identifier="a3", src_topic_ref="topic-1", dest_topic_ref="topic-2"),
+                Association(identifier="a4", src_topic_ref="topic-2", dest_topic_ref="topic-3"),
+                Association(identifier="a5", src_topic_ref="topic-3", dest_topic_ref="topic-4"),
+                Association(identifier="a6", src_topic_ref="topic-4", dest_topic_ref="topic-5"),
+            ],
+        )
+
+        tree = self.store.get_topics_network(self.map_identifier, "topic-0")
+        self.assertEqual(len(tree), 6)
+        self.assertEqual([edge.pointer for edge in tree["topic-0"].children], ["topic-1", "topic-2"])
+        self.assertEqual(tree["topic-3"].parent.pointer, "topic-2")
+        self.assertEqual(tree["topic-5"].payload["level"], 3)
+
+        tree = self.store.get_topics_network(self.map_identifier, "topic-0", maximum_depth=1)
+        self.assertEqual(sorted(tree.nodes.keys()), ["topic-0", "topic-1", "topic-2", "topic-3"])
+
+    def test_migrate_database(self):
+        latest_version = MIGRATIONS[-1][0]
+        self.assertEqual(self.store.get_database_version(), latest_version)
+        self.assertEqual(self.store.migrate_database(), latest_version)  # Nothing left to migrate
+
+        # An existing database, created before the migrations were introduced, is upgraded in place
+        connection = self.store._pool.reader()
+        connection.execute("DROP INDEX member_2_index")
+        connection.execute("PRAGMA user_version = 0")
+        self.assertEqual(self.store.migrate_database(), latest_version)
+        records = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+        index_names = {record["name"] for record in records}
+        self.assertTrue({"member_2_index", "member_3_index", "user_map_2_index"} <= index_names)
+
+        plan = connection.execute(
+            """EXPLAIN QUERY PLAN
+            SELECT association_identifier FROM member WHERE map_identifier = ? AND src_topic_ref = ?
+            UNION
+            SELECT association_identifier FROM member WHERE map_identifier = ? AND dest_topic_ref = ?""",
+            (self.map_identifier, "home", self.map_identifier, "home"),
+        ).fetchall()
+        details = " ".join(record["detail"] for record in plan)
+        self.assertIn("member_2_index", details)
+        self.assertIn("member_3_index", details)
+
+    def test_existing_database_is_migrated_when_opened(self):
+        # A database that was created before the migrations were introduced (at version 0)
+        database_path = os.path.join(self.directory.name, "existing.db")
+        connection = sqlite3.connect(database_path)
+        connection.executescript(DDL)
+        connection.close()
+
+        with TopicStore(database_path) as store:
+            self.assertEqual(store.get_database_version(), MIGRATIONS[-1][0])
+            map_identifier = store.create_map(1, "Existing Map")
+            store.create_topic(map_identifier, Topic("test-topic"), OntologyMode.LENIENT)
+            self.assertTrue(store.topic_exists(map_identifier, "test-topic"))
+            self.assertGreater(store.get_map_generation(map_identifier), 0)
+
+    def test_get_occurrences_resource_data(self):
+        self.store.create_occurrence(self.map_identifier, Occurrence("note-1", "note", "home", resource_data="Hello"))
+        occurrences = self.store.get_occurrences(
+            self.map_identifier, resolve_attributes=RetrievalMode.RESOLVE_ATTRIBUTES
+        )
+        self.assertIsNone(occurrences[0].resource_data)
+        self.assertEqual(len(occurrences[0].attributes), 1)
+
+        occurrences = self.store.get_occurrences(
+            self.map_identifier, inline_resource_data=RetrievalMode.INLINE_RESOURCE_DATA
+        )
+        self.assertEqual(occurrences[0].resource_data, b"Hello")
+        occurrences = self.store.get_topic_occurrences(
+            self.map_identifier, "home", inline_resource_data=RetrievalMode.INLINE_RESOURCE_DATA
+        )
+        self.assertEqual(occurrences[0].resource_data, b"Hello")
+        occurrence = self.store.get_occurrence(
+            self.map_identifier, "note-1", inline_resource_data=RetrievalMode.INLINE_RESOURCE_DATA
+        )
+        self.assertEqual(occurrence.resource_data, b"Hello")
+
+    def test_occurrence_data_streaming(self):
+        self.store.create_occurrence(self.map_identifier, Occurrence("video-1", "video", "home"))
+        data = bytes(range(256)) * 1000
+        chunks = [data[index : index + 4096] for index in range(0, len(data), 4096)]
+        self.store.write_occurrence_data(self.map_identifier, "video-1", chunks, len(data))
+
+        self.assertEqual(self.store.get_occurrence_data_size(self.map_identifier, "video-1"), len(data))
+        self.assertEqual(b"".join(self.store.iter_occurrence_data(self.map_identifier, "video-1")), data)
+        ranged_data = b"".join(
+            self.store.iter_occurrence_data(self.map_identifier, "video-1", offset=1000, length=5000, chunk_size=1024)
+        )
+        self.assertEqual(ranged_data, data[1000:6000])
+        with self.store.open_occurrence_data(self.map_identifier, "video-1") as blob:
+            blob.seek(-10, os.SEEK_END)
+            self.assertEqual(blob.read(), data[-10:])
+
+        with self.assertRaises(TopicDbError):
+            self.store.write_occurrence_data(self.map_identifier, "video-1", [b"too short"], 100)
+        self.assertEqual(self.store.get_occurrence_data(self.map_identifier, "video-1"), data)  # Rolled back
+
+        # Streamed notes are (re)indexed for full-text search
+        self.store.create_occurrence(self.map_identifier, Occurrence("note-1", "note", "home", resource_data="Old"))
+        self.store.write_occurrence_data(self.map_identifier, "note-1", [b"Streamed ", b"note"], 13)
+        results = self.store.search_occurrences(self.map_identifier, "streamed")
+        self.assertEqual([result.occurrence.identifier for result in results], ["note-1"])
+        self.assertEqual(self.store.search_occurrences(self.map_identifier, "old"), [])
+
+    def test_keyset_pagination(self):
+        self.store.create_topics(self.map_identifier, [Topic(f"topic-{index:02}") for index in range(25)])
+        self.store.create_occurrences(
+            self.map_identifier,
+            [Occurrence(topic_identifier=f"topic-{index % 5:02}", resource_data="Note") for index in range(12)],
+        )
+
+        def collect(get_page, **kwargs):
+            items, cursor = [], None
+            while True:
+                page = get_page(self.map_identifier, cursor=cursor, limit=7, **kwargs)
+                items.extend(page.items)
+                if page.cursor is None:
+                    return items
+                cursor = page.cursor
+
+        expected_topics = self.store.get_topics(self.map_identifier, limit=1000)
+        topics = collect(self.store.get_topics_page)
+        self.assertEqual([topic.identifier for topic in topics], [topic.identifier for topic in expected_topics])
+
+        expected_occurrences = self.store.get_occurrences(self.map_identifier, limit=1000)
+        occurrences = collect(self.store.get_occurrences_page)
+        self.assertEqual(
+            [occurrence.identifier for occurrence in occurrences],
+            [occurrence.identifier for occurrence in expected_occurrences],
+        )
+
+        self.assertEqual(
+            collect(self.store.get_topic_identifiers_page, query="topic-"),
+            self.store.get_topic_identifiers(self.map_identifier, "topic-", limit=1000),
+        )
+        self.assertEqual(
+            collect(self.store.get_topic_names_page), self.store.get_topic_names(self.map_identifier, limit=1000)
+        )
+
+        with self.assertRaises(TopicDbError):
+            self.store.get_topics_page(self.map_identifier, cursor="not-a-cursor")
+
+    def test_topic_names_pagination_with_duplicate_names(self):
+        topic = Topic("a", name="Same")
+        topic.add_base_name(BaseName("Same"))
+        self.store.create_topics(self.map_identifier, [topic, Topic("b", name="Same")])
+
+        names, cursor = [], None
+        while True:
+            page = self.store.get_topic_names_page(self.map_identifier, cursor=cursor, limit=1)
+            names.extend(page.items)
+            if page.cursor is None:
+                break
+            cursor = page.cursor
+        self.assertEqual(names, self.store.get_topic_names(self.map_identifier, limit=1000))
+        self.assertEqual(names.count(("Same", "a")), 2)
+
+    def test_topic_lists_are_read_from_one_snapshot(self):
+        with TopicStore(self.database_path, profile="web") as store, TopicStore(self.database_path) as other_store:
+            hydrate_topics = store._hydrate_topics
+
+            def delete_topic_first(map_identifier, identifiers, **kwargs):
+                if "test-topic" in identifiers:  # Deleted between the identifier query and the hydration
+                    other_store.delete_topic(map_identifier, "test-topic")
+                return hydrate_topics(map_identifier, identifiers, **kwargs)
+
+            store._hydrate_topics = delete_topic_first
+            store.create_topic(self.map_identifier, Topic("test-topic"))
+            topics = store.get_topics(self.map_identifier, limit=1000)
+            self.assertIn("test-topic", [topic.identifier for topic in topics])
+            self.assertFalse(store.topic_exists(self.map_identifier, "test-topic"))
+
+    def test_search_occurrences(self):
+        self.store.create_topics(self.map_identifier, [Topic("alice"), Topic("bob")])
+        self.store.create_occurrences(
+            self.map_identifier,
+            [
+                Occurrence("note-1", "note", "alice", resource_data="The quick brown fox jumps over the lazy dog"),
+                Occurrence("note-2", "note", "bob", resource_data="A fox, a fox, a fox in the henhouse"),
+                Occurrence("text-1", "text", "bob", resource_data="Nothing to see here"),
+                Occurrence("url-1", "url", "bob", resource_ref="https://example.com/fox"),
+            ],
+        )
+        results = self.store.search_occurrences(self.map_identifier, "fox")
+        self.assertEqual([result.occurrence.identifier for result in results], ["note-2", "note-1"])
+        self.assertIn("<mark>fox</mark>", results[0].snippet)
+        self.assertEqual(results[0].occurrence.topic_identifier, "bob")
+
+        self.store.update_occurrence_data(self.map_identifier, "text-1", "Foxes everywhere")  # Porter stemming
+        self.store.delete_occurrence(self.map_identifier, "note-2")
+        results = self.store.search_occurrences(self.map_identifier, "fox")
+        self.assertEqual([result.occurrence.identifier for result in results], ["text-1", "note-1"])
+        results = self.store.search_occurrences(self.map_identifier, "fox", instance_ofs=["text"])
+        self.assertEqual([result.occurrence.identifier for result in results], ["text-1"])
+
+        with self.assertRaises(TopicDbError):
+            self.store.search_occurrences(self.map_identifier, '"unbalanced')
+
+        self.store.delete_map(self.map_identifier, 1)
+        connection = self.store._pool.reader()
+        self.assertEqual(connection.execute("SELECT COUNT(*) FROM text").fetchone()[0], 0)
+        self.assertEqual(connection.execute("SELECT COUNT(*) FROM text_occurrence").fetchone()[0], 0)
+
+    def test_search_occurrences_indexes_existing_occurrences(self):
+        self.store.create_occurrence(
+            self.map_identifier, Occurrence("note-1", "note", "home", resource_data="Existing note")
+        )
+        connection = self.store._pool.reader()
+        connection.execute("DELETE FROM text")
+        connection.execute("DELETE FROM text_occurrence")
+        connection.execute("PRAGMA user_version = 3")
+        connection.commit()
+        self.store.migrate_database()
+        results = self.store.search_occurrences(self.map_identifier, "existing")
+        self.assertEqual([result.occurrence.identifier for result in results], ["note-1"])
+
+    def test_cached_topic_is_invalidated_by_writes(self):
+        cache = TopicCache()
+        with TopicStore(self.database_path, cache=cache) as store:
+            store.create_topic(self.map_identifier, Topic("test-topic", name="Test Topic"))
+            store.get_topic(self.map_identifier, "test-topic")
+            topic = store.get_topic(self.map_identifier, "test-topic")
+            self.assertEqual(cache.statistics.hits, 1)
+            self.assertEqual(cache.statistics.misses, 1)
+
+            topic.first_base_name.name = "Changed"  # Callers get their own copy
+            self.assertEqual(store.get_topic(self.map_identifier, "test-topic").first_base_name.name, "Test Topic")
+
+            store.update_base_name(self.map_identifier, topic.first_base_name.identifier, "Renamed", "*")
+            self.assertEqual(store.get_topic(self.map_identifier, "test-topic").first_base_name.name, "Renamed")
+
+            store.update_topic_identifier(self.map_identifier, "test-topic", "renamed-topic")
+            self.assertIsNone(store.get_topic(self.map_identifier, "test-topic"))
+
+    def test_cached_scoped_reads_are_invalidated_by_scope_changes(self):
+        cache = TopicCache()
+        with TopicStore(self.database_path, cache=cache) as store:
+            topic = Topic("alice", name="Alice")
+            store.create_topic(self.map_identifier, topic)
+            store.create_occurrence(self.map_identifier, Occurrence("alice-note", "note", "alice"))
+            self.assertEqual(store.get_topic(self.map_identifier, "alice", scope="note").base_names, [])
+            self.assertEqual(store.get_topic_occurrences(self.map_identifier, "alice", scope="note"), [])
+
+            store.update_base_name(self.map_identifier, topic.first_base_name.identifier, "Alice N", "note")
+            base_names = store.get_topic(self.map_identifier, "alice", scope="note").base_names
+            self.assertEqual([base_name.name for base_name in base_names], ["Alice N"])
+            store.update_occurrence_scope(self.map_identifier, "alice-note", "note")
+            self.assertEqual(len(store.get_topic_occurrences(self.map_identifier, "alice", scope="note")), 1)
+
+    def test_cache_is_bounded(self):
+        cache = TopicCache(max_entries=2)
+        with TopicStore(self.database_path, cache=cache) as store:
+            for identifier in ("home", "person", "place"):
+                store.get_topic(self.map_identifier, identifier)
+            self.assertEqual(cache.statistics.entries, 2)
+            store.get_topic(self.map_identifier, "home")  # Evicted
+            self.assertEqual(cache.statistics.hits, 0)
+
+    def test_cache_is_invalidated_after_transaction(self):
+        cache = TopicCache()
+        with TopicStore(self.database_path, cache=cache) as store:
+            store.get_topic_occurrences(self.map_identifier, "home")
+            with store.transaction():
+                store.create_occurrence(self.map_identifier, Occurrence("occurrence-1", "note", "home"))
+                self.assertEqual(len(store.get_topic_occurrences(self.map_identifier, "home")), 1)
+            self.assertEqual(len(store.get_topic_occurrences(self.map_identifier, "home")), 1)
+
+    def test_map_generation_is_bumped_by_writes(self):
+        generation = self.store.get_map_generation(self.map_identifier)
+        self.assertGreater(generation, 0)
+        self.store.create_topic(self.map_identifier, Topic("test-topic"))
+        self.assertGreater(self.store.get_map_generation(self.map_identifier), generation)
+
+        generation = self.store.get_map_generation(self.map_identifier)
+        with self.assertRaises(TopicDbError), self.store.transaction():
+            self.store.create_topic(self.map_identifier, Topic("topic-1"))
+            self.store.create_topic(self.map_identifier, Topic("test-topic"))  # Duplicate identifier
+        self.assertEqual(self.store.get_map_generation(self.map_identifier), generation)
+
+    def test_map_generation_is_bumped_once_per_write(self):
+        generation = self.store.get_map_generation(self.map_identifier)
+        self.store.create_topics(self.map_identifier, [Topic(f"topic-{index}") for index in range(50)])
+        self.assertEqual(self.store.get_map_generation(self.map_identifier), generation + 1)
+
+        connection = self.store._pool.reader()
+        triggers = connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%generation%'"
+        )
+        self.assertIsNone(triggers.fetchone())
+
+    def test_delete_map_deletes_its_generation(self):
+        self.store.delete_map(self.map_identifier, 1)
+        connection = self.store._pool.reader()
+        row = connection.execute("SELECT * FROM map_generation WHERE map_identifier = ?", (self.map_identifier,))
+        self.assertIsNone(row.fetchone())
+
+    def test_memoize_is_keyed_on_map_generation(self):
+        calls = []
+
+        @self.store.memoize()
+        def test_topic_exists(map_identifier):
+            calls.append(map_identifier)
+            return self.store.topic_exists(map_identifier, "test-topic")
+
+        self.assertFalse(test_topic_exists(self.map_identifier))
+        self.assertFalse(test_topic_exists(self.map_identifier))
+        self.assertEqual(len(calls), 1)
+        with TopicStore(self.database_path) as store:  # A write through another connection
+            store.create_topic(self.map_identifier, Topic("test-topic"))
+        self.assertTrue(test_topic_exists(self.map_identifier))
+        self.assertEqual(len(calls), 2)
+
+    def test_ontology_checks_see_deleted_and_rolled_back_topics(self):
+        self.store.create_topic(self.map_identifier, Topic("person"))
+        self.store.create_topic(self.map_identifier, Topic("test-topic", instance_of="person"))
+        self.store.delete_topic(self.map_identifier, "person")
+        with self.assertRaises(TopicDbError):
+            self.store.create_topic(self.map_identifier, Topic("topic-1", instance_of="person"))
+
+        with self.assertRaises(TopicDbError), self.store.transaction():
+            self.store.create_topic(self.map_identifier, Topic("place"))
+            self.store.create_topic(self.map_identifier, Topic("topic-2", instance_of="place"))
+            self.store.create_topic(self.map_identifier, Topic("topic-2"))  # Duplicate identifier
+        with self.assertRaises(TopicDbError):
+            self.store.create_topic(self.map_identifier, Topic("topic-3", instance_of="place"))
+
+    def test_ontology_checks_see_topics_deleted_by_other_connections(self):
+        self.store.create_topic(self.map_identifier, Topic("person"))
+        self.store.create_topic(self.map_identifier, Topic("test-topic", instance_of="person"))  # Cached as existing
+        with TopicStore(self.database_path) as store:
+            store.delete_topic(self.map_identifier, "person")
+        with self.assertRaises(TopicDbError):
+            self.store.create_topic(self.map_identifier, Topic("topic-1", instance_of="person"))
+
+    def test_write_queue_group_commit(self):
+        with TopicStore(self.database_path, write_queue=True) as store:
+            errors = []
+
+            def create_topic(identifier):
+                try:
+                    store.create_topic(self.map_identifier, Topic(identifier))
+                except TopicDbError as error:
+                    errors.append(error)
+
+            threads = [threading.Thread(target=create_topic, args=(f"topic-{index}",)) for index in range(20)]
+            threads.append(threading.Thread(target=create_topic, args=("topic-0",)))  # Duplicate identifier
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(errors), 1)
+            for index in range(20):
+                self.assertTrue(store.topic_exists(self.map_identifier, f"topic-{index}"))
+            with self.assertRaises(TopicDbError):
+                store.create_topic(self.map_identifier, Topic("topic-21", instance_of="unknown"))
+
+    def test_write_queue_refuses_operations_once_closed(self):
+        write_queue = WriteQueue(self.store._pool, commit_window=0)
+        outcomes = []
+
+        def submit():
+            try:
+                outcomes.append(write_queue.submit(lambda: True))
+            except TopicDbError:
+                outcomes.append(False)
+
+        threads = [threading.Thread(target=submit) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        write_queue.close()
+        for thread in threads:
+            thread.join(timeout=5)
+            self.assertFalse(thread.is_alive())  # No submitter is left waiting
+        self.assertEqual(len(outcomes), 50)
+        with self.assertRaises(TopicDbError):
+            write_queue.submit(lambda: True)
+
+    def test_iter_methods_stream_in_batches(self):
+        topics = self.store.get_topics(self.map_identifier, limit=1000)
+        streamed_topics = list(self.store.iter_topics(self.map_identifier, batch_size=7))
+        self.assertEqual([topic.identifier for topic in streamed_topics], [topic.identifier for topic in topics])
+
+        self.store.create_topic(self.map_identifier, Topic("test-topic"))
+        self.store.create_association(
+            self.map_identifier,
+            Association(
+                identifier="association-1",
+                src_topic_ref="home",
+                dest_topic_ref="test-topic",
+            ),
+        )
+        associations = list(self.store.iter_associations(self.map_identifier, batch_size=1))
+        self.assertEqual([association.identifier for association in associations], ["association-1"])
+        self.assertEqual(associations[0].member.dest_topic_ref, "test-topic")
+
+        for index in range(5):
+            self.store.create_occurrence(
+                self.map_identifier, Occurrence(f"occurrence-{index}", "note", "home", resource_data="Note")
+            )
+        occurrences = list(
+            self.store.iter_occurrences(
+                self.map_identifier,
+                instance_of="note",
+                inline_resource_data=RetrievalMode.INLINE_RESOURCE_DATA,
+                batch_size=2,
+            )
+        )
+        self.assertEqual([occurrence.identifier for occurrence in occurrences], [f"occurrence-{i}" for i in range(5)])
+        self.assertEqual(occurrences[0].resource_data, b"Note")
+
+    def test_export_and_import_map(self):
+        self.store.create_topic(self.map_identifier, Topic("test-topic", name="Test Topic"))
+        self.store.create_association(
+            self.map_identifier,
+            Association(identifier="association-1", src_topic_ref="home", dest_topic_ref="test-topic"),
+        )
+        data = bytes(range(256)) * 1000
+        self.store.create_occurrence(
+            self.map_identifier, Occurrence("occurrence-1", "image", "test-topic", resource_data=data)
+        )
+        self.store.create_occurrence(
+            self.map_identifier, Occurrence("note-1", "note", "test-topic", resource_data="Searchable note")
+        )
+        fp = io.StringIO()
+        self.store.export_map(self.map_identifier, fp, chunk_size=4096)
+
+        fp.seek(0)
+        map_identifier = self.store.import_map(fp, 2, batch_size=10)
+        self.assertNotEqual(map_identifier, self.map_identifier)
+        self.assertEqual(self.store.get_map(map_identifier).name, "Test Map")
+        self.assertEqual(self.store.get_topic(map_identifier, "test-topic").first_base_name.name, "Test Topic")
+        association = self.store.get_association(map_identifier, "association-1")
+        self.assertEqual(association.member.dest_topic_ref, "test-topic")
+        self.assertEqual(self.store.get_occurrence_data(map_identifier, "occurrence-1"), data)
+        self.assertEqual(self.store.get_topics_count(map_identifier), self.store.get_topics_count(self.map_identifier))
+        results = self.store.search_occurrences(map_identifier, "searchable")
+        self.assertEqual([result.occurrence.identifier for result in results], ["note-1"])
+
+    def test_import_invalid_map_export(self):
+        fp = io.StringIO()
+        self.store.export_map(self.map_identifier, fp)
+        fp.write('{"type": "unknown"}\n')
+        fp.seek(0)
+        with self.assertRaises(TopicDbError):
+            self.store.import_map(fp, 2)
+        self.assertEqual(self.store.get_maps(2), [])
+
+        # Resource data that doesn't add up to the declared size
+        self.store.create_occurrence(
+            self.map_identifier, Occurrence("occurrence-1", "image", "home", resource_data=bytes(10000))
+        )
+        fp = io.StringIO()
+        self.store.export_map(self.map_identifier, fp, chunk_size=4096)
+        lines = fp.getvalue().splitlines(keepends=True)
+        resource_data_lines = [index for index, line in enumerate(lines) if '"type":"resource_data"' in line]
+        truncated_exports = [
+            lines[: resource_data_lines[-1]],  # Ends in the middle of the resource data
+            [line for index, line in enumerate(lines) if index != resource_data_lines[0]],  # Misses a chunk
+        ]
+        for truncated_export in truncated_exports:
+            with self.assertRaises(TopicDbError):
+                self.store.import_map(io.StringIO("".join(truncated_export)), 2)
+            self.assertEqual(self.store.get_maps(2), [])
+
+    def test_failed_import_into_existing_map_is_undone(self):
+        fp = io.StringIO()
+        self.store.export_map(self.map_identifier, fp)
+        attribute_line = next(line for line in fp.getvalue().splitlines() if '"type":"attribute"' in line)
+        fp.write(attribute_line + "\n")  # A late collision
+        map_identifier = self.store.create_map(2, "Existing Map")
+
+        fp.seek(0)
+        with self.assertRaises(TopicDbError):
+            self.store.import_map(fp, 2, map_identifier=map_identifier, batch_size=1)
+        self.assertIsNotNone(self.store.get_map(map_identifier))
+        self.assertEqual(self.store.get_topics_count(map_identifier), 0)
+
+    def test_delete_topics_cascades(self):
+        self.store.create_topic(self.map_identifier, Topic("topic-1", name="Topic 1"))
+        self.store.create_topic(self.map_identifier, Topic("topic-2"))
+        self.store.create_association(
+            self.map_identifier,
+            Association(identifier="association-1", src_topic_ref="topic-1", dest_topic_ref="topic-2"),
+        )
+        self.store.create_occurrence(self.map_identifier, Occurrence("occurrence-1", "note", "topic-1"))
+        self.store.create_occurrence(self.map_identifier, Occurrence("occurrence-2", "note", "association-1"))
+
+        with self.assertRaises(TopicDbError):
+            self.store.delete_topics(self.map_identifier, ["topic-1", "home"])
+        self.assertTrue(self.store.topic_exists(self.map_identifier, "topic-1"))
+        with self.assertRaises(TopicDbError):
+            self.store.delete_topics(self.map_identifier, ["topic-1", "association-1"])
+
+        self.store.delete_topics(self.map_identifier, ["topic-1", "topic-2"])
+        connection = self.store._pool.reader()
+        for table, column in [
+            ("topic", "identifier"),
+            ("basename", "topic_identifier"),
+            ("member", "association_identifier"),
+            ("occurrence", "topic_identifier"),
+            ("attribute", "entity_identifier"),
+        ]:
+            count = connection.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE map_identifier = ? AND {column} IN (?, ?, ?, ?, ?)",
+                (self.map_identifier, "topic-1", "topic-2", "association-1", "occurrence-1", "occurrence-2"),
+            ).fetchone()[0]
+            self.assertEqual(count, 0, table)
+
+    def test_reader_connection_is_reused_per_thread(self):
+        connection = self.store._pool.reader()
+        self.assertIs(self.store._pool.reader(), connection)
+
+        connections = []
+        thread = threading.Thread(target=lambda: connections.append(self.store._pool.reader()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(connections[0], connection)
+
+    def test_reader_connection_is_closed_when_its_thread_ends(self):
+        connections = []
+        thread = threading.Thread(target=lambda: connections.append(self.store._pool.reader()))
+        thread.start()
+        thread.join()
+        gc.collect()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+
+    def test_pragmas_are_applied(self):
+        with TopicStore(self.database_path, pragmas={"cache_size": -4096}) as store:
+            record = store._pool.reader().execute("PRAGMA cache_size").fetchone()
+            self.assertEqual(record[0], -4096)
+
+    def test_pragma_profiles(self):
+        with TopicStore(self.database_path, profile="web") as store:
+            connection = store._pool.reader()
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(connection.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
+        with TopicStore(self.database_path, profile="web", pragmas={"busy_timeout": 1000}) as store:
+            self.assertEqual(store._pool.reader().execute("PRAGMA busy_timeout").fetchone()[0], 1000)
+        with TopicStore(self.database_path, profile="read-only") as store:
+            self.assertTrue(store.topic_exists(self.map_identifier, "home"))
+            with self.assertRaises(TopicDbError):
+                store.create_topic(self.map_identifier, Topic("test-topic"))
+        with self.assertRaises(TopicDbError):
+            TopicStore(self.database_path, profile="unknown")
+
+    def test_closed_store(self):
+        with TopicStore(self.database_path) as store:
+            self.assertTrue(store.topic_exists(self.map_identifier, "home"))
+        with self.assertRaises(TopicDbError):
+            store.topic_exists(self.map_identifier, "home")
+
+
+if __name__ == "__main__":
+    unittest.main()